@@ -7,7 +7,7 @@ from app.domain.exceptions.auth_exceptions import (
     InvalidCredentialsError,
     InactiveUserError,
 )
-from app.shared.services.password_service import verify_password
+from app.shared.services.password_service import verify_password_async
 from app.shared.services.jwt_service import create_access_token
 
 
@@ -40,6 +40,7 @@ class LoginUserUseCase:
         Raises:
             InvalidCredentialsError: Invalid email or password
             InactiveUserError: User account is inactive
+            PasswordPoolSaturatedError: Too many password checks in progress
         """
         # 1. Normalize email
         email = email.lower().strip()
@@ -49,8 +50,8 @@ class LoginUserUseCase:
         if user is None:
             raise InvalidCredentialsError("Invalid email or password")
         
-        # 3. Verify password
-        if not verify_password(password, user.password_hash):
+        # 3. Verify password (off the event loop)
+        if not await verify_password_async(password, user.password_hash):
             raise InvalidCredentialsError("Invalid email or password")
         
         # 4. Check user is active
@@ -5,7 +5,7 @@ from app.domain.entities.subscription import Subscription, PlanType, Subscriptio
 from app.domain.repositories.user_repository import IUserRepository
 from app.domain.repositories.subscription_repository import ISubscriptionRepository
 from app.domain.exceptions.auth_exceptions import EmailAlreadyExistsError
-from app.shared.services.password_service import hash_password
+from app.shared.services.password_service import hash_password_async
 
 
 class RegisterUserUseCase:
@@ -43,6 +43,7 @@ class RegisterUserUseCase:
         
         Raises:
             ValueError: If password doesn't meet requirements
+            PasswordPoolSaturatedError: Too many password operations in progress
         """
         if len(password) < 8:
             raise ValueError("Password must be at least 8 characters")
@@ -71,6 +72,7 @@ class RegisterUserUseCase:
         Raises:
             EmailAlreadyExistsError: If email already registered
             ValueError: If password doesn't meet requirements
+            PasswordPoolSaturatedError: Too many password operations in progress
         """
         # 1. Validate password strength
         self._validate_password(password)
@@ -82,8 +84,8 @@ class RegisterUserUseCase:
         if await self.user_repo.exists_email(email):
             raise EmailAlreadyExistsError(f"Email {email} already registered")
         
-        # 4. Hash password
-        password_hash = hash_password(password)
+        # 4. Hash password (off the event loop)
+        password_hash = await hash_password_async(password)
         
         # 5. Create user entity
         user = User.create(
@@ -2,7 +2,7 @@
 
 from typing import Optional
 from app.domain.entities.design import Design
-from app.domain.entities.subscription import Subscription
+from app.domain.entities.subscription import PLAN_LIMITS
 from app.domain.repositories.design_repository import IDesignRepository
 from app.domain.repositories.subscription_repository import ISubscriptionRepository
 from app.domain.exceptions.subscription_exceptions import (
@@ -17,11 +17,11 @@ class CreateDesignUseCase:
     Use case: Create design.
     
     Business Rules:
-    1. Check user has active subscription
-    2. Check user hasn't exceeded quota
-    3. Create design entity
-    4. Increment subscription usage counter
-    5. Queue render job (TODO: implement later)
+    1. Reserve one design from the quota: subscription must be active and
+       under its plan limit (checked and incremented atomically)
+    2. Create and validate design entity
+    3. Persist design (same transaction as the reservation)
+    4. Queue render job
     """
     
     def __init__(
@@ -56,39 +56,27 @@ class CreateDesignUseCase:
             InactiveSubscriptionError: Subscription is not active
             QuotaExceededError: User exceeded design quota
         """
-        # 1. Get user subscription
-        subscription = await self.subscription_repo.get_by_user(user_id)
+        # 1. Reserve quota atomically (active + under limit, one UPDATE).
+        #    Same transaction as the design insert: an error below rolls
+        #    the reservation back with it.
+        subscription = await self.subscription_repo.reserve_design_quota(user_id)
         if subscription is None:
-            raise SubscriptionNotFoundError(f"User {user_id} has no subscription")
-        
-        # 2. Check subscription is active
-        if not subscription.is_active():
-            raise InactiveSubscriptionError("Subscription is not active")
-        
-        # 3. Check quota available
-        if not subscription.has_quota():
-            raise QuotaExceededError(
-                f"Design quota exceeded ({subscription.designs_this_month}/{subscription.designs_limit})"
-            )
+            await self._raise_reservation_error(user_id)
         
-        # 4. Create design entity
+        # 2. Create design entity
         design = Design.create(
             user_id=user_id,
             product_type=product_type,
             design_data=design_data
         )
         
-        # 5. Validate design data
+        # 3. Validate design data
         design.validate()
         
-        # 6. Persist design
+        # 4. Persist design
         created_design = await self.design_repo.create(design)
         
-        # 7. Increment subscription usage
-        subscription.increment_usage()
-        await self.subscription_repo.update(subscription)
-        
-        # 8. Queue render job (Celery task) with explicit queue
+        # 5. Queue render job (Celery task) with explicit queue
         from app.infrastructure.workers.tasks.render_design import render_design_preview       
         task = render_design_preview.apply_async(
             args=[created_design.id],
@@ -96,8 +84,27 @@ class CreateDesignUseCase:
             routing_key='high_priority'
         )
 
-        # Opcional: guardar task_id
+        # Opcional: guardar task_id (not persisted, no write needed)
         created_design.render_task_id = task.id
-        await self.design_repo.update(created_design)
 
         return created_design
+    
+    async def _raise_reservation_error(self, user_id: str) -> None:
+        """
+        Explain a failed quota reservation (only runs on the rejection path).
+        
+        Raises:
+            SubscriptionNotFoundError: User has no subscription
+            InactiveSubscriptionError: Subscription is not active
+            QuotaExceededError: Monthly quota used up
+        """
+        subscription = await self.subscription_repo.get_by_user(user_id)
+        if subscription is None:
+            raise SubscriptionNotFoundError(f"User {user_id} has no subscription")
+        
+        if not subscription.is_active():
+            raise InactiveSubscriptionError("Subscription is not active")
+        
+        raise QuotaExceededError(
+            f"Design quota exceeded ({subscription.designs_this_month}/{PLAN_LIMITS[subscription.plan]})"
+        )
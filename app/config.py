@@ -5,7 +5,7 @@ Loads configuration from environment variables and .env file.
 """
 
 import json
-from typing import List, Union
+from typing import Dict, List, Union
 from pydantic import Field, PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -42,12 +42,29 @@ class Settings(BaseSettings):
         default="redis://localhost:6379/0",
         description="Redis connection string"
     )
+    RATE_LIMIT_REDIS_POOL_SIZE: int = 50  # Pooled async connections per API process
+    RATE_LIMIT_REDIS_TIMEOUT: float = 1.0  # Seconds; on timeout the local bucket decides
+    RATE_LIMIT_REDIS_RETRY_INTERVAL: float = 5.0  # Seconds checks stay local after a Redis error
+    # "redis": every check in Redis; "hybrid": local token buckets synced in batches
+    RATE_LIMIT_MODE: str = Field(default="redis", pattern="^(redis|hybrid)$")
+    RATE_LIMIT_SYNC_INTERVAL: float = 1.0  # Seconds between batched reports (hybrid)
+    RATE_LIMIT_LOCAL_ERROR: float = 0.1  # Unreported share of a limit per process (hybrid)
+    RATE_LIMIT_LOCAL_KEYS: int = 100000  # Max local buckets per process
     
     # JWT
     JWT_SECRET_KEY: str = Field(..., min_length=32)
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
     JWT_REFRESH_TOKEN_EXPIRE_MINUTES: int = 43200  # 30 days
+    # Password hashing pool (bcrypt off the event loop)
+    PASSWORD_HASH_WORKERS: int = 4  # Threads per API process (bcrypt releases the GIL)
+    PASSWORD_HASH_QUEUE_SIZE: int = 32  # Waiting operations before 503
+    PASSWORD_HASH_RETRY_AFTER: int = 1  # Retry-After seconds on 503
+    # Authenticated user cache (get_current_user)
+    AUTH_USER_CACHE_TTL: int = 30  # Seconds; bounds how long a deactivated user stays logged in (0 = off)
+    AUTH_USER_CACHE_SIZE: int = 10000  # Max users cached per API process
+    AUTH_USER_REDIS_CACHE: bool = False  # Share cached users across processes via Redis
+    API_METRICS_PORT: int = 0  # API Prometheus /metrics port, internal only (0 = disabled)
     
     # AWS
     AWS_REGION: str = "us-east-1"
@@ -58,9 +75,42 @@ class Settings(BaseSettings):
     
     # CloudFront (optional)
     CLOUDFRONT_DOMAIN: str = Field(default="")  # e.g., "d123.cloudfront.net"
+    S3_MAX_POOL_CONNECTIONS: int = 10  # Per-process HTTP connections (keep >= STORAGE_IO_WORKERS)
+    S3_MAX_ATTEMPTS: int = 3  # botocore retries.max_attempts ("standard" mode, excludes first try)
+    S3_CONNECT_TIMEOUT: float = 5.0
+    S3_READ_TIMEOUT: float = 30.0
+    S3_MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # Bytes per part for streamed uploads (min 5 MiB)
     
     # Storage
     USE_LOCAL_STORAGE: bool = Field(default=True)  # True for dev, False for prod
+    STORAGE_IO_WORKERS: int = 4  # Per-process threads for concurrent uploads/HEADs
+    # Pre-signed asset URLs (S3_PUBLIC_BUCKET=false)
+    SIGNED_URL_EXPIRATION: int = 3600  # Signature lifetime in seconds
+    SIGNED_URL_SAFETY_MARGIN: int = 300  # Min validity left on any cached URL handed out
+    SIGNED_URL_CACHE_SIZE: int = 10000  # Max URLs cached per API process
+    SIGNED_URL_REDIS_CACHE: bool = False  # Share signed URLs across processes via Redis
+    
+    # Rendering
+    FONTS_DIR: str = Field(default="./assets/fonts")  # One <font-name>.ttf per whitelisted font
+    FONT_CACHE_SIZE: int = 128  # Max (font, size) FreeType objects kept per worker process
+    # Output variants derived from one raster (JSON list in env). Must include "preview".
+    RENDER_VARIANTS: List[dict] = [
+        {"name": "preview", "size": 600, "format": "png"},
+        {"name": "thumbnail", "size": 200, "format": "png"},
+    ]
+    # Print output (tiled, streamed): product type -> [width, height] in inches
+    PRINT_SIZES: Dict[str, List[float]] = {"poster": [18, 24]}
+    PRINT_DPI: int = 300
+    PRINT_TILE_HEIGHT: int = 256  # Rows per strip (bounds worker memory)
+    PRINT_COMPRESS_LEVEL: int = 6
+    # Orphan asset GC (deleted/failed designs), runs on Celery beat
+    ASSET_GC_INTERVAL_SECONDS: int = 3600
+    ASSET_GC_GRACE_SECONDS: int = 3600  # Skip designs updated more recently (render retries)
+    ASSET_GC_PAGE_SIZE: int = 500  # Designs per keyset page
+    ASSET_GC_MAX_DESIGNS_PER_RUN: int = 10000  # Throughput cap per run
+    WORKER_WARMUP_DB_CONNECTIONS: int = 2  # DB connections opened per worker child at startup
+    WORKER_METRICS_PORT: int = 0  # Worker Prometheus /metrics port (0 = disabled)
+    RENDER_BATCH_SIZE: int = 50  # Designs per render_design_previews_batch task
     
     # OpenAI
     OPENAI_API_KEY: str = Field(default="")
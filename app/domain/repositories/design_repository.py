@@ -5,6 +5,7 @@ Defines contract for design persistence operations.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Optional, List, Tuple
 from app.domain.entities.design import Design, DesignStatus
 
@@ -64,6 +65,31 @@ class IDesignRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def list_by_user(
+        self,
+        user_id: str,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, str]] = None,
+        status: Optional[DesignStatus] = None
+    ) -> List[Design]:
+        """
+        Get a page of user's designs by keyset (newest first, no count).
+        
+        Ordered by (created_at, id) DESC, so each page costs the same
+        regardless of how deep it is.
+        
+        Args:
+            user_id: User unique identifier
+            limit: Maximum number of records to return
+            after: (created_at, id) of the last design of the previous page
+            status: Filter by design status (optional)
+            
+        Returns:
+            List of designs
+        """
+        pass
+    
     @abstractmethod
     async def update(self, design: Design) -> Design:
         """
@@ -1,7 +1,28 @@
 """Storage repository interface (Domain layer)."""
 
 from abc import ABC, abstractmethod
-from typing import BinaryIO
+from concurrent.futures import Future
+from typing import BinaryIO, ContextManager, List, Protocol
+
+
+class AssetWriter(Protocol):
+    """
+    Write-only binary stream yielded by open_asset_writer.
+    
+    Implemented by temp files, in-memory buffers and S3 multipart writers.
+    """
+    
+    def write(self, data: bytes) -> int:
+        """
+        Append data to the asset.
+        
+        Args:
+            data: Bytes to append
+        
+        Returns:
+            int: Number of bytes written
+        """
+        ...
 
 
 class IStorageRepository(ABC):
@@ -54,6 +75,133 @@ class IStorageRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def upload_asset(
+        self,
+        key: str,
+        data: BinaryIO,
+        content_type: str = "image/png"
+    ) -> str:
+        """
+        Upload asset under an explicit storage key.
+        
+        Used for content-addressed render outputs (renders/{fingerprint}/...)
+        that are shared by every design with the same fingerprint.
+        
+        Args:
+            key: Storage key (path/to/file.png)
+            data: File-like object (bytes)
+            content_type: MIME type (default: image/png)
+        
+        Returns:
+            str: Public URL of uploaded asset
+        
+        Raises:
+            Exception: If upload fails
+        """
+        pass
+    
+    @abstractmethod
+    def upload_asset_async(
+        self,
+        key: str,
+        data: BinaryIO,
+        content_type: str = "image/png"
+    ) -> "Future[str]":
+        """
+        Start uploading an asset in the background (see upload_asset).
+        
+        Lets callers keep encoding while earlier uploads are in flight.
+        
+        Args:
+            key: Storage key (path/to/file.png)
+            data: File-like object (bytes), must not be reused until done
+            content_type: MIME type (default: image/png)
+        
+        Returns:
+            Future resolving to the public URL (raises if upload fails)
+        """
+        pass
+    
+    @abstractmethod
+    def open_asset_writer(
+        self,
+        key: str,
+        content_type: str = "image/png"
+    ) -> ContextManager[AssetWriter]:
+        """
+        Open a writable stream for an asset too large to buffer in memory.
+        
+        The asset becomes visible under `key` only if the block exits
+        without error; on error the partial upload is discarded.
+        
+        Args:
+            key: Storage key (path/to/file.png)
+            content_type: MIME type (default: image/png)
+        
+        Returns:
+            Context manager yielding an AssetWriter
+        
+        Example:
+            >>> with storage.open_asset_writer(key) as stream:
+            >>>     stream.write(chunk)
+        """
+        pass
+    
+    @abstractmethod
+    def asset_exists(self, key: str) -> bool:
+        """
+        Check if an asset exists under a storage key.
+        
+        Args:
+            key: Storage key
+        
+        Returns:
+            bool: True if asset exists
+        """
+        pass
+    
+    @abstractmethod
+    def get_asset_url(self, key: str) -> str:
+        """
+        Get public URL for a storage key (no existence check).
+        
+        Args:
+            key: Storage key
+        
+        Returns:
+            str: Public URL
+        """
+        pass
+    
+    @abstractmethod
+    def list_assets(self, prefix: str) -> List[str]:
+        """
+        List storage keys starting with a prefix.
+        
+        Args:
+            prefix: Key prefix (e.g. renders/{fingerprint}/)
+        
+        Returns:
+            Matching storage keys
+        """
+        pass
+    
+    @abstractmethod
+    def delete_assets(self, keys: List[str]) -> int:
+        """
+        Delete many assets in as few requests as possible.
+        
+        Missing keys are not an error.
+        
+        Args:
+            keys: Storage keys
+        
+        Returns:
+            int: Number of keys deleted
+        """
+        pass
+    
     @abstractmethod
     def delete_design_assets(self, design_id: str) -> bool:
         """
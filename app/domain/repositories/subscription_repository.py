@@ -91,6 +91,25 @@ class ISubscriptionRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def reserve_design_quota(self, user_id: str) -> Optional[Subscription]:
+        """
+        Atomically reserve one design from the user's monthly quota.
+        
+        Increments designs_this_month only if the subscription is active
+        and under its plan limit (check and increment in one statement,
+        so concurrent requests can't overshoot the limit). Runs in the
+        caller's transaction: rolling back releases the reservation.
+        
+        Args:
+            user_id: User unique identifier
+            
+        Returns:
+            Updated subscription if reserved, None if the user has no
+            subscription, it is not active, or its quota is used up
+        """
+        pass
+    
     @abstractmethod
     async def delete(self, subscription_id: str) -> bool:
         """
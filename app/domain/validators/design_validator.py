@@ -9,6 +9,16 @@ from typing import Protocol
 import re
 
 
+# Fonts available to every product type (the render worker ships a file for each)
+ALLOWED_FONTS = (
+    'Bebas-Bold',
+    'Montserrat-Regular',
+    'Montserrat-Bold',
+    'Pacifico-Regular',
+    'Roboto-Regular',
+)
+
+
 class DesignValidator(Protocol):
     """
     Protocol (interface) for design validators.
@@ -83,21 +93,13 @@ class TShirtValidator:
     
     def _validate_font(self, font: str) -> None:
         """Validate font name."""
-        allowed_fonts = [
-            'Bebas-Bold',
-            'Montserrat-Regular',
-            'Montserrat-Bold',
-            'Pacifico-Regular',
-            'Roboto-Regular',
-        ]
-        
         if not font:
             raise ValueError("Font is required")
         
-        if font not in allowed_fonts:
+        if font not in ALLOWED_FONTS:
             raise ValueError(
                 f"Invalid font: {font}. "
-                f"Allowed fonts: {', '.join(allowed_fonts)}"
+                f"Allowed fonts: {', '.join(ALLOWED_FONTS)}"
             )
     
     def _validate_font_size(self, font_size: int, min_size: int, max_size: int) -> None:
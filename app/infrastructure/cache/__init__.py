@@ -0,0 +1,8 @@
+"""Cache module - Process-local and Redis-backed caches."""
+
+from app.infrastructure.cache.user_cache import UserCache, get_user_cache
+
+__all__ = [
+    "get_user_cache",
+    "UserCache",
+]
@@ -0,0 +1,237 @@
+"""
+TTL cache of authenticated users for get_current_user.
+
+Every authenticated request resolves its JWT subject to a User; without a
+cache that is one SELECT per API call. Users are cached by ID for
+AUTH_USER_CACHE_TTL seconds in a per-process LRU, with an optional Redis
+tier shared by every API process (AUTH_USER_REDIS_CACHE=true).
+
+UserRepositoryImpl.update/delete invalidate the user in this process and
+in Redis, before and again after the commit (a request racing the write
+may re-cache the old row in between). Other processes' in-process entries
+are not notified and expire with the TTL, which is therefore the upper
+bound on how long a deactivated account keeps working: keep it short.
+
+The Redis tier stores the full user row, password hash included (the
+entity is returned as-is to endpoints); only enable it on a private Redis.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.domain.entities.user import User
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "auth_user"
+
+USER_CACHE_LOOKUPS = Counter(
+    "customify_auth_user_cache_lookups_total",
+    "Authenticated user cache lookups by result",
+    ["result"],  # local_hit, redis_hit, miss
+)
+
+_DATETIME_FIELDS = ("created_at", "updated_at", "last_login")
+
+
+class UserCache:
+    """
+    Two-tier TTL cache of User entities keyed by user ID.
+
+    Callers get copies, so mutating a returned user never changes the
+    cached one. Hit/miss counts are kept per instance (see stats) and
+    exported to Prometheus.
+    """
+
+    def __init__(
+        self,
+        ttl: int = settings.AUTH_USER_CACHE_TTL,
+        max_entries: int = settings.AUTH_USER_CACHE_SIZE,
+        redis: Optional[Redis] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds a user stays cached (0 = caching disabled)
+            max_entries: Max users kept in the in-process tier
+            redis: Async Redis client for the shared tier (None = in-process only)
+            clock: Monotonic time source for in-process expiry
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.redis = redis
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, User]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"local_hit": 0, "redis_hit": 0, "miss": 0}
+
+    async def get(self, user_id: str) -> Optional[User]:
+        """
+        Get a cached user.
+
+        Args:
+            user_id: User unique identifier
+
+        Returns:
+            Copy of the cached user, or None on a miss (or when disabled)
+        """
+        if self.ttl <= 0:
+            return None
+
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] <= now:
+                del self._entries[user_id]
+                entry = None
+            elif entry is not None:
+                self._entries.move_to_end(user_id)
+
+        if entry is not None:
+            self._count("local_hit")
+            return replace(entry[1])
+
+        user = await self._redis_get(user_id)
+        if user is None:
+            self._count("miss")
+            return None
+
+        self._count("redis_hit")
+        self._store_local(user)
+        return replace(user)
+
+    async def set(self, user: User) -> None:
+        """
+        Cache a user loaded from the database.
+
+        Args:
+            user: User entity
+        """
+        if self.ttl <= 0:
+            return
+
+        self._store_local(replace(user))
+        await self._redis_set(user)
+
+    async def invalidate(self, user_id: str) -> None:
+        """
+        Drop a user from this process and from Redis.
+
+        Args:
+            user_id: User unique identifier
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+        if self.redis is None:
+            return
+
+        try:
+            await self.redis.delete(self._redis_key(user_id))
+        except RedisError as e:
+            logger.warning(f"Auth user cache invalidation failed: {e}", extra={
+                "user_id": user_id,
+            })
+
+    def clear(self) -> None:
+        """Drop every in-process entry (the Redis tier is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get lookup counts of this instance.
+
+        Returns:
+            dict with local_hit, redis_hit, miss and hit_rate (0-1)
+        """
+        with self._lock:
+            counts = dict(self._counts)
+        lookups = sum(counts.values())
+        hits = counts["local_hit"] + counts["redis_hit"]
+        return {**counts, "hit_rate": hits / lookups if lookups else 0.0}
+
+    def _count(self, result: str) -> None:
+        """Record one lookup result."""
+        with self._lock:
+            self._counts[result] += 1
+        USER_CACHE_LOOKUPS.labels(result=result).inc()
+
+    def _store_local(self, user: User) -> None:
+        """Put a user in the in-process LRU with a fresh TTL."""
+        with self._lock:
+            self._entries[user.id] = (self.clock() + self.ttl, user)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    @staticmethod
+    def _redis_key(user_id: str) -> str:
+        """Build shared-tier key."""
+        return f"{REDIS_KEY_PREFIX}:{user_id}"
+
+    async def _redis_get(self, user_id: str) -> Optional[User]:
+        """Look up a user in the shared tier (None if disabled, missing or down)."""
+        if self.redis is None:
+            return None
+
+        try:
+            raw = await self.redis.get(self._redis_key(user_id))
+        except RedisError as e:
+            logger.warning(f"Auth user cache lookup failed, using database: {e}")
+            return None
+
+        return _loads(raw) if raw is not None else None
+
+    async def _redis_set(self, user: User) -> None:
+        """Store a user in the shared tier (best effort)."""
+        if self.redis is None:
+            return
+
+        try:
+            await self.redis.set(self._redis_key(user.id), _dumps(user), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Auth user cache store failed: {e}")
+
+
+def _dumps(user: User) -> str:
+    """Serialize a user for the shared tier."""
+    return json.dumps(asdict(user), default=lambda value: value.isoformat())
+
+
+def _loads(raw) -> User:
+    """Deserialize a user stored by _dumps."""
+    data = json.loads(raw)
+    for name in _DATETIME_FIELDS:
+        if data[name] is not None:
+            data[name] = datetime.fromisoformat(data[name])
+    return User(**data)
+
+
+@lru_cache(maxsize=None)
+def get_user_cache() -> UserCache:
+    """
+    Get the authenticated user cache (cached, one per process).
+
+    Returns:
+        UserCache, with the Redis tier if AUTH_USER_REDIS_CACHE is set
+    """
+    redis = None
+    if settings.AUTH_USER_REDIS_CACHE:
+        redis = Redis.from_url(str(settings.REDIS_URL), socket_timeout=1)
+
+    return UserCache(redis=redis)
@@ -5,16 +5,21 @@ Handles JSONB design_data field and enum types.
 """
 
 import json
+from typing import Optional, Union
+
+from sqlalchemy import Row
+
 from app.domain.entities.design import Design, DesignStatus
 from app.infrastructure.database.models.design_model import DesignModel
 
 
-def to_entity(model: DesignModel) -> Design:
+def to_entity(model: Union[DesignModel, Row]) -> Design:
     """
     Convert DesignModel (SQLAlchemy) to Design entity (Domain).
     
     Args:
-        model: SQLAlchemy DesignModel instance
+        model: SQLAlchemy DesignModel instance, or a row with the
+            same columns (RETURNING or column projection)
         
     Returns:
         Domain Design entity
@@ -43,7 +48,7 @@ def to_entity(model: DesignModel) -> Design:
     )
 
 
-def to_model(entity: Design, model: DesignModel = None) -> DesignModel:
+def to_model(entity: Design, model: Optional[DesignModel] = None) -> DesignModel:
     """
     Convert Design entity (Domain) to DesignModel (SQLAlchemy).
     
@@ -60,15 +65,31 @@ def to_model(entity: Design, model: DesignModel = None) -> DesignModel:
     if model is None:
         model = DesignModel()
     
-    model.id = entity.id
-    model.user_id = entity.user_id
-    model.product_type = entity.product_type
-    model.design_data = entity.design_data  # dict -> JSONB (automatic)
-    model.status = entity.status.value  # Convert enum to string
-    model.preview_url = entity.preview_url
-    model.thumbnail_url = entity.thumbnail_url
-    model.is_deleted = entity.is_deleted
-    model.created_at = entity.created_at
-    model.updated_at = entity.updated_at
+    for column, value in to_values(entity).items():
+        setattr(model, column, value)
     
     return model
+
+
+def to_values(entity: Design) -> dict:
+    """
+    Convert Design entity (Domain) to column values for INSERT/UPDATE statements.
+    
+    Args:
+        entity: Domain Design entity
+        
+    Returns:
+        dict of column name -> value
+    """
+    return {
+        "id": entity.id,
+        "user_id": entity.user_id,
+        "product_type": entity.product_type,
+        "design_data": entity.design_data,  # dict -> JSONB (automatic)
+        "status": entity.status.value,  # Convert enum to string
+        "preview_url": entity.preview_url,
+        "thumbnail_url": entity.thumbnail_url,
+        "is_deleted": entity.is_deleted,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
@@ -4,16 +4,21 @@ Subscription converter - Convert between SubscriptionModel and Subscription enti
 Handles conversion including enum types (PlanType, SubscriptionStatus).
 """
 
+from typing import Optional, Union
+
+from sqlalchemy import Row
+
 from app.domain.entities.subscription import Subscription, PlanType, SubscriptionStatus
 from app.infrastructure.database.models.subscription_model import SubscriptionModel
 
 
-def to_entity(model: SubscriptionModel) -> Subscription:
+def to_entity(model: Union[SubscriptionModel, Row]) -> Subscription:
     """
     Convert SubscriptionModel (SQLAlchemy) to Subscription entity (Domain).
     
     Args:
-        model: SQLAlchemy SubscriptionModel instance
+        model: SQLAlchemy SubscriptionModel instance, or a row with the
+            same columns (RETURNING or column projection)
         
     Returns:
         Domain Subscription entity
@@ -33,7 +38,7 @@ def to_entity(model: SubscriptionModel) -> Subscription:
     )
 
 
-def to_model(entity: Subscription, model: SubscriptionModel = None) -> SubscriptionModel:
+def to_model(entity: Subscription, model: Optional[SubscriptionModel] = None) -> SubscriptionModel:
     """
     Convert Subscription entity (Domain) to SubscriptionModel (SQLAlchemy).
     
@@ -47,16 +52,32 @@ def to_model(entity: Subscription, model: SubscriptionModel = None) -> Subscript
     if model is None:
         model = SubscriptionModel()
     
-    model.id = entity.id
-    model.user_id = entity.user_id
-    model.plan = entity.plan.value  # Convert enum to string
-    model.status = entity.status.value  # Convert enum to string
-    model.stripe_customer_id = entity.stripe_customer_id
-    model.stripe_subscription_id = entity.stripe_subscription_id
-    model.current_period_start = entity.current_period_start
-    model.current_period_end = entity.current_period_end
-    model.designs_this_month = entity.designs_this_month
-    model.created_at = entity.created_at
-    model.updated_at = entity.updated_at
+    for column, value in to_values(entity).items():
+        setattr(model, column, value)
     
     return model
+
+
+def to_values(entity: Subscription) -> dict:
+    """
+    Convert Subscription entity (Domain) to column values for INSERT/UPDATE statements.
+    
+    Args:
+        entity: Domain Subscription entity
+        
+    Returns:
+        dict of column name -> value
+    """
+    return {
+        "id": entity.id,
+        "user_id": entity.user_id,
+        "plan": entity.plan.value,  # Convert enum to string
+        "status": entity.status.value,  # Convert enum to string
+        "stripe_customer_id": entity.stripe_customer_id,
+        "stripe_subscription_id": entity.stripe_subscription_id,
+        "current_period_start": entity.current_period_start,
+        "current_period_end": entity.current_period_end,
+        "designs_this_month": entity.designs_this_month,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+    }
@@ -4,16 +4,21 @@ User converter - Convert between UserModel (SQLAlchemy) and User entity (Domain)
 This keeps the domain layer clean from ORM dependencies.
 """
 
+from typing import Optional, Union
+
+from sqlalchemy import Row
+
 from app.domain.entities.user import User
 from app.infrastructure.database.models.user_model import UserModel
 
 
-def to_entity(model: UserModel) -> User:
+def to_entity(model: Union[UserModel, Row]) -> User:
     """
     Convert UserModel (SQLAlchemy) to User entity (Domain).
     
     Args:
-        model: SQLAlchemy UserModel instance
+        model: SQLAlchemy UserModel instance, or a row with the
+            same columns (RETURNING or column projection)
         
     Returns:
         Domain User entity
@@ -39,7 +44,7 @@ def to_entity(model: UserModel) -> User:
     )
 
 
-def to_model(entity: User, model: UserModel = None) -> UserModel:
+def to_model(entity: User, model: Optional[UserModel] = None) -> UserModel:
     """
     Convert User entity (Domain) to UserModel (SQLAlchemy).
     
@@ -67,16 +72,32 @@ def to_model(entity: User, model: UserModel = None) -> UserModel:
     if model is None:
         model = UserModel()
     
-    model.id = entity.id
-    model.email = entity.email
-    model.password_hash = entity.password_hash
-    model.full_name = entity.full_name
-    model.avatar_url = entity.avatar_url
-    model.is_active = entity.is_active
-    model.is_verified = entity.is_verified
-    model.is_deleted = entity.is_deleted
-    model.created_at = entity.created_at
-    model.updated_at = entity.updated_at
-    model.last_login = entity.last_login
+    for column, value in to_values(entity).items():
+        setattr(model, column, value)
     
     return model
+
+
+def to_values(entity: User) -> dict:
+    """
+    Convert User entity (Domain) to column values for INSERT/UPDATE statements.
+    
+    Args:
+        entity: Domain User entity
+        
+    Returns:
+        dict of column name -> value
+    """
+    return {
+        "id": entity.id,
+        "email": entity.email,
+        "password_hash": entity.password_hash,
+        "full_name": entity.full_name,
+        "avatar_url": entity.avatar_url,
+        "is_active": entity.is_active,
+        "is_verified": entity.is_verified,
+        "is_deleted": entity.is_deleted,
+        "created_at": entity.created_at,
+        "updated_at": entity.updated_at,
+        "last_login": entity.last_login,
+    }
@@ -4,10 +4,12 @@ Design repository implementation (Infrastructure layer).
 Implements IDesignRepository using SQLAlchemy 2.0 async.
 """
 
-from typing import Optional, List, Tuple
-from sqlalchemy import select, update, func
+from datetime import datetime
+from typing import Optional, List, Sequence, Tuple
+from sqlalchemy import Select, select, insert, update, func, and_, or_
+from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import lazyload, selectinload
 
 from app.domain.entities.design import Design, DesignStatus
 from app.domain.repositories.design_repository import IDesignRepository
@@ -20,6 +22,10 @@ class DesignRepositoryImpl(IDesignRepository):
     Design repository implementation using SQLAlchemy.
     
     Handles design persistence, queries, and pagination.
+    
+    Reads select only the designs columns and map rows straight to
+    entities: no ORM objects, no selectin relationship loads. Pass
+    relationships=(...) to load full models with just those relationships.
     """
     
     def __init__(self, session: AsyncSession):
@@ -41,60 +47,61 @@ class DesignRepositoryImpl(IDesignRepository):
         Returns:
             Created design entity
         """
-        model = design_converter.to_model(design)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return design_converter.to_entity(model)
+        stmt = (
+            insert(DesignModel)
+            .values(**design_converter.to_values(design))
+            .returning(*DesignModel.__table__.columns)
+        )
+        result = await self.session.execute(stmt)
+        return design_converter.to_entity(result.one())
     
-    async def get_by_id(self, design_id: str) -> Optional[Design]:
+    async def get_by_id(
+        self,
+        design_id: str,
+        relationships: Sequence[str] = ()
+    ) -> Optional[Design]:
         """
         Get design by ID.
         
         Args:
             design_id: Design unique identifier
+            relationships: DesignModel relationships to load (default: none)
             
         Returns:
             Design entity if found, None otherwise
         """
-        stmt = select(DesignModel).where(
+        stmt = self._select(relationships).where(
             DesignModel.id == design_id,
             DesignModel.is_deleted == False  # Exclude soft-deleted designs
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return design_converter.to_entity(model) if model else None
+        rows = self._rows(result, relationships)
+        return design_converter.to_entity(rows[0]) if rows else None
     
     async def get_by_user(
         self, 
         user_id: str,
         skip: int = 0,
         limit: int = 100,
-        status: Optional[DesignStatus] = None
+        status: Optional[DesignStatus] = None,
+        relationships: Sequence[str] = ()
     ) -> Tuple[List[Design], int]:
         """
-        Get user's designs with pagination (optimized, no N+1).
+        Get user's designs with pagination (column projection, no N+1).
         
         Args:
             user_id: User unique identifier
             skip: Number of records to skip (pagination)
             limit: Maximum number of records to return
             status: Filter by design status (optional)
+            relationships: DesignModel relationships to load (default: none)
             
         Returns:
             Tuple of (list of design entities, total count)
         """
-        # Build base query with eager loading to prevent N+1
-        stmt = (
-            select(DesignModel)
-            .options(
-                selectinload(DesignModel.user),  # Eager load relationships
-                # selectinload(DesignModel.orders) if needed
-            )
-            .where(
-                DesignModel.user_id == user_id,
-                DesignModel.is_deleted == False
-            )
+        stmt = self._select(relationships).where(
+            DesignModel.user_id == user_id,
+            DesignModel.is_deleted == False
         )
         
         # Add status filter if provided
@@ -110,7 +117,7 @@ class DesignRepositoryImpl(IDesignRepository):
         )
         
         result = await self.session.execute(stmt)
-        models = result.scalars().all()
+        rows = self._rows(result, relationships)
         
         # Separate count query for performance
         count_stmt = (
@@ -125,15 +132,67 @@ class DesignRepositoryImpl(IDesignRepository):
             count_stmt = count_stmt.where(DesignModel.status == status.value)
         
         count_result = await self.session.execute(count_stmt)
-        total = count_result.scalar()
+        total = count_result.scalar_one()
         
-        designs = [design_converter.to_entity(model) for model in models]
+        designs = [design_converter.to_entity(row) for row in rows]
         
         return designs, total
     
+    async def list_by_user(
+        self,
+        user_id: str,
+        limit: int = 20,
+        after: Optional[Tuple[datetime, str]] = None,
+        status: Optional[DesignStatus] = None,
+        relationships: Sequence[str] = ()
+    ) -> List[Design]:
+        """
+        Get a page of user's designs by keyset (newest first, no count).
+        
+        Seeks into ix_designs_user_created (user_id, created_at) instead
+        of scanning OFFSET rows; id breaks created_at ties.
+        
+        Args:
+            user_id: User unique identifier
+            limit: Maximum number of records to return
+            after: (created_at, id) of the last design of the previous page
+            status: Filter by design status (optional)
+            relationships: DesignModel relationships to load (default: none)
+            
+        Returns:
+            List of design entities
+        """
+        stmt = self._select(relationships).where(
+            DesignModel.user_id == user_id,
+            DesignModel.is_deleted.is_(False)
+        )
+        
+        if status is not None:
+            stmt = stmt.where(DesignModel.status == status.value)
+        
+        if after is not None:
+            created_at, design_id = after
+            # (created_at, id) < after, with a created_at bound the index can seek on
+            stmt = stmt.where(
+                DesignModel.created_at <= created_at,
+                or_(
+                    DesignModel.created_at < created_at,
+                    and_(DesignModel.created_at == created_at, DesignModel.id < design_id)
+                )
+            )
+        
+        stmt = (
+            stmt
+            .order_by(DesignModel.created_at.desc(), DesignModel.id.desc())
+            .limit(limit)
+        )
+        
+        result = await self.session.execute(stmt)
+        return [design_converter.to_entity(row) for row in self._rows(result, relationships)]
+    
     async def update(self, design: Design) -> Design:
         """
-        Update existing design.
+        Update existing design (single UPDATE ... RETURNING).
         
         Args:
             design: Design entity with updated fields
@@ -144,19 +203,22 @@ class DesignRepositoryImpl(IDesignRepository):
         Raises:
             ValueError: If design not found
         """
-        stmt = select(DesignModel).where(DesignModel.id == design.id)
+        values = design_converter.to_values(design)
+        del values["id"], values["created_at"]
+        
+        stmt = (
+            update(DesignModel)
+            .where(DesignModel.id == design.id)
+            .values(**values)
+            .returning(*DesignModel.__table__.columns)
+        )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if model is None:
+        if row is None:
             raise ValueError(f"Design with id {design.id} not found")
         
-        # Update model with entity data
-        model = design_converter.to_model(design, model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        
-        return design_converter.to_entity(model)
+        return design_converter.to_entity(row)
     
     async def delete(self, design_id: str) -> bool:
         """
@@ -206,3 +268,28 @@ class DesignRepositoryImpl(IDesignRepository):
         
         result = await self.session.execute(stmt)
         return result.scalar_one()
+    
+    @staticmethod
+    def _select(relationships: Sequence[str]) -> Select:
+        """
+        Build the SELECT for a read path.
+        
+        Args:
+            relationships: DesignModel relationship names to load
+            
+        Returns:
+            Column projection if relationships is empty, otherwise full
+            models loading only the named relationships
+        """
+        if not relationships:
+            return select(*DesignModel.__table__.columns)
+        
+        return select(DesignModel).options(
+            lazyload("*"),  # Override lazy="selectin" for everything not requested
+            *(selectinload(getattr(DesignModel, name)) for name in relationships)
+        )
+    
+    @staticmethod
+    def _rows(result: Result, relationships: Sequence[str]) -> list:
+        """Rows (projection) or models (relationships) of a _select result."""
+        return list(result.scalars().all() if relationships else result.all())
@@ -4,11 +4,12 @@ Subscription repository implementation (Infrastructure layer).
 Implements ISubscriptionRepository using SQLAlchemy 2.0 async.
 """
 
+from datetime import UTC, datetime
 from typing import Optional
-from sqlalchemy import select, delete
+from sqlalchemy import and_, select, insert, update, delete, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.entities.subscription import Subscription
+from app.domain.entities.subscription import PLAN_LIMITS, Subscription, SubscriptionStatus
 from app.domain.repositories.subscription_repository import ISubscriptionRepository
 from app.infrastructure.database.models.subscription_model import SubscriptionModel
 from app.infrastructure.database.converters import subscription_converter
@@ -43,11 +44,13 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         Raises:
             IntegrityError: If user already has a subscription (unique constraint)
         """
-        model = subscription_converter.to_model(subscription)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return subscription_converter.to_entity(model)
+        stmt = (
+            insert(SubscriptionModel)
+            .values(**subscription_converter.to_values(subscription))
+            .returning(*SubscriptionModel.__table__.columns)
+        )
+        result = await self.session.execute(stmt)
+        return subscription_converter.to_entity(result.one())
     
     async def get_by_id(self, subscription_id: str) -> Optional[Subscription]:
         """
@@ -59,12 +62,12 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         Returns:
             Subscription entity if found, None otherwise
         """
-        stmt = select(SubscriptionModel).where(
+        stmt = select(*SubscriptionModel.__table__.columns).where(
             SubscriptionModel.id == subscription_id
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return subscription_converter.to_entity(model) if model else None
+        row = result.one_or_none()
+        return subscription_converter.to_entity(row) if row else None
     
     async def get_by_user(self, user_id: str) -> Optional[Subscription]:
         """
@@ -76,12 +79,12 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         Returns:
             User's subscription if exists, None otherwise
         """
-        stmt = select(SubscriptionModel).where(
+        stmt = select(*SubscriptionModel.__table__.columns).where(
             SubscriptionModel.user_id == user_id
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return subscription_converter.to_entity(model) if model else None
+        row = result.one_or_none()
+        return subscription_converter.to_entity(row) if row else None
     
     async def get_by_stripe_subscription_id(
         self, stripe_subscription_id: str
@@ -97,16 +100,16 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         Returns:
             Subscription entity if found, None otherwise
         """
-        stmt = select(SubscriptionModel).where(
+        stmt = select(*SubscriptionModel.__table__.columns).where(
             SubscriptionModel.stripe_subscription_id == stripe_subscription_id
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return subscription_converter.to_entity(model) if model else None
+        row = result.one_or_none()
+        return subscription_converter.to_entity(row) if row else None
     
     async def update(self, subscription: Subscription) -> Subscription:
         """
-        Update existing subscription.
+        Update existing subscription (single UPDATE ... RETURNING).
         
         Args:
             subscription: Subscription entity with updated fields
@@ -117,21 +120,53 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         Raises:
             ValueError: If subscription not found
         """
-        stmt = select(SubscriptionModel).where(
-            SubscriptionModel.id == subscription.id
+        values = subscription_converter.to_values(subscription)
+        del values["id"], values["created_at"]
+        
+        stmt = (
+            update(SubscriptionModel)
+            .where(SubscriptionModel.id == subscription.id)
+            .values(**values)
+            .returning(*SubscriptionModel.__table__.columns)
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if model is None:
+        if row is None:
             raise ValueError(f"Subscription with id {subscription.id} not found")
         
-        # Update model with entity data
-        model = subscription_converter.to_model(subscription, model)
-        await self.session.flush()
-        await self.session.refresh(model)
+        return subscription_converter.to_entity(row)
+    
+    async def reserve_design_quota(self, user_id: str) -> Optional[Subscription]:
+        """
+        Atomically reserve one design from the user's monthly quota.
         
-        return subscription_converter.to_entity(model)
+        Single conditional UPDATE ... RETURNING: the row is only incremented
+        if active and under its plan limit, and the row lock serializes
+        concurrent reservations, so the limit can't be overshot.
+        
+        Args:
+            user_id: User unique identifier
+            
+        Returns:
+            Updated subscription if reserved, None otherwise
+        """
+        stmt = (
+            update(SubscriptionModel)
+            .where(
+                SubscriptionModel.user_id == user_id,
+                SubscriptionModel.status == SubscriptionStatus.ACTIVE.value,
+                _quota_available()
+            )
+            .values(
+                designs_this_month=SubscriptionModel.designs_this_month + 1,
+                updated_at=datetime.now(UTC)
+            )
+            .returning(*SubscriptionModel.__table__.columns)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        return subscription_converter.to_entity(row) if row else None
     
     async def delete(self, subscription_id: str) -> bool:
         """
@@ -149,3 +184,15 @@ class SubscriptionRepositoryImpl(ISubscriptionRepository):
         result = await self.session.execute(stmt)
         await self.session.flush()
         return result.rowcount > 0
+
+
+def _quota_available():
+    """SQL equivalent of Subscription.has_quota() (limits from PLAN_LIMITS)."""
+    return or_(*[
+        SubscriptionModel.plan == plan.value if limit == -1  # Unlimited
+        else and_(
+            SubscriptionModel.plan == plan.value,
+            SubscriptionModel.designs_this_month < limit
+        )
+        for plan, limit in PLAN_LIMITS.items()
+    ])
@@ -4,11 +4,12 @@ Sync Design repository for Celery workers.
 Simplified sync version for task operations.
 """
 
-from typing import Optional
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import ARRAY, BigInteger, String, bindparam, column, func, literal, or_, select, tuple_, update, values
+from sqlalchemy.orm import Session, noload
 
-from app.domain.entities.design import Design
+from app.domain.entities.design import Design, DesignStatus
 from app.infrastructure.database.models.design_model import DesignModel
 from app.infrastructure.database.converters import design_converter
 
@@ -47,6 +48,299 @@ class SyncDesignRepository:
         model = result.scalar_one_or_none()
         return design_converter.to_entity(model) if model else None
     
+    def claim_for_render(self, design_id: str) -> Optional[Design]:
+        """
+        Atomically mark a design as RENDERING (single UPDATE ... RETURNING).
+        
+        Replaces read-check-write: only a DRAFT or FAILED design is claimed,
+        so of two workers racing on the same design exactly one wins.
+        
+        Args:
+            design_id: Design unique identifier
+            
+        Returns:
+            Claimed design entity, or None if missing, deleted, or not in
+            a renderable status (already rendering/published)
+        """
+        claimed = self.claim_many_for_render([design_id])
+        return claimed[0] if claimed else None
+    
+    def publish(
+        self,
+        design_id: str,
+        preview_url: str,
+        thumbnail_url: Optional[str] = None
+    ) -> Optional[Design]:
+        """
+        Atomically mark a RENDERING design as PUBLISHED (single UPDATE ... RETURNING).
+        
+        Args:
+            design_id: Design unique identifier
+            preview_url: URL to full preview image
+            thumbnail_url: URL to thumbnail (optional)
+            
+        Returns:
+            Published design entity, or None if the design is no longer RENDERING
+        """
+        stmt = (
+            update(DesignModel)
+            .where(
+                DesignModel.id == design_id,
+                DesignModel.status == DesignStatus.RENDERING.value
+            )
+            .values(
+                status=DesignStatus.PUBLISHED.value,
+                preview_url=preview_url,
+                thumbnail_url=thumbnail_url,
+                updated_at=func.now()
+            )
+            .returning(DesignModel)
+            # Fresh state for rows already in the session, no relationship loads
+            .options(noload("*"))
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        model = self.session.execute(stmt).scalar_one_or_none()
+        return design_converter.to_entity(model) if model else None
+    
+    def mark_failed(self, design_id: str, error_message: str) -> bool:
+        """
+        Atomically mark a RENDERING design as FAILED (single UPDATE).
+        
+        Args:
+            design_id: Design unique identifier
+            error_message: Error stored in design_data["error_message"]
+            
+        Returns:
+            True if the design was marked as failed
+        """
+        return bool(self.fail_many({design_id: error_message}))
+    
+    def get_many(self, design_ids: List[str]) -> List[Design]:
+        """
+        Get several designs with one SELECT.
+        
+        Args:
+            design_ids: Design unique identifiers
+            
+        Returns:
+            Found design entities (missing/deleted IDs are skipped)
+        """
+        if not design_ids:
+            return []
+        
+        stmt = (
+            select(DesignModel)
+            .where(
+                DesignModel.id.in_(design_ids),
+                DesignModel.is_deleted.is_(False)
+            )
+            .options(noload("*"))  # Only the design rows, no relationship loads
+        )
+        result = self.session.execute(stmt)
+        return [design_converter.to_entity(model) for model in result.scalars().all()]
+    
+    def claim_many_for_render(self, design_ids: List[str]) -> List[Design]:
+        """
+        Atomically mark renderable designs as RENDERING with one UPDATE.
+        
+        Only DRAFT or FAILED designs are claimed, so designs that are
+        already rendering or published (e.g. duplicate task deliveries)
+        are left untouched.
+        
+        Args:
+            design_ids: Design unique identifiers
+            
+        Returns:
+            Claimed design entities (status=RENDERING)
+        """
+        if not design_ids:
+            return []
+        
+        stmt = (
+            update(DesignModel)
+            .where(
+                DesignModel.id.in_(design_ids),
+                DesignModel.is_deleted.is_(False),
+                DesignModel.status.in_([DesignStatus.DRAFT.value, DesignStatus.FAILED.value])
+            )
+            .values(status=DesignStatus.RENDERING.value, updated_at=func.now())
+            .returning(DesignModel)
+            # Fresh state for rows already in the session, no relationship loads
+            .options(noload("*"))
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = self.session.execute(stmt)
+        return [design_converter.to_entity(model) for model in result.scalars().all()]
+    
+    def publish_many(self, published: List[Tuple[str, str, Optional[str]]]) -> List[str]:
+        """
+        Mark several RENDERING designs as PUBLISHED with one bulk UPDATE.
+        
+        Args:
+            published: (design_id, preview_url, thumbnail_url) per design
+            
+        Returns:
+            IDs of designs that were published
+        """
+        if not published:
+            return []
+        
+        rows = values(
+            column("id", String),
+            column("preview_url", String),
+            column("thumbnail_url", String),
+            name="published"
+        ).data(published)
+        
+        stmt = (
+            update(DesignModel)
+            .where(
+                DesignModel.id == rows.c.id,
+                DesignModel.status == DesignStatus.RENDERING.value
+            )
+            .values(
+                status=DesignStatus.PUBLISHED.value,
+                preview_url=rows.c.preview_url,
+                thumbnail_url=rows.c.thumbnail_url,
+                updated_at=func.now()
+            )
+            .returning(DesignModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = self.session.execute(stmt)
+        return list(result.scalars().all())
+    
+    def fail_many(self, errors: Dict[str, str]) -> List[str]:
+        """
+        Mark several RENDERING designs as FAILED with one bulk UPDATE.
+        
+        The error message is stored in design_data["error_message"],
+        like Design.mark_failed().
+        
+        Args:
+            errors: design_id -> error message
+            
+        Returns:
+            IDs of designs that were marked as failed
+        """
+        if not errors:
+            return []
+        
+        rows = values(
+            column("id", String),
+            column("error_message", String),
+            name="failed"
+        ).data(list(errors.items()))
+        
+        stmt = (
+            update(DesignModel)
+            .where(
+                DesignModel.id == rows.c.id,
+                DesignModel.status == DesignStatus.RENDERING.value
+            )
+            .values(
+                status=DesignStatus.FAILED.value,
+                design_data=DesignModel.design_data.op("||")(
+                    func.jsonb_build_object("error_message", rows.c.error_message)
+                ),
+                updated_at=func.now()
+            )
+            .returning(DesignModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = self.session.execute(stmt)
+        return list(result.scalars().all())
+    
+    def list_gc_candidates(
+        self,
+        updated_before: datetime,
+        after: Optional[Tuple[datetime, str]] = None,
+        limit: int = 500
+    ) -> List[Design]:
+        """
+        Page through soft-deleted or failed designs by keyset (updated_at, id).
+        
+        Used by asset garbage collection; a design deleted or failed later
+        gets a newer updated_at, so it is picked up after the cursor.
+        
+        Args:
+            updated_before: Only designs last updated before this (grace period)
+            after: Keyset cursor (updated_at, id) of the last processed design
+            limit: Page size
+            
+        Returns:
+            Designs ordered by (updated_at, id)
+        """
+        stmt = (
+            select(DesignModel)
+            .where(
+                or_(
+                    DesignModel.is_deleted.is_(True),
+                    DesignModel.status == DesignStatus.FAILED.value
+                ),
+                DesignModel.updated_at < updated_before
+            )
+            .order_by(DesignModel.updated_at, DesignModel.id)
+            .limit(limit)
+        )
+        if after is not None:
+            after_updated_at, after_id = after
+            stmt = stmt.where(
+                tuple_(DesignModel.updated_at, DesignModel.id)
+                > tuple_(literal(after_updated_at, DesignModel.updated_at.type), literal(after_id, String()))
+            )
+        
+        models = self.session.execute(stmt).scalars().all()
+        return [design_converter.to_entity(model) for model in models]
+    
+    def find_live_by_text(self, candidates: Iterable[Tuple[str, str]]) -> List[Design]:
+        """
+        Find live designs (not deleted, not failed) by (product_type, text).
+        
+        Narrows down which designs may share a render fingerprint with
+        garbage-collection candidates (fingerprints are not stored).
+        
+        Args:
+            candidates: (product_type, design_data["text"]) pairs
+            
+        Returns:
+            Matching live designs
+        """
+        candidates = list(set(candidates))
+        if not candidates:
+            return []
+        
+        text = func.coalesce(DesignModel.design_data["text"].astext, "Design")
+        stmt = select(DesignModel).where(
+            DesignModel.is_deleted.is_(False),
+            DesignModel.status != DesignStatus.FAILED.value,
+            tuple_(DesignModel.product_type, text).in_(candidates)
+        )
+        models = self.session.execute(stmt).scalars().all()
+        return [design_converter.to_entity(model) for model in models]
+    
+    def lock_fingerprints(self, fingerprints: Iterable[str], shared: bool = False) -> None:
+        """
+        Take transaction-scoped advisory locks on render fingerprints (one SELECT).
+        
+        Renders hold them shared from their dedupe check until the publish
+        commit; asset GC holds them exclusively while it re-checks liveness
+        and deletes, so no design can link a render that is being deleted.
+        Locks are taken in key order (no deadlock between batches) and
+        released on commit/rollback.
+        
+        Args:
+            fingerprints: Render fingerprints
+            shared: Shared (render) instead of exclusive (GC) locks
+        """
+        keys = sorted({fingerprint_lock_key(fingerprint) for fingerprint in fingerprints})
+        if not keys:
+            return
+        
+        lock = func.pg_advisory_xact_lock_shared if shared else func.pg_advisory_xact_lock
+        key = func.unnest(bindparam("keys", keys, type_=ARRAY(BigInteger))).column_valued("key")
+        self.session.execute(select(lock(key))).all()
+    
     def update(self, design: Design) -> Design:
         """
         Update existing design.
@@ -76,3 +370,16 @@ class SyncDesignRepository:
         self.session.refresh(model)
         
         return design_converter.to_entity(model)
+
+
+def fingerprint_lock_key(fingerprint: str) -> int:
+    """
+    Map a render fingerprint to a Postgres advisory lock key.
+    
+    Args:
+        fingerprint: Hex SHA-256 render fingerprint
+    
+    Returns:
+        int: First 60 bits of the fingerprint (fits a signed bigint)
+    """
+    return int(fingerprint[:15], 16)
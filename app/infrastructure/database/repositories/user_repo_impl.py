@@ -4,15 +4,20 @@ User repository implementation (Infrastructure layer).
 Implements IUserRepository using SQLAlchemy 2.0 async.
 """
 
-from typing import Optional
-from sqlalchemy import select, update
+import asyncio
+from typing import Optional, Set
+from sqlalchemy import event, select, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import IUserRepository
+from app.infrastructure.cache.user_cache import get_user_cache
 from app.infrastructure.database.models.user_model import UserModel
 from app.infrastructure.database.converters import user_converter
 
+# Post-commit cache invalidations in flight (keeps the tasks referenced)
+_invalidations: Set[asyncio.Task] = set()
+
 
 class UserRepositoryImpl(IUserRepository):
     """
@@ -44,11 +49,13 @@ class UserRepositoryImpl(IUserRepository):
         Raises:
             IntegrityError: If email already exists
         """
-        model = user_converter.to_model(user)
-        self.session.add(model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        return user_converter.to_entity(model)
+        stmt = (
+            insert(UserModel)
+            .values(**user_converter.to_values(user))
+            .returning(*UserModel.__table__.columns)
+        )
+        result = await self.session.execute(stmt)
+        return user_converter.to_entity(result.one())
     
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """
@@ -60,13 +67,13 @@ class UserRepositoryImpl(IUserRepository):
         Returns:
             User entity if found, None otherwise
         """
-        stmt = select(UserModel).where(
+        stmt = select(*UserModel.__table__.columns).where(
             UserModel.id == user_id,
             UserModel.is_deleted == False  # Exclude soft-deleted users
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return user_converter.to_entity(model) if model else None
+        row = result.one_or_none()
+        return user_converter.to_entity(row) if row else None
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -78,17 +85,19 @@ class UserRepositoryImpl(IUserRepository):
         Returns:
             User entity if found, None otherwise
         """
-        stmt = select(UserModel).where(
+        stmt = select(*UserModel.__table__.columns).where(
             UserModel.email == email,
             UserModel.is_deleted == False  # Exclude soft-deleted users
         )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
-        return user_converter.to_entity(model) if model else None
+        row = result.one_or_none()
+        return user_converter.to_entity(row) if row else None
     
     async def update(self, user: User) -> User:
         """
-        Update existing user.
+        Update existing user (single UPDATE ... RETURNING).
+        
+        Drops the user from the authenticated user cache (now and after commit).
         
         Args:
             user: User entity with updated fields
@@ -99,24 +108,30 @@ class UserRepositoryImpl(IUserRepository):
         Raises:
             ValueError: If user not found
         """
-        stmt = select(UserModel).where(UserModel.id == user.id)
+        values = user_converter.to_values(user)
+        del values["id"], values["created_at"]
+        
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user.id)
+            .values(**values)
+            .returning(*UserModel.__table__.columns)
+        )
         result = await self.session.execute(stmt)
-        model = result.scalar_one_or_none()
+        row = result.one_or_none()
         
-        if model is None:
+        if row is None:
             raise ValueError(f"User with id {user.id} not found")
         
-        # Update model with entity data
-        model = user_converter.to_model(user, model)
-        await self.session.flush()
-        await self.session.refresh(model)
-        
-        return user_converter.to_entity(model)
+        await self._invalidate_cached(user.id)
+        return user_converter.to_entity(row)
     
     async def delete(self, user_id: str) -> bool:
         """
         Soft delete user (sets is_deleted=True, is_active=False).
         
+        Drops the user from the authenticated user cache (now and after commit).
+        
         Args:
             user_id: User unique identifier
             
@@ -130,8 +145,32 @@ class UserRepositoryImpl(IUserRepository):
         )
         result = await self.session.execute(stmt)
         await self.session.flush()
+        await self._invalidate_cached(user_id)
         return result.rowcount > 0
     
+    async def _invalidate_cached(self, user_id: str) -> None:
+        """
+        Drop a user from the auth cache now and again once the session commits.
+        
+        Until the commit, a concurrent get_current_user still reads the old
+        row and may cache it for the full TTL; the second invalidation
+        removes it.
+        
+        Args:
+            user_id: User unique identifier
+        """
+        cache = get_user_cache()
+        await cache.invalidate(user_id)
+        
+        loop = asyncio.get_running_loop()
+        
+        def after_commit(session) -> None:
+            task = loop.create_task(cache.invalidate(user_id))
+            _invalidations.add(task)
+            task.add_done_callback(_invalidations.discard)
+        
+        event.listen(self.session.sync_session, "after_commit", after_commit, once=True)
+    
     async def exists_email(self, email: str) -> bool:
         """
         Check if email already exists.
@@ -0,0 +1,14 @@
+"""Rendering infrastructure (fonts, image pipeline) for the render worker."""
+
+from app.infrastructure.rendering.font_registry import FontRegistry, font_registry
+from app.infrastructure.rendering.png_stream import PngStreamWriter
+from app.infrastructure.rendering.tiled import iter_strips
+from app.infrastructure.rendering.timings import StageTimer
+
+__all__ = [
+    "FontRegistry",
+    "font_registry",
+    "iter_strips",
+    "PngStreamWriter",
+    "StageTimer",
+]
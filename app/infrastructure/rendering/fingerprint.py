@@ -0,0 +1,81 @@
+"""
+Render fingerprints for content-addressed design assets.
+
+Two designs with the same render-relevant data, product type, renderer
+version and resolved font file produce identical images, so their assets
+are stored once under a key derived from the fingerprint and shared by
+every matching design.
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+from app.infrastructure.rendering.font_registry import FontRegistry, font_registry
+
+# Bump whenever rendering output changes (layout, text drawing, encoder settings)
+# so old content-addressed assets are not reused for the new renderer.
+RENDERER_VERSION = "1"
+
+# design_data fields that affect the rendered image, with renderer defaults
+RENDER_FIELDS = {
+    "text": "Design",
+    "font": None,
+    "color": "#FFFFFF",
+    "fontSize": 48,
+}
+
+
+def compute_fingerprint(
+    design_data: dict,
+    product_type: str,
+    fonts: Optional[FontRegistry] = None,
+) -> str:
+    """
+    Compute canonical fingerprint of a design's rendered output.
+
+    Only render-relevant fields are included (missing fields take the
+    renderer defaults), so unrelated keys such as error_message don't
+    change the fingerprint. The font file the renderer resolves the font
+    name to (the fallback when it isn't installed) is included too.
+
+    Args:
+        design_data: Design configuration (text, font, color, fontSize)
+        product_type: Product type (t-shirt, mug, etc.)
+        fonts: Font registry used to render (default: this process's registry)
+
+    Returns:
+        str: Hex SHA-256 fingerprint
+
+    Example:
+        >>> compute_fingerprint({'text': 'Hi', 'font': 'Bebas-Bold', 'color': '#FF0000'}, 't-shirt')
+        '3f1c...'
+    """
+    canonical = {
+        field: design_data.get(field, default)
+        for field, default in RENDER_FIELDS.items()
+    }
+    canonical["color"] = str(canonical["color"]).upper()
+    if isinstance(canonical["fontSize"], float) and canonical["fontSize"].is_integer():
+        canonical["fontSize"] = int(canonical["fontSize"])
+    canonical["font_file"] = (fonts or font_registry).font_id(canonical["font"])
+    canonical["product_type"] = product_type
+    canonical["renderer_version"] = RENDERER_VERSION
+
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def render_asset_key(fingerprint: str, variant: str, extension: str = "png") -> str:
+    """
+    Build content-addressed storage key for a rendered asset.
+
+    Args:
+        fingerprint: Render fingerprint (see compute_fingerprint)
+        variant: Asset variant name (preview, thumbnail, ...)
+        extension: File extension without dot
+
+    Returns:
+        str: Storage key, e.g. renders/{fingerprint}/preview-s600.png
+    """
+    return f"renders/{fingerprint}/{variant}.{extension}"
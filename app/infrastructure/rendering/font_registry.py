@@ -0,0 +1,183 @@
+"""
+Font registry for the render worker.
+
+Maps each whitelisted font name to a TrueType file, reads the files once
+per worker process and keeps a bounded LRU of (font, size) FreeType objects,
+so a render only pays a dictionary lookup to get its font.
+
+Font files are not shipped with the repository: install one
+<font-name>.ttf per whitelisted font (e.g. Bebas-Bold.ttf, from the
+font's Google Fonts release) in FONTS_DIR. Missing fonts render with a
+system fallback (DejaVu Sans Bold on Debian images) and are logged at
+preload.
+"""
+
+import hashlib
+import logging
+import threading
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from PIL import ImageFont
+
+from app.config import settings
+from app.domain.validators.design_validator import ALLOWED_FONTS
+
+logger = logging.getLogger(__name__)
+
+# Whitelisted font name -> file name inside FONTS_DIR
+FONT_FILES: Dict[str, str] = {font: f"{font}.ttf" for font in ALLOWED_FONTS}
+
+# System fonts used when a whitelisted font file is not installed
+FALLBACK_FONT_PATHS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
+    "/System/Library/Fonts/Helvetica.ttc",  # macOS
+    "C:\\Windows\\Fonts\\arial.ttf",  # Windows
+]
+
+FontType = Union[ImageFont.FreeTypeFont, ImageFont.ImageFont]
+
+# font_id when no TrueType font is available at all
+DEFAULT_FONT_ID = "pil-default"
+
+
+class FontRegistry:
+    """
+    Per-process font registry.
+
+    Font files are read into memory by preload() (called from the Celery
+    worker_process_init signal, or lazily on first use). FreeType objects
+    are built on demand and cached in a bounded LRU keyed by (font, size).
+    """
+
+    def __init__(
+        self,
+        fonts_dir: str = settings.FONTS_DIR,
+        cache_size: int = settings.FONT_CACHE_SIZE,
+    ):
+        """
+        Initialize registry (no I/O until preload).
+
+        Args:
+            fonts_dir: Directory containing the whitelisted font files
+            cache_size: Max number of (font, size) objects kept in memory
+        """
+        self.fonts_dir = Path(fonts_dir)
+        self._faces: Dict[str, bytes] = {}
+        self._face_ids: Dict[str, str] = {}
+        self._fallback: Optional[bytes] = None
+        self._fallback_id = DEFAULT_FONT_ID
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._get_font = lru_cache(maxsize=cache_size)(self._load_font)
+
+    def preload(self) -> None:
+        """
+        Read every whitelisted font file into memory.
+
+        Fonts whose file is missing are served with the first available
+        system fallback font (or PIL's bitmap default as a last resort).
+        """
+        with self._lock:
+            fallback = self._read_fallback()
+            if fallback is None:
+                self._fallback, self._fallback_id = None, DEFAULT_FONT_ID
+            else:
+                self._fallback = fallback[1]
+                self._fallback_id = _font_id(fallback[0], fallback[1])
+
+            faces: Dict[str, bytes] = {}
+            face_ids: Dict[str, str] = {}
+            for font_name, filename in FONT_FILES.items():
+                path = self.fonts_dir / filename
+                try:
+                    faces[font_name] = path.read_bytes()
+                except OSError:
+                    logger.warning(f"Font file not found for {font_name}: {path}, using fallback")
+                    continue
+                face_ids[font_name] = _font_id(path, faces[font_name])
+
+            self._faces = faces
+            self._face_ids = face_ids
+            self._get_font.cache_clear()
+            self._loaded = True
+
+        logger.info(
+            f"Font registry loaded {len(self._faces)}/{len(FONT_FILES)} fonts "
+            f"from {self.fonts_dir}"
+        )
+
+    def get_font(self, font_name: Optional[str], size: int) -> FontType:
+        """
+        Get font object for a whitelisted font name and size.
+
+        Args:
+            font_name: Whitelisted font name (unknown names use the fallback)
+            size: Font size in pixels
+
+        Returns:
+            FreeType font (or PIL default font if no TrueType font is available)
+        """
+        if not self._loaded:
+            self.preload()
+
+        if font_name not in self._faces:
+            font_name = None
+
+        return self._get_font(font_name, int(size))
+
+    def font_id(self, font_name: Optional[str]) -> str:
+        """
+        Identify the font file get_font actually uses for a font name.
+
+        Part of the render fingerprint, so renders made with a fallback
+        font are not reused once the real font file is installed.
+
+        Args:
+            font_name: Whitelisted font name (unknown names use the fallback)
+
+        Returns:
+            str: "{file name}:{content hash}", or DEFAULT_FONT_ID for PIL's bitmap font
+        """
+        if not self._loaded:
+            self.preload()
+
+        if font_name in self._face_ids:
+            return self._face_ids[font_name]
+        return self._fallback_id
+
+    def cache_info(self):
+        """Return LRU statistics (hits, misses, maxsize, currsize)."""
+        return self._get_font.cache_info()
+
+    def _load_font(self, font_name: Optional[str], size: int) -> FontType:
+        """Build a FreeType object from in-memory font data (LRU miss path)."""
+        data = self._faces.get(font_name) if font_name else self._fallback
+
+        if data is None:
+            logger.warning("Could not load TrueType font, using default")
+            return ImageFont.load_default()
+
+        return ImageFont.truetype(BytesIO(data), size)
+
+    @staticmethod
+    def _read_fallback() -> Optional[Tuple[Path, bytes]]:
+        """Read the first available system fallback font (path and data)."""
+        for font_path in FALLBACK_FONT_PATHS:
+            try:
+                return Path(font_path), Path(font_path).read_bytes()
+            except OSError:
+                continue
+        return None
+
+
+def _font_id(path: Path, data: bytes) -> str:
+    """Build font_id from a font file's name and content."""
+    return f"{path.name}:{hashlib.sha256(data).hexdigest()[:16]}"
+
+
+# Singleton instance (one per worker process)
+font_registry = FontRegistry()
@@ -0,0 +1,105 @@
+"""
+Streaming PNG encoder.
+
+Writes an 8-bit RGB PNG row strip by row strip: each strip is deflated
+into the same zlib stream and emitted as IDAT chunks as soon as enough
+compressed data is available, so neither the raw image nor the encoded
+file has to be held in memory.
+"""
+
+import struct
+import zlib
+
+from PIL import Image
+
+from app.domain.repositories.storage_repository import AssetWriter
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Emit an IDAT chunk whenever this much compressed data is buffered
+IDAT_CHUNK_SIZE = 256 * 1024
+
+
+class PngStreamWriter:
+    """
+    Incremental PNG writer (8-bit RGB, no interlace, filter type None).
+
+    Example:
+        >>> writer = PngStreamWriter(sink, width=5400, height=7200)
+        >>> for strip in strips:
+        ...     writer.write_strip(strip)
+        >>> writer.close()
+    """
+
+    def __init__(self, sink: AssetWriter, width: int, height: int, compress_level: int = 6):
+        """
+        Write PNG signature and header.
+
+        Args:
+            sink: Writable binary stream (file, multipart upload, ...)
+            width: Image width in pixels
+            height: Image height in pixels
+            compress_level: zlib level 0-9
+        """
+        self.sink = sink
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self._compressor = zlib.compressobj(compress_level)
+        self._pending = bytearray()
+
+        self.sink.write(PNG_SIGNATURE)
+        # 8-bit depth, color type 2 (RGB), deflate, adaptive filtering, no interlace
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+    def write_strip(self, strip: Image.Image) -> None:
+        """
+        Append a horizontal strip of rows.
+
+        Args:
+            strip: RGB image exactly `width` pixels wide
+
+        Raises:
+            ValueError: If the strip doesn't fit the declared image
+        """
+        if strip.mode != "RGB" or strip.width != self.width:
+            raise ValueError(f"Strip must be RGB and {self.width}px wide")
+        if self.rows_written + strip.height > self.height:
+            raise ValueError(f"Strip exceeds image height {self.height}")
+
+        raw = strip.tobytes()
+        stride = self.width * 3
+        # Every scanline is prefixed with its filter type (0 = None)
+        scanlines = b"".join(
+            b"\x00" + raw[offset:offset + stride] for offset in range(0, len(raw), stride)
+        )
+
+        self._pending += self._compressor.compress(scanlines)
+        self.rows_written += strip.height
+
+        while len(self._pending) >= IDAT_CHUNK_SIZE:
+            self._write_chunk(b"IDAT", bytes(self._pending[:IDAT_CHUNK_SIZE]))
+            del self._pending[:IDAT_CHUNK_SIZE]
+
+    def close(self) -> None:
+        """
+        Flush compressed data and write the PNG trailer.
+
+        Raises:
+            ValueError: If fewer rows than the declared height were written
+        """
+        if self.rows_written != self.height:
+            raise ValueError(f"Wrote {self.rows_written} of {self.height} rows")
+
+        self._pending += self._compressor.flush()
+        if self._pending:
+            self._write_chunk(b"IDAT", bytes(self._pending))
+            self._pending.clear()
+        self._write_chunk(b"IEND", b"")
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes) -> None:
+        """Write one length-prefixed, CRC-terminated PNG chunk."""
+        self.sink.write(struct.pack(">I", len(data)))
+        self.sink.write(chunk_type)
+        self.sink.write(data)
+        self.sink.write(struct.pack(">I", zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
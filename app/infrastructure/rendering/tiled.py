@@ -0,0 +1,92 @@
+"""
+Tiled (strip) rendering for print-resolution output.
+
+A print-size raster (e.g. 18x24in at 300 DPI = 5400x7200, ~117 MB RGB)
+is never allocated: the canvas is produced as horizontal strips of
+`tile_height` rows, ready to be streamed into PngStreamWriter. The text is
+rasterized once into a mask covering only its visible part, so peak memory
+depends on canvas width, strip height and font size - not canvas height.
+"""
+
+from typing import Iterator, Tuple
+
+from PIL import Image, ImageDraw
+
+from app.infrastructure.rendering.font_registry import FontType
+
+
+def _visible_text(text: str, font: FontType, x: float, width: int) -> Tuple[str, float]:
+    """
+    Clip text to the characters that fall (at least partly) inside the canvas.
+
+    Args:
+        text: Full text line
+        font: Font used to draw it
+        x: Left edge of the full text on the canvas
+        width: Canvas width
+
+    Returns:
+        Tuple of (visible substring, its left edge on the canvas)
+    """
+    offsets = [font.getlength(text[:index]) for index in range(len(text) + 1)]
+    visible = [
+        index for index in range(len(text))
+        if x + offsets[index + 1] > 0 and x + offsets[index] < width
+    ]
+    if not visible:
+        return "", x
+
+    start, end = visible[0], visible[-1] + 1
+    return text[start:end], x + offsets[start]
+
+
+def iter_strips(
+    width: int,
+    height: int,
+    tile_height: int,
+    bg_color: str,
+    text: str,
+    font: FontType,
+    text_color: str,
+) -> Iterator[Image.Image]:
+    """
+    Yield the canvas top to bottom as RGB strips (text centered).
+
+    Layout matches the worker's single-raster renderer: the text bounding
+    box is centered on the canvas.
+
+    Args:
+        width: Canvas width in pixels
+        height: Canvas height in pixels
+        tile_height: Rows per strip (last strip may be shorter)
+        bg_color: Background color
+        text: Text to draw (one line)
+        font: Font to draw with
+        text_color: Text color
+
+    Yields:
+        Image.Image: RGB strip `width` pixels wide
+    """
+    measure = ImageDraw.Draw(Image.new("L", (1, 1)))
+    left, top, right, bottom = measure.textbbox((0, 0), text, font=font)
+    x = (width - (right - left)) / 2
+    y = (height - (bottom - top)) / 2
+
+    # Rasterize the visible text once; strips paste their slice of it
+    mask, mask_x, mask_y = None, 0, 0
+    visible, visible_x = _visible_text(text, font, x, width)
+    if visible:
+        left, top, right, bottom = measure.textbbox((0, 0), visible, font=font)
+        if right > left and bottom > top:
+            mask = Image.new("L", (right - left, bottom - top), 0)
+            ImageDraw.Draw(mask).text((-left, -top), visible, fill=255, font=font)
+            mask_x, mask_y = round(visible_x + left), round(y + top)
+
+    for strip_top in range(0, height, tile_height):
+        strip_height = min(tile_height, height - strip_top)
+        strip = Image.new("RGB", (width, strip_height), color=bg_color)
+
+        if mask is not None and strip_top < mask_y + mask.height and mask_y < strip_top + strip_height:
+            strip.paste(text_color, (mask_x, mask_y - strip_top), mask)
+
+        yield strip
@@ -0,0 +1,69 @@
+"""
+Per-stage wall-clock timings for render tasks.
+
+Stages may overlap (uploads run in the storage I/O pool while the next
+variant encodes), so per-stage durations can add up to more than the
+task's wall-clock time - that difference is the concurrency gain.
+"""
+
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Dict, Iterator
+
+
+class StageTimer:
+    """
+    Accumulates elapsed seconds per named stage (thread-safe).
+
+    Example:
+        >>> timer = StageTimer()
+        >>> with timer.stage("draw"):
+        ...     draw()
+        >>> timer.as_dict()
+        {'draw': 12.34}
+    """
+
+    def __init__(self):
+        """Initialize empty timer (wall clock starts now)."""
+        self._durations: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._started = perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a block and add it to the named stage.
+
+        Args:
+            name: Stage name (draw, encode, upload, ...)
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        """
+        Add elapsed seconds to a stage (repeated stages accumulate).
+
+        Args:
+            name: Stage name
+            seconds: Elapsed seconds
+        """
+        with self._lock:
+            self._durations[name] = self._durations.get(name, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        """Return seconds since the timer was created."""
+        return perf_counter() - self._started
+
+    def seconds(self) -> Dict[str, float]:
+        """Return stage durations in seconds."""
+        with self._lock:
+            return dict(self._durations)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return stage durations in milliseconds (rounded, JSON friendly)."""
+        return {name: round(seconds * 1000, 2) for name, seconds in self.seconds().items()}
@@ -0,0 +1,251 @@
+"""
+Multi-variant output pipeline for rendered designs.
+
+The renderer draws a design once into an in-memory raster; every configured
+variant (preview, thumbnail, retina, ...) is derived from that raster and
+encoded exactly once. No variant is ever decoded back from an encoded file.
+"""
+
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from PIL import Image
+
+from app.config import settings
+
+# Output format -> (PIL format, content type, file extension)
+OUTPUT_FORMATS = {
+    "png": ("PNG", "image/png", "png"),
+    "jpeg": ("JPEG", "image/jpeg", "jpg"),
+    "webp": ("WEBP", "image/webp", "webp"),
+    "avif": ("AVIF", "image/avif", "avif"),
+}
+
+# Encoder options accepted per output format
+FORMAT_OPTIONS = {
+    "png": {"compress_level"},
+    "jpeg": {"quality"},
+    "webp": {"quality", "lossless"},
+    "avif": {"quality"},
+}
+
+
+def format_supported(output_format: str) -> bool:
+    """
+    Check if the installed Pillow can encode an output format.
+
+    AVIF needs Pillow built with libavif (or pillow-avif-plugin installed).
+
+    Args:
+        output_format: Output format name (png, jpeg, webp, avif)
+
+    Returns:
+        bool: True if Pillow has an encoder for it
+    """
+    if output_format not in OUTPUT_FORMATS:
+        return False
+    Image.init()
+    return OUTPUT_FORMATS[output_format][0] in Image.SAVE
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    """
+    Configured output variant.
+
+    Attributes:
+        name: Variant name, used in the storage key (preview, thumbnail, ...)
+        size: Max width/height in pixels (aspect ratio is preserved)
+        format: Output format (png, jpeg, webp, avif)
+        compress_level: PNG zlib level 0-9 (None = Pillow default, 6)
+        quality: JPEG/WebP/AVIF quality 1-100 (None = Pillow default)
+        lossless: WebP lossless mode (best for flat text-on-color designs)
+    """
+
+    name: str
+    size: int
+    format: str = "png"
+    compress_level: Optional[int] = None
+    quality: Optional[int] = None
+    lossless: Optional[bool] = None
+
+    @property
+    def pil_format(self) -> str:
+        """PIL encoder name."""
+        return OUTPUT_FORMATS[self.format][0]
+
+    @property
+    def content_type(self) -> str:
+        """MIME type of the encoded variant."""
+        return OUTPUT_FORMATS[self.format][1]
+
+    @property
+    def extension(self) -> str:
+        """File extension (without dot) used in storage keys."""
+        return OUTPUT_FORMATS[self.format][2]
+
+    @property
+    def save_options(self) -> Dict[str, Any]:
+        """Keyword arguments for Image.save (only options that are set)."""
+        options = {
+            "compress_level": self.compress_level,
+            "quality": self.quality,
+            "lossless": self.lossless,
+        }
+        return {key: value for key, value in options.items() if value is not None}
+
+    @property
+    def asset_name(self) -> str:
+        """
+        Name used in the storage key.
+
+        Size and encoder options are part of it (e.g. preview-s600-q80,
+        thumbnail-s200-ll), so changing them never reuses assets rendered
+        with the old settings (the format is the key's extension).
+        """
+        tags = [f"s{self.size}"]
+        if self.compress_level is not None:
+            tags.append(f"z{self.compress_level}")
+        if self.quality is not None:
+            tags.append(f"q{self.quality}")
+        if self.lossless:
+            tags.append("ll")
+        return "-".join([self.name, *tags])
+
+
+@dataclass
+class EncodedVariant:
+    """Variant encoded from the source raster."""
+
+    spec: VariantSpec
+    buffer: BytesIO
+    dimensions: Tuple[int, int]
+
+
+def load_variant_specs(raw_variants: List[dict]) -> List[VariantSpec]:
+    """
+    Parse and validate variant configuration.
+
+    Args:
+        raw_variants: List of dicts with name, size and optional format,
+            compress_level, quality and lossless
+
+    Returns:
+        List of VariantSpec (largest first)
+
+    Raises:
+        ValueError: If a variant is invalid, its format can't be encoded by
+            the installed Pillow, or no "preview" variant exists
+    """
+    specs = []
+    for raw in raw_variants:
+        output_format = str(raw.get("format", "png")).lower()
+        name = str(raw["name"])
+
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Invalid format for variant {name}: {output_format}. "
+                f"Must be one of: {', '.join(OUTPUT_FORMATS)}"
+            )
+
+        if not format_supported(output_format):
+            raise ValueError(
+                f"Format {output_format} for variant {name} is not supported by the installed Pillow"
+            )
+
+        unknown = set(raw) - {"name", "size", "format"} - FORMAT_OPTIONS[output_format]
+        if unknown:
+            raise ValueError(
+                f"Invalid options for {output_format} variant {name}: {', '.join(sorted(unknown))}"
+            )
+
+        spec = VariantSpec(
+            name=name,
+            size=int(raw["size"]),
+            format=output_format,
+            compress_level=_optional_int(raw, "compress_level", 0, 9),
+            quality=_optional_int(raw, "quality", 1, 100),
+            lossless=bool(raw["lossless"]) if "lossless" in raw else None,
+        )
+
+        if spec.size <= 0:
+            raise ValueError(f"Variant {spec.name} size must be positive, got {spec.size}")
+
+        specs.append(spec)
+
+    names = [spec.name for spec in specs]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate render variant names: {', '.join(names)}")
+
+    if "preview" not in names:
+        raise ValueError("RENDER_VARIANTS must include a 'preview' variant")
+
+    return sorted(specs, key=lambda spec: spec.size, reverse=True)
+
+
+def _optional_int(raw: dict, option: str, low: int, high: int) -> Optional[int]:
+    """Read an optional integer encoder option and check its range."""
+    if option not in raw:
+        return None
+
+    value = int(raw[option])
+    if not low <= value <= high:
+        raise ValueError(f"Variant {raw['name']} {option} must be {low}-{high}, got {value}")
+    return value
+
+
+def raster_size(specs: List[VariantSpec]) -> int:
+    """
+    Get source raster size needed to derive every variant without upscaling.
+
+    Args:
+        specs: Configured variants
+
+    Returns:
+        int: Largest variant size
+    """
+    return max(spec.size for spec in specs)
+
+
+def encode_variant(image: Image.Image, spec: VariantSpec) -> EncodedVariant:
+    """
+    Derive one variant from the source raster and encode it.
+
+    Args:
+        image: Source raster (not modified)
+        spec: Variant to produce
+
+    Returns:
+        EncodedVariant with buffer positioned at 0
+    """
+    if max(image.size) > spec.size:
+        variant_image = image.copy()
+        variant_image.thumbnail((spec.size, spec.size), Image.Resampling.LANCZOS)
+    else:
+        variant_image = image
+
+    buffer = BytesIO()
+    variant_image.save(buffer, format=spec.pil_format, **spec.save_options)
+    buffer.seek(0)
+
+    return EncodedVariant(spec=spec, buffer=buffer, dimensions=variant_image.size)
+
+
+def derive_variants(image: Image.Image, specs: List[VariantSpec]) -> Iterator[EncodedVariant]:
+    """
+    Derive and encode every configured variant from one raster.
+
+    Args:
+        image: Source raster
+        specs: Variants to produce
+
+    Yields:
+        EncodedVariant per spec (in spec order)
+    """
+    for spec in specs:
+        yield encode_variant(image, spec)
+
+
+# Variants configured for this process (validated at import)
+RENDER_VARIANTS = load_variant_specs(settings.RENDER_VARIANTS)
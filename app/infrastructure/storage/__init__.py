@@ -1,17 +1,23 @@
 """Storage module - Factory for storage repositories."""
 
+from functools import lru_cache
+
 from app.config import settings
 from app.domain.repositories.storage_repository import IStorageRepository
 from app.infrastructure.storage.local_storage import LocalStorageRepository
+from app.infrastructure.storage.memory_storage import InMemoryStorageRepository
 from app.infrastructure.storage.storage_repo_impl import StorageRepositoryImpl
 
 
+@lru_cache(maxsize=None)
 def get_storage_repository() -> IStorageRepository:
     """
-    Get storage repository instance.
+    Get storage repository instance (cached, one per process).
     
     Returns local storage for development (USE_LOCAL_STORAGE=True)
     or S3 storage for production (USE_LOCAL_STORAGE=False).
+    Repositories are stateless; the S3 client behind them is created
+    lazily per process (see get_s3_client).
     
     Returns:
         IStorageRepository: Storage repository instance
@@ -28,6 +34,7 @@ def get_storage_repository() -> IStorageRepository:
 __all__ = [
     "get_storage_repository",
     "IStorageRepository",
+    "InMemoryStorageRepository",
     "LocalStorageRepository",
     "StorageRepositoryImpl",
 ]
@@ -0,0 +1,42 @@
+"""
+HTTP caching policy for stored assets.
+
+Rendered assets live under content-addressed keys (renders/{fingerprint}/...,
+see render_asset_key): the fingerprint covers the design data, renderer
+version and encoder options, so a key is never rewritten with different
+bytes. Those objects are served as immutable for a year; CDNs and browsers
+never revalidate them. Legacy per-design keys (designs/{id}/...) are
+overwritten on re-render and must be revalidated on every use.
+"""
+
+# Content-addressed key prefixes (never overwritten with different content)
+IMMUTABLE_PREFIXES = ("renders/",)
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MUTABLE_CACHE_CONTROL = "no-cache"
+
+
+def is_immutable_key(key: str) -> bool:
+    """
+    Check if a storage key is content-addressed.
+
+    Args:
+        key: Storage key (local sharded paths keep the same prefix)
+
+    Returns:
+        bool: True if the object behind the key never changes
+    """
+    return key.startswith(IMMUTABLE_PREFIXES)
+
+
+def cache_control_for(key: str) -> str:
+    """
+    Get Cache-Control header value for a storage key.
+
+    Args:
+        key: Storage key
+
+    Returns:
+        str: Cache-Control value (immutable for content-addressed keys)
+    """
+    return IMMUTABLE_CACHE_CONTROL if is_immutable_key(key) else MUTABLE_CACHE_CONTROL
@@ -0,0 +1,64 @@
+"""
+Shared thread pool for blocking storage I/O (S3 PUT/HEAD, local writes).
+
+One bounded pool per process, shared by every storage repository, so the
+render worker can encode the next variant while earlier ones upload.
+Threads don't survive fork, so Celery prefork children drop any pool
+inherited from the parent and lazily create their own.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app.config import settings
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's pool (and lock) in a forked child process."""
+    global _executor, _lock
+    _executor = None
+    _lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_storage_executor() -> ThreadPoolExecutor:
+    """
+    Get this process's storage I/O pool (created on first use).
+    
+    Returns:
+        ThreadPoolExecutor with STORAGE_IO_WORKERS threads
+    """
+    global _executor
+    
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.STORAGE_IO_WORKERS,
+                    thread_name_prefix="storage-io",
+                )
+    
+    return _executor
+
+
+def shutdown_storage_executor(wait: bool = True) -> None:
+    """
+    Shut down this process's storage I/O pool (next use creates a new one).
+    
+    Args:
+        wait: Wait for queued uploads to finish
+    """
+    global _executor
+    
+    with _lock:
+        executor, _executor = _executor, None
+    
+    if executor is not None:
+        executor.shutdown(wait=wait)
@@ -1,20 +1,66 @@
 """Local file storage for development (mock S3)."""
 
 import os
+import shutil
+from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO
+import tempfile
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List
 import logging
-from app.domain.repositories.storage_repository import IStorageRepository
+from app.domain.repositories.storage_repository import AssetWriter, IStorageRepository
+from app.infrastructure.storage.executor import get_storage_executor
 
 logger = logging.getLogger(__name__)
 
+# Top-level key prefixes whose second segment is an ID/fingerprint to shard on
+SHARDED_PREFIXES = ("designs", "renders")
+
+# Process umask, read once at import (os.umask can only be read by setting it,
+# which is not thread-safe once storage I/O threads are running)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Mode of stored files: what open(path, "wb") would create (0644 by default),
+# so other users of a shared volume (nginx, ...) can read them
+ASSET_FILE_MODE = 0o666 & ~_UMASK
+
+
+def shard_key(key: str) -> str:
+    """
+    Map a storage key to its sharded on-disk path (relative to base_path).
+    
+    designs/{id}/preview.png -> designs/{id[0:2]}/{id[2:4]}/{id}/preview.png
+    
+    Two levels of 256 hex buckets keep every directory small as the number
+    of designs grows. Other keys (and IDs shorter than 4 chars) are unchanged.
+    
+    Args:
+        key: Storage key
+    
+    Returns:
+        str: Sharded relative path
+    
+    Example:
+        >>> shard_key('renders/3f1c9a.../preview.png')
+        'renders/3f/1c/3f1c9a.../preview.png'
+    """
+    parts = key.split("/", 2)
+    if len(parts) < 3 or parts[0] not in SHARDED_PREFIXES or len(parts[1]) < 4:
+        return key
+    
+    prefix, identifier, rest = parts
+    return f"{prefix}/{identifier[:2]}/{identifier[2:4]}/{identifier}/{rest}"
+
 
 class LocalStorageRepository(IStorageRepository):
     """
-    Local filesystem storage (for development).
+    Local filesystem storage (for development and on-prem shared volumes).
     
-    Mimics S3 behavior but stores files locally.
-    Use this when USE_LOCAL_STORAGE=True (development mode).
+    Mimics S3 behavior but stores files locally, in a sharded layout
+    (see shard_key) with atomic writes: readers never see partial files.
+    Use this when USE_LOCAL_STORAGE=True.
     """
     
     def __init__(self, base_path: str = "./storage"):
@@ -36,7 +82,7 @@ class LocalStorageRepository(IStorageRepository):
         """
         Save preview to local filesystem.
         
-        Path: {base_path}/designs/{design_id}/preview.png
+        Path: {base_path}/designs/ab/cd/{design_id}/preview.png (sharded)
         
         Args:
             design_id: Design ID
@@ -45,18 +91,8 @@ class LocalStorageRepository(IStorageRepository):
         Returns:
             str: Mock URL for local file
         """
-        # Create design directory
-        design_path = self.base_path / "designs" / design_id
-        design_path.mkdir(parents=True, exist_ok=True)
-        
-        # Save file
-        file_path = design_path / "preview.png"
-        with open(file_path, 'wb') as f:
-            f.write(image_data.read())
-        
-        # Return mock URL (static file serving)
-        url = f"http://localhost:8000/static/designs/{design_id}/preview.png"
-        logger.info(f"Saved preview locally: {file_path}")
+        url = self.upload_asset(f"designs/{design_id}/preview.png", image_data)
+        logger.info(f"Saved preview locally for design: {design_id}")
         
         return url
     
@@ -68,7 +104,7 @@ class LocalStorageRepository(IStorageRepository):
         """
         Save thumbnail to local filesystem.
         
-        Path: {base_path}/designs/{design_id}/thumbnail.png
+        Path: {base_path}/designs/ab/cd/{design_id}/thumbnail.png (sharded)
         
         Args:
             design_id: Design ID
@@ -77,20 +113,180 @@ class LocalStorageRepository(IStorageRepository):
         Returns:
             str: Mock URL for local file
         """
-        # Create design directory
-        design_path = self.base_path / "designs" / design_id
-        design_path.mkdir(parents=True, exist_ok=True)
+        url = self.upload_asset(f"designs/{design_id}/thumbnail.png", image_data)
+        logger.info(f"Saved thumbnail locally for design: {design_id}")
         
-        # Save file
-        file_path = design_path / "thumbnail.png"
-        with open(file_path, 'wb') as f:
-            f.write(image_data.read())
+        return url
+    
+    def upload_asset(
+        self,
+        key: str,
+        data: BinaryIO,
+        content_type: str = "image/png"
+    ) -> str:
+        """
+        Save asset to local filesystem under an explicit key.
         
-        # Return mock URL
-        url = f"http://localhost:8000/static/designs/{design_id}/thumbnail.png"
-        logger.info(f"Saved thumbnail locally: {file_path}")
+        Path: {base_path}/{shard_key(key)}, written to a temp file in the
+        same directory and renamed into place (atomic).
         
-        return url
+        Args:
+            key: Storage key (path/to/file.png)
+            data: File-like object
+            content_type: MIME type (unused locally, kept for interface parity)
+        
+        Returns:
+            str: Mock URL for local file
+        """
+        with self.open_asset_writer(key, content_type) as f:
+            if isinstance(data, BytesIO):
+                # Zero-copy: write the buffer's memory directly
+                f.write(data.getbuffer()[data.tell():])
+            else:
+                shutil.copyfileobj(data, f)
+        
+        return self.get_asset_url(key)
+    
+    def upload_asset_async(
+        self,
+        key: str,
+        data: BinaryIO,
+        content_type: str = "image/png"
+    ) -> "Future[str]":
+        """
+        Save asset to local filesystem in the shared storage I/O pool.
+        
+        Args:
+            key: Storage key
+            data: File-like object
+            content_type: MIME type
+        
+        Returns:
+            Future resolving to the asset URL
+        """
+        return get_storage_executor().submit(self.upload_asset, key, data, content_type)
+    
+    @contextmanager
+    def open_asset_writer(
+        self,
+        key: str,
+        content_type: str = "image/png"
+    ) -> Iterator[AssetWriter]:
+        """
+        Stream an asset to a temp file, renamed into place on success.
+        
+        The temp file gets ASSET_FILE_MODE and is fsynced before the rename,
+        so a crash can't leave a truncated file under an immutable key.
+        
+        Args:
+            key: Storage key
+            content_type: MIME type (unused locally)
+        
+        Yields:
+            Writable file object
+        """
+        file_path = self.path_for(key)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with tempfile.NamedTemporaryFile(dir=file_path.parent, suffix=".tmp", delete=False) as tmp:
+            try:
+                yield tmp
+                tmp.flush()
+                os.fchmod(tmp.fileno(), ASSET_FILE_MODE)
+                os.fsync(tmp.fileno())
+            except Exception:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        
+        os.replace(tmp.name, file_path)
+        logger.info(f"Saved asset locally: {file_path}")
+    
+    def asset_exists(self, key: str) -> bool:
+        """
+        Check if asset file exists locally.
+        
+        Args:
+            key: Storage key
+        
+        Returns:
+            bool: True if file exists
+        """
+        return self.path_for(key).is_file()
+    
+    def path_for(self, key: str) -> Path:
+        """
+        Get on-disk path of a storage key.
+        
+        Args:
+            key: Storage key
+        
+        Returns:
+            Path: {base_path}/{shard_key(key)}
+        """
+        return self.base_path / shard_key(key)
+    
+    def get_asset_url(self, key: str) -> str:
+        """
+        Get mock URL for a storage key (static file serving).
+        
+        Args:
+            key: Storage key
+        
+        Returns:
+            str: Mock URL for local file
+        """
+        return f"http://localhost:8000/static/{shard_key(key)}"
+    
+    def list_assets(self, prefix: str) -> List[str]:
+        """
+        List stored keys under a directory prefix.
+        
+        Temp files of writes in progress are skipped.
+        
+        Args:
+            prefix: Key prefix ending with "/" (e.g. renders/{fingerprint}/)
+        
+        Returns:
+            Matching storage keys (unsharded)
+        """
+        directory = self.path_for(f"{prefix}_").parent
+        if not directory.is_dir():
+            return []
+        
+        return [
+            f"{prefix}{path.relative_to(directory).as_posix()}"
+            for path in sorted(directory.rglob("*"))
+            if path.is_file() and path.suffix != ".tmp"
+        ]
+    
+    def delete_assets(self, keys: List[str]) -> int:
+        """
+        Unlink local files (and their shard directories once empty).
+        
+        Args:
+            keys: Storage keys
+        
+        Returns:
+            int: Number of files deleted
+        """
+        deleted = 0
+        parents = set()
+        
+        for key in keys:
+            file_path = self.path_for(key)
+            try:
+                file_path.unlink()
+                deleted += 1
+            except FileNotFoundError:
+                continue
+            parents.add(file_path.parent)
+        
+        for parent in parents:
+            self._prune_empty_dirs(parent)
+        
+        logger.info(f"Deleted {deleted}/{len(keys)} local assets")
+        return deleted
     
     def delete_design_assets(self, design_id: str) -> bool:
         """
@@ -102,7 +298,7 @@ class LocalStorageRepository(IStorageRepository):
         Returns:
             bool: True if all files deleted successfully
         """
-        design_path = self.base_path / "designs" / design_id
+        design_path = self.path_for(f"designs/{design_id}/preview.png").parent
         
         if not design_path.exists():
             logger.warning(f"Design directory not found: {design_path}")
@@ -115,8 +311,8 @@ class LocalStorageRepository(IStorageRepository):
                 file.unlink()
                 deleted_count += 1
             
-            # Remove directory
-            design_path.rmdir()
+            # Remove directory (and empty shard directories)
+            self._prune_empty_dirs(design_path)
             
             logger.info(f"Deleted {deleted_count} files for design: {design_id}")
             return True
@@ -124,3 +320,12 @@ class LocalStorageRepository(IStorageRepository):
         except Exception as e:
             logger.error(f"Failed to delete local assets for design {design_id}: {e}")
             return False
+    
+    def _prune_empty_dirs(self, directory: Path) -> None:
+        """Remove a directory and its empty parents, up to base_path."""
+        while directory != self.base_path and self.base_path in directory.parents:
+            try:
+                directory.rmdir()  # Only succeeds if empty
+            except OSError:
+                return
+            directory = directory.parent
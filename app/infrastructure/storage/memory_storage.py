@@ -0,0 +1,240 @@
+"""In-memory storage with injectable latency and bandwidth (tests, benchmarks)."""
+
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from io import BytesIO
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+import logging
+from app.domain.repositories.storage_repository import AssetWriter, IStorageRepository
+from app.infrastructure.storage.executor import get_storage_executor
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryStorageRepository(IStorageRepository):
+    """
+    Storage repository keeping objects in a process-local dict.
+
+    Separates render-pipeline throughput from storage I/O: with no latency
+    configured every operation is a dict access; with latency/bandwidth set,
+    each call sleeps like a network round trip (releasing the GIL, so
+    concurrent uploads overlap as they would against S3).
+    Thread-safe; objects are not shared across processes.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        base_url: str = "memory://assets"
+    ):
+        """
+        Initialize empty storage.
+
+        Args:
+            latency: Seconds added to every operation (request round trip)
+            bandwidth: Upload bandwidth in bytes/second (None = unlimited)
+            base_url: Prefix of returned asset URLs
+        """
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.base_url = base_url
+        self._objects: Dict[str, Tuple[bytes, str]] = {}
+        self._lock = threading.Lock()
+
+    def upload_design_preview(
+        self,
+        design_id: str,
+        image_data: BinaryIO
+    ) -> str:
+        """
+        Store design preview under designs/{design_id}/preview.png.
+
+        Args:
+            design_id: Design ID
+            image_data: Image file-like object
+
+        Returns:
+            str: Asset URL
+        """
+        return self.upload_asset(f"designs/{design_id}/preview.png", image_data)
+
+    def upload_design_thumbnail(
+        self,
+        design_id: str,
+        image_data: BinaryIO
+    ) -> str:
+        """
+        Store design thumbnail under designs/{design_id}/thumbnail.png.
+
+        Args:
+            design_id: Design ID
+            image_data: Image file-like object
+
+        Returns:
+            str: Asset URL
+        """
+        return self.upload_asset(f"designs/{design_id}/thumbnail.png", image_data)
+
+    def upload_asset(
+        self,
+        key: str,
+        data: BinaryIO,
+        content_type: str = "image/png"
+    ) -> str:
+        """
+        Store asset bytes under an explicit key.
+
+        Args:
+            key: Storage key
+            data: File-like object (read from its current position)
+            content_type: MIME type
+
+        Returns:
+            str: Asset URL
+        """
+        body = data.read()
+        self._simulate_io(len(body))
+
+        with self._lock:
+            self._objects[key] = (body, content_type)
+
+        return self.get_asset_url(key)
+
+    def upload_asset_async(
+        self,
+        key: str,
+        data: BinaryIO,
+        content_type: str = "image/png"
+    ) -> "Future[str]":
+        """
+        Store asset in the shared storage I/O pool.
+
+        Args:
+            key: Storage key
+            data: File-like object
+            content_type: MIME type
+
+        Returns:
+            Future resolving to the asset URL
+        """
+        return get_storage_executor().submit(self.upload_asset, key, data, content_type)
+
+    @contextmanager
+    def open_asset_writer(
+        self,
+        key: str,
+        content_type: str = "image/png"
+    ) -> Iterator[AssetWriter]:
+        """
+        Buffer a streamed asset, stored only if the block succeeds.
+
+        Args:
+            key: Storage key
+            content_type: MIME type
+
+        Yields:
+            Writable buffer
+        """
+        buffer = BytesIO()
+        yield buffer
+        buffer.seek(0)
+        self.upload_asset(key, buffer, content_type)
+
+    def asset_exists(self, key: str) -> bool:
+        """
+        Check if asset exists.
+
+        Args:
+            key: Storage key
+
+        Returns:
+            bool: True if stored
+        """
+        self._simulate_io(0)
+        with self._lock:
+            return key in self._objects
+
+    def get_asset_url(self, key: str) -> str:
+        """
+        Get URL for a storage key (no I/O).
+
+        Args:
+            key: Storage key
+
+        Returns:
+            str: {base_url}/{key}
+        """
+        return f"{self.base_url}/{key}"
+
+    def get_asset(self, key: str) -> Optional[bytes]:
+        """
+        Get stored bytes (test/benchmark helper, not part of the interface).
+
+        Args:
+            key: Storage key
+
+        Returns:
+            Stored bytes, or None if missing
+        """
+        with self._lock:
+            stored = self._objects.get(key)
+        return stored[0] if stored else None
+
+    def list_assets(self, prefix: str) -> List[str]:
+        """
+        List stored keys under a prefix (one simulated round trip).
+
+        Args:
+            prefix: Key prefix
+
+        Returns:
+            Matching storage keys
+        """
+        self._simulate_io(0)
+        with self._lock:
+            return [key for key in self._objects if key.startswith(prefix)]
+
+    def delete_assets(self, keys: List[str]) -> int:
+        """
+        Delete assets (one simulated round trip, like S3 DeleteObjects).
+
+        Args:
+            keys: Storage keys
+
+        Returns:
+            int: Number of assets deleted
+        """
+        self._simulate_io(0)
+        with self._lock:
+            return sum(self._objects.pop(key, None) is not None for key in keys)
+
+    def delete_design_assets(self, design_id: str) -> bool:
+        """
+        Delete every asset under designs/{design_id}/.
+
+        Args:
+            design_id: Design ID
+
+        Returns:
+            bool: True if any asset was deleted
+        """
+        prefix = f"designs/{design_id}/"
+        with self._lock:
+            keys = [key for key in self._objects if key.startswith(prefix)]
+        return self.delete_assets(keys) > 0
+
+    def __len__(self) -> int:
+        """Number of stored assets."""
+        with self._lock:
+            return len(self._objects)
+
+    def _simulate_io(self, size: int) -> None:
+        """Sleep for the configured round trip plus transfer time."""
+        delay = self.latency
+        if self.bandwidth:
+            delay += size / self.bandwidth
+        if delay > 0:
+            time.sleep(delay)
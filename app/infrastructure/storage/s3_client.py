@@ -1,26 +1,35 @@
 """AWS S3 client for file storage."""
 
+import os
+import threading
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional, BinaryIO
+from typing import List, Optional, BinaryIO
 import logging
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Max keys per DeleteObjects request (S3 API limit)
+S3_DELETE_BATCH_LIMIT = 1000
+
 
 class S3Client:
     """
     AWS S3 client wrapper.
     
     Handles file uploads, downloads, and URL generation for S3 storage.
-    Thread-safe singleton for use in Celery workers.
+    Thread-safe; get one per process with get_s3_client() (boto3 clients
+    must not be shared across fork).
     """
     
     def __init__(self):
         """
         Initialize S3 client with credentials from settings.
         
+        No network I/O: the connection pool is filled on first request.
+        
         Raises:
             ValueError: If AWS credentials not configured when USE_LOCAL_STORAGE=false
         """
@@ -41,44 +50,46 @@ class S3Client:
             region_name=settings.AWS_REGION,
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=Config(
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,  # >= STORAGE_IO_WORKERS
+                tcp_keepalive=True,
+                connect_timeout=settings.S3_CONNECT_TIMEOUT,
+                read_timeout=settings.S3_READ_TIMEOUT,
+                retries={'max_attempts': settings.S3_MAX_ATTEMPTS, 'mode': 'standard'},
+            ),
         )
         self.bucket = settings.S3_BUCKET_NAME
         logger.info(f"Initialized S3 client for bucket: {self.bucket}")
-        
-        # Verify bucket exists and is accessible
-        self._verify_bucket()
     
-    def _verify_bucket(self):
+    def verify_bucket(self) -> None:
         """
-        Verify S3 bucket exists and is accessible.
+        Verify S3 bucket exists and is accessible (HEAD bucket).
         
-        Logs warning if bucket not accessible but doesn't raise exception
-        to allow app to start even if S3 is temporarily unavailable.
+        Raises:
+            ClientError: If bucket is missing or not accessible
         """
-        try:
-            self.s3.head_bucket(Bucket=self.bucket)
-            logger.info(f"✅ S3 bucket verified: {self.bucket}")
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            logger.warning(f"⚠️ S3 bucket not accessible: {error_code} - {e}")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to verify S3 bucket: {e}")
+        self.s3.head_bucket(Bucket=self.bucket)
     
     def upload_file(
         self,
         file_data: BinaryIO,
         key: str,
         content_type: str = "image/png",
-        metadata: Optional[dict] = None
+        metadata: Optional[dict] = None,
+        cache_control: Optional[str] = None
     ) -> str:
         """
         Upload file to S3.
         
+        S3 returns a strong ETag for every object, so clients revalidate
+        with If-None-Match against the bucket/CDN.
+        
         Args:
             file_data: File-like object (bytes)
             key: S3 object key (path/to/file.png)
             content_type: MIME type (default: image/png)
             metadata: Optional metadata dict (stored as S3 object metadata)
+            cache_control: Optional Cache-Control header stored on the object
         
         Returns:
             str: Public URL of uploaded file
@@ -88,7 +99,7 @@ class S3Client:
         
         Example:
             >>> with open('image.png', 'rb') as f:
-            >>>     url = s3_client.upload_file(f, 'designs/123/preview.png')
+            >>>     url = get_s3_client().upload_file(f, 'designs/123/preview.png')
         """
         try:
             extra_args = {
@@ -99,6 +110,9 @@ class S3Client:
             if metadata:
                 extra_args['Metadata'] = metadata
             
+            if cache_control:
+                extra_args['CacheControl'] = cache_control
+            
             # Make public if configured
             if settings.S3_PUBLIC_BUCKET:
                 extra_args['ACL'] = 'public-read'
@@ -112,7 +126,7 @@ class S3Client:
             )
             
             # Generate URL
-            url = self._get_public_url(key)
+            url = self.get_public_url(key)
             
             logger.info(f"Uploaded file to S3: {key}")
             return url
@@ -125,6 +139,41 @@ class S3Client:
             logger.error(f"Unexpected error uploading to S3: {e}", exc_info=True)
             raise
     
+    def open_multipart_upload(
+        self,
+        key: str,
+        content_type: str = "image/png",
+        cache_control: Optional[str] = None
+    ) -> "S3MultipartWriter":
+        """
+        Start a multipart upload written through a file-like writer.
+        
+        Use for outputs too large to buffer (print renders): parts are
+        uploaded as soon as S3_MULTIPART_PART_SIZE bytes are written.
+        
+        Args:
+            key: S3 object key
+            content_type: MIME type (default: image/png)
+            cache_control: Optional Cache-Control header stored on the object
+        
+        Returns:
+            S3MultipartWriter: call complete() on success, abort() on error
+        
+        Example:
+            >>> writer = get_s3_client().open_multipart_upload('renders/abc/print-300dpi.png')
+            >>> writer.write(data)
+            >>> url = writer.complete()
+        """
+        extra_args = {'ContentType': content_type}
+        if cache_control:
+            extra_args['CacheControl'] = cache_control
+        if settings.S3_PUBLIC_BUCKET:
+            extra_args['ACL'] = 'public-read'
+        
+        response = self.s3.create_multipart_upload(Bucket=self.bucket, Key=key, **extra_args)
+        logger.info(f"Started multipart upload to S3: {key}")
+        return S3MultipartWriter(self, key, response['UploadId'])
+    
     def upload_from_path(
         self,
         file_path: str,
@@ -159,7 +208,7 @@ class S3Client:
             bool: True if deleted successfully, False otherwise
         
         Example:
-            >>> s3_client.delete_file('designs/123/preview.png')
+            >>> get_s3_client().delete_file('designs/123/preview.png')
         """
         try:
             self.s3.delete_object(Bucket=self.bucket, Key=key)
@@ -173,6 +222,62 @@ class S3Client:
             logger.error(f"Unexpected error deleting from S3: {e}")
             return False
     
+    def list_keys(self, prefix: str) -> List[str]:
+        """
+        List object keys under a prefix (ListObjectsV2, 1000 keys per page).
+        
+        Args:
+            prefix: Key prefix
+        
+        Returns:
+            List of S3 object keys
+        
+        Example:
+            >>> get_s3_client().list_keys('renders/3f1c.../')
+            ['renders/3f1c.../preview-s600.png', 'renders/3f1c.../thumbnail-s200.png']
+        """
+        keys: List[str] = []
+        paginator = self.s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            keys.extend(obj['Key'] for obj in page.get('Contents', []))
+        return keys
+    
+    def delete_files(self, keys: List[str]) -> int:
+        """
+        Delete many files with DeleteObjects (up to 1000 keys per request).
+        
+        Args:
+            keys: S3 object keys
+        
+        Returns:
+            int: Number of keys deleted (S3 reports missing keys as deleted)
+        
+        Example:
+            >>> get_s3_client().delete_files(['designs/123/preview.png', 'designs/123/thumbnail.png'])
+            2
+        """
+        deleted = 0
+        for start in range(0, len(keys), S3_DELETE_BATCH_LIMIT):
+            batch = keys[start:start + S3_DELETE_BATCH_LIMIT]
+            try:
+                response = self.s3.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                logger.error(f"Failed to delete {len(batch)} files from S3: {error_code} - {e}")
+                continue
+            
+            # Quiet mode only lists failures
+            errors = response.get('Errors', [])
+            for error in errors:
+                logger.error(f"Failed to delete file from S3: {error.get('Key')} - {error.get('Code')}")
+            deleted += len(batch) - len(errors)
+        
+        logger.info(f"Deleted {deleted}/{len(keys)} files from S3")
+        return deleted
+    
     def get_signed_url(
         self,
         key: str,
@@ -194,7 +299,7 @@ class S3Client:
             ClientError: If URL generation fails
         
         Example:
-            >>> url = s3_client.get_signed_url('private/file.pdf', expiration=300)
+            >>> url = get_s3_client().get_signed_url('private/file.pdf', expiration=300)
         """
         try:
             url = self.s3.generate_presigned_url(
@@ -208,7 +313,7 @@ class S3Client:
             logger.error(f"Failed to generate signed URL: {e}")
             raise
     
-    def _get_public_url(self, key: str) -> str:
+    def get_public_url(self, key: str) -> str:
         """
         Get public URL for object.
         
@@ -233,7 +338,7 @@ class S3Client:
             bool: True if file exists, False otherwise
         
         Example:
-            >>> if s3_client.file_exists('designs/123/preview.png'):
+            >>> if get_s3_client().file_exists('designs/123/preview.png'):
             >>>     print('File exists!')
         """
         try:
@@ -246,6 +351,122 @@ class S3Client:
             return False
 
 
-# Singleton instance
-# Import this in workers/tasks to avoid re-creating client
-s3_client = S3Client()
+class S3MultipartWriter:
+    """
+    Write-only stream backed by an S3 multipart upload.
+    
+    Holds at most one part (S3_MULTIPART_PART_SIZE bytes) in memory.
+    """
+    
+    def __init__(self, client: S3Client, key: str, upload_id: str):
+        """
+        Initialize writer for a started multipart upload.
+        
+        Args:
+            client: S3 client wrapper
+            key: S3 object key
+            upload_id: Multipart upload ID
+        """
+        self.client = client
+        self.key = key
+        self.upload_id = upload_id
+        self.part_size = settings.S3_MULTIPART_PART_SIZE
+        self._buffer = bytearray()
+        self._parts: List[dict] = []
+    
+    def write(self, data: bytes) -> int:
+        """
+        Buffer data, uploading a part whenever a full part is available.
+        
+        Args:
+            data: Bytes to append
+        
+        Returns:
+            int: Number of bytes written
+        """
+        self._buffer += data
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+        return len(data)
+    
+    def complete(self) -> str:
+        """
+        Upload the last part and assemble the object.
+        
+        Returns:
+            str: Public URL of uploaded object
+        """
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        
+        self.client.s3.complete_multipart_upload(
+            Bucket=self.client.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={'Parts': self._parts}
+        )
+        logger.info(f"Completed multipart upload to S3: {self.key} ({len(self._parts)} parts)")
+        return self.client.get_public_url(self.key)
+    
+    def abort(self) -> None:
+        """Abort the upload so S3 discards already uploaded parts."""
+        try:
+            self.client.s3.abort_multipart_upload(
+                Bucket=self.client.bucket,
+                Key=self.key,
+                UploadId=self.upload_id
+            )
+            logger.warning(f"Aborted multipart upload to S3: {self.key}")
+        except ClientError as e:
+            logger.error(f"Failed to abort multipart upload {self.key}: {e}")
+    
+    def _upload_part(self, data: bytes) -> None:
+        """Upload one part (parts are numbered from 1)."""
+        part_number = len(self._parts) + 1
+        response = self.client.s3.upload_part(
+            Bucket=self.client.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=data
+        )
+        self._parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+
+
+_s3_client: Optional[S3Client] = None
+_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's client (and its pooled sockets) in a forked child."""
+    global _s3_client, _lock
+    _s3_client = None
+    _lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_s3_client() -> S3Client:
+    """
+    Get this process's S3 client (created on first use).
+    
+    Nothing is built at import time, so API/test startup never touches
+    AWS, and each Celery child builds its own client after fork.
+    
+    Returns:
+        S3Client: Per-process client
+    
+    Example:
+        >>> url = get_s3_client().upload_file(f, 'designs/123/preview.png')
+    """
+    global _s3_client
+    
+    if _s3_client is None:
+        with _lock:
+            if _s3_client is None:
+                _s3_client = S3Client()
+    
+    return _s3_client
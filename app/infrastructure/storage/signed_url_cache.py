@@ -0,0 +1,239 @@
+"""
+Cache of pre-signed S3 URLs for private buckets.
+
+With S3_PUBLIC_BUCKET=false every asset URL returned by the API must be
+pre-signed, and signing costs an HMAC per URL (200 per design list page).
+Signatures are cached per (object key, expiry bucket): time is split into
+windows of SIGNED_URL_EXPIRATION - SIGNED_URL_SAFETY_MARGIN seconds, and a
+URL signed anywhere inside a window stays valid until at least the safety
+margin after the window ends. Every request in a window therefore gets the
+same URL (stable for browser caching), and no cached URL is ever handed out
+with less than the safety margin left.
+
+Entries live in a per-process LRU, with an optional Redis tier shared by
+every API process (SIGNED_URL_REDIS_CACHE=true).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.infrastructure.storage.s3_client import get_s3_client
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY_PREFIX = "signed_url"
+
+
+class SignedUrlCache:
+    """
+    Two-tier cache of pre-signed URLs keyed by (object key, expiry bucket).
+
+    The in-process tier is a bounded LRU; entries of past buckets are never
+    looked up again and age out of it. The Redis tier (optional) expires
+    entries when their bucket ends.
+    """
+
+    def __init__(
+        self,
+        sign: Callable[[str, int], str],
+        expiration: int = settings.SIGNED_URL_EXPIRATION,
+        safety_margin: int = settings.SIGNED_URL_SAFETY_MARGIN,
+        max_entries: int = settings.SIGNED_URL_CACHE_SIZE,
+        redis: Optional[Redis] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            sign: Signer (key, expiration seconds) -> URL, e.g. S3Client.get_signed_url
+            expiration: Lifetime of each signature in seconds
+            safety_margin: Minimum validity left on any URL handed out (seconds)
+            max_entries: Max URLs kept in the in-process tier
+            redis: Async Redis client for the shared tier (None = in-process only)
+            clock: Time source (seconds since epoch)
+
+        Raises:
+            ValueError: If safety_margin is not smaller than expiration
+        """
+        if not 0 <= safety_margin < expiration:
+            raise ValueError(
+                f"Signed URL safety margin ({safety_margin}s) must be smaller "
+                f"than the expiration ({expiration}s)"
+            )
+
+        self.sign = sign
+        self.expiration = expiration
+        self.window = expiration - safety_margin
+        self.max_entries = max_entries
+        self.redis = redis
+        self.clock = clock
+        self._entries: "OrderedDict[Tuple[str, int], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Get signed URLs for object keys (signing only cache misses).
+
+        Redis is consulted with a single MGET for keys missing in process;
+        Redis errors fall back to signing locally.
+
+        Args:
+            keys: S3 object keys
+
+        Returns:
+            Dict mapping each key to its signed URL
+        """
+        now = self.clock()
+        bucket = int(now // self.window)
+        urls: Dict[str, str] = {}
+        missing: List[str] = []
+
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                url = self._entries.get((key, bucket))
+                if url is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end((key, bucket))
+                    urls[key] = url
+
+        if not missing:
+            return urls
+
+        shared = await self._redis_get(missing, bucket)
+        signed = {}
+        for key in missing:
+            url = shared.get(key)
+            if url is None:
+                url = signed[key] = self.sign(key, self.expiration)
+            urls[key] = url
+
+        with self._lock:
+            for key in missing:
+                self._entries[(key, bucket)] = urls[key]
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+        if signed:
+            # Expire shared entries with their bucket
+            ttl = max(1, int((bucket + 1) * self.window - now))
+            await self._redis_set(signed, bucket, ttl)
+
+        return urls
+
+    async def get(self, key: str) -> str:
+        """
+        Get signed URL for one object key.
+
+        Args:
+            key: S3 object key
+
+        Returns:
+            str: Signed URL
+        """
+        return (await self.get_many([key]))[key]
+
+    def clear(self) -> None:
+        """Drop every in-process entry (the Redis tier is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _redis_key(key: str, bucket: int) -> str:
+        """Build shared-tier key."""
+        return f"{REDIS_KEY_PREFIX}:{bucket}:{key}"
+
+    async def _redis_get(self, keys: List[str], bucket: int) -> Dict[str, str]:
+        """Look up keys in the shared tier (empty dict if disabled or down)."""
+        if self.redis is None:
+            return {}
+
+        try:
+            values = await self.redis.mget([self._redis_key(key, bucket) for key in keys])
+        except RedisError as e:
+            logger.warning(f"Signed URL cache lookup failed, signing locally: {e}")
+            return {}
+
+        return {
+            key: value.decode() if isinstance(value, bytes) else value
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    async def _redis_set(self, urls: Dict[str, str], bucket: int, ttl: int) -> None:
+        """Store freshly signed URLs in the shared tier (best effort)."""
+        if self.redis is None:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, url in urls.items():
+                    pipe.set(self._redis_key(key, bucket), url, ex=ttl)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Signed URL cache store failed: {e}")
+
+
+@lru_cache(maxsize=None)
+def get_signed_url_cache() -> SignedUrlCache:
+    """
+    Get the signed URL cache (cached, one per process).
+
+    Returns:
+        SignedUrlCache signing with this process's S3 client
+    """
+    redis = None
+    if settings.SIGNED_URL_REDIS_CACHE:
+        redis = Redis.from_url(str(settings.REDIS_URL), socket_timeout=1)
+
+    return SignedUrlCache(
+        sign=lambda key, expiration: get_s3_client().get_signed_url(key, expiration),
+        redis=redis,
+    )
+
+
+def asset_key_from_url(url: str) -> Optional[str]:
+    """
+    Get S3 object key from a stored public asset URL.
+
+    Args:
+        url: URL as stored on the design (see S3Client.get_public_url)
+
+    Returns:
+        Object key, or None if the URL does not point into the bucket
+    """
+    prefix = f"{settings.s3_base_url}/"
+    if url.startswith(prefix):
+        return url[len(prefix):]
+    return None
+
+
+async def sign_asset_urls(urls: List[Optional[str]]) -> List[Optional[str]]:
+    """
+    Turn stored asset URLs into URLs clients can fetch.
+
+    Public buckets and local storage serve stored URLs as-is; for private
+    buckets every bucket URL is replaced by a (cached) pre-signed URL.
+
+    Args:
+        urls: Stored asset URLs (None entries are kept)
+
+    Returns:
+        URLs in the same order
+    """
+    if settings.USE_LOCAL_STORAGE or settings.S3_PUBLIC_BUCKET:
+        return list(urls)
+
+    keys = [asset_key_from_url(url) if url else None for url in urls]
+    signed = await get_signed_url_cache().get_many(key for key in keys if key)
+
+    return [signed[key] if key else url for key, url in zip(keys, urls)]
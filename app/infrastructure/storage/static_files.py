@@ -0,0 +1,261 @@
+"""
+Static file serving for local storage (development).
+
+Mirrors the S3 object headers: content-addressed assets are served with
+an immutable Cache-Control, everything else must be revalidated. Responses
+carry a strong ETag derived from the file content (hashed once per file
+version), answer If-None-Match / If-Modified-Since with 304, support single
+byte ranges (206 / 416) and use the ASGI zero-copy send extension (sendfile)
+when the server provides it.
+"""
+
+import hashlib
+import os
+import re
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from functools import lru_cache
+from mimetypes import guess_type
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Receive, Scope, Send
+
+from app.infrastructure.storage.cache_control import cache_control_for
+
+# Files hashed per process (keyed by path, mtime and size)
+ETAG_CACHE_SIZE = 4096
+CHUNK_SIZE = 64 * 1024
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+ByteRange = Tuple[int, int]  # (first, last) inclusive
+
+
+@lru_cache(maxsize=ETAG_CACHE_SIZE)
+def _content_etag(path: str, mtime_ns: int, size: int) -> str:
+    """Hash file content into a strong ETag (mtime/size only key the cache)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def content_etag(path: str, stat_result: os.stat_result) -> str:
+    """
+    Get strong ETag for a file version.
+
+    Args:
+        path: File path
+        stat_result: File stat (a rewrite changes mtime or size, so the hash
+            is recomputed)
+
+    Returns:
+        str: Quoted ETag
+    """
+    return _content_etag(str(path), stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def parse_range(header: str, size: int) -> Optional[ByteRange]:
+    """
+    Parse a single-range Range header.
+
+    Args:
+        header: Range header value (bytes=first-last, bytes=first-, bytes=-suffix)
+        size: File size in bytes
+
+    Returns:
+        (first, last) inclusive, or None if the header is not a single byte
+        range (the full file is served instead)
+
+    Raises:
+        ValueError: If the range is syntactically valid but unsatisfiable
+    """
+    match = _RANGE_RE.match(header.strip())
+    if match is None:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range: {header}")
+        return max(0, size - suffix), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None  # Invalid range spec: ignore the header
+    if start >= size:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+class AssetFileResponse(Response):
+    """
+    File response with content ETag, conditional GET and byte ranges.
+
+    The conditional and range decisions need the ETag, which may need a
+    hash of the file, so they are made in __call__ (hashing runs in a
+    worker thread, never on the event loop).
+    """
+
+    def __init__(self, path: str, stat_result: os.stat_result, cache_control: str):
+        """
+        Initialize response.
+
+        Args:
+            path: File path
+            stat_result: File stat
+            cache_control: Cache-Control header value
+        """
+        self.path = path
+        self.stat_result = stat_result
+        self.status_code = 200
+        self.background = None
+        self.media_type = guess_type(str(path))[0] or "application/octet-stream"
+        self.init_headers({
+            "cache-control": cache_control,
+            "accept-ranges": "bytes",
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        })
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Send 304, 416, 206 or 200 depending on the request headers."""
+        size = self.stat_result.st_size
+        request_headers = Headers(scope=scope)
+        etag = await anyio.to_thread.run_sync(content_etag, self.path, self.stat_result)
+        self.headers["etag"] = etag
+
+        if self._not_modified(request_headers, etag):
+            del self.headers["content-type"]
+            await self._send_start(send, 304)
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        byte_range = None
+        if "range" in request_headers and self._if_range_matches(request_headers, etag):
+            try:
+                byte_range = parse_range(request_headers["range"], size)
+            except ValueError:
+                self.headers["content-range"] = f"bytes */{size}"
+                self.headers["content-length"] = "0"
+                await self._send_start(send, 416)
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+        first, last = byte_range or (0, size - 1)
+        length = last - first + 1
+        self.headers["content-length"] = str(length)
+        if byte_range is not None:
+            self.headers["content-range"] = f"bytes {first}-{last}/{size}"
+
+        await self._send_start(send, 206 if byte_range is not None else 200)
+
+        if scope["method"].upper() == "HEAD" or length == 0:
+            await send({"type": "http.response.body", "body": b""})
+        elif "http.response.zerocopysend" in scope.get("extensions", {}):
+            await self._send_zerocopy(send, first, length)
+        else:
+            await self._send_chunks(send, first, length)
+
+    def _not_modified(self, request_headers: Headers, etag: str) -> bool:
+        """Evaluate If-None-Match (weak comparison), else If-Modified-Since."""
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags
+
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return int(self.stat_result.st_mtime) <= since
+
+        return False
+
+    def _if_range_matches(self, request_headers: Headers, etag: str) -> bool:
+        """Check If-Range (strong ETag or exact date); absent means match."""
+        if_range = request_headers.get("if-range")
+        if if_range is None:
+            return True
+        if if_range.startswith(('"', "W/")):
+            return if_range == etag
+        return if_range == self.headers["last-modified"]
+
+    async def _send_start(self, send: Send, status_code: int) -> None:
+        """Send response start with the current headers."""
+        self.status_code = status_code
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": self.raw_headers,
+        })
+
+    async def _send_zerocopy(self, send: Send, offset: int, count: int) -> None:
+        """Send the byte range with the server's sendfile extension."""
+        fd = await anyio.to_thread.run_sync(os.open, self.path, os.O_RDONLY)
+        try:
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": fd,
+                "offset": offset,
+                "count": count,
+            })
+        finally:
+            os.close(fd)
+
+    async def _send_chunks(self, send: Send, offset: int, count: int) -> None:
+        """Send the byte range in chunks read off the event loop."""
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(offset)
+            remaining = count
+            while remaining > 0:
+                chunk = await file.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break  # File truncated while serving
+                remaining -= len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                })
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b""})
+
+
+class AssetStaticFiles(StaticFiles):
+    """StaticFiles serving AssetFileResponse with Cache-Control per storage key."""
+
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """
+        Build asset response (conditionals and ranges resolved when sent).
+
+        Args:
+            full_path: File path on disk
+            stat_result: File stat
+            scope: ASGI scope
+            status_code: Response status (only 200 is used for static files)
+
+        Returns:
+            Response: AssetFileResponse
+        """
+        if not stat.S_ISREG(stat_result.st_mode):
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        key = self.get_path(scope).replace(os.sep, "/")
+        return AssetFileResponse(str(full_path), stat_result, cache_control_for(key))
@@ -1,9 +1,13 @@
 """Storage repository implementation using AWS S3."""
 
-from typing import BinaryIO
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List
 import logging
-from app.domain.repositories.storage_repository import IStorageRepository
-from app.infrastructure.storage.s3_client import s3_client
+from app.domain.repositories.storage_repository import AssetWriter, IStorageRepository
+from app.infrastructure.storage.cache_control import MUTABLE_CACHE_CONTROL, cache_control_for
+from app.infrastructure.storage.executor import get_storage_executor
+from app.infrastructure.storage.s3_client import get_s3_client
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +17,7 @@ class StorageRepositoryImpl(IStorageRepository):
     S3 storage repository implementation.
     
     Implements IStorageRepository interface using AWS S3.
-    Uses s3_client singleton for all operations.
+    Uses the per-process S3 client (get_s3_client) for all operations.
     """
     
     def upload_design_preview(
@@ -36,14 +40,15 @@ class StorageRepositoryImpl(IStorageRepository):
         key = f"designs/{design_id}/preview.png"
         
         try:
-            url = s3_client.upload_file(
+            url = get_s3_client().upload_file(
                 file_data=image_data,
                 key=key,
                 content_type="image/png",
                 metadata={
                     "design_id": design_id,
                     "type": "preview"
-                }
+                },
+                cache_control=MUTABLE_CACHE_CONTROL  # Overwritten on re-render
             )
             logger.info(f"Uploaded design preview: {design_id}")
             return url
@@ -72,14 +77,15 @@ class StorageRepositoryImpl(IStorageRepository):
         key = f"designs/{design_id}/thumbnail.png"
         
         try:
-            url = s3_client.upload_file(
+            url = get_s3_client().upload_file(
                 file_data=image_data,
                 key=key,
                 content_type="image/png",
                 metadata={
                     "design_id": design_id,
                     "type": "thumbnail"
-                }
+                },
+                cache_control=MUTABLE_CACHE_CONTROL  # Overwritten on re-render
             )
             logger.info(f"Uploaded design thumbnail: {design_id}")
             return url
@@ -88,6 +94,131 @@ class StorageRepositoryImpl(IStorageRepository):
             logger.error(f"Failed to upload thumbnail for design {design_id}: {e}")
             raise
     
+    def upload_asset(
+        self,
+        key: str,
+        data: BinaryIO,
+        content_type: str = "image/png"
+    ) -> str:
+        """
+        Upload asset to S3 under an explicit key.
+        
+        Content-addressed keys (renders/...) are stored with an immutable
+        Cache-Control (see cache_control_for).
+        
+        Args:
+            key: S3 object key
+            data: File-like object
+            content_type: MIME type (default: image/png)
+        
+        Returns:
+            str: Public URL of uploaded asset
+        """
+        try:
+            url = get_s3_client().upload_file(
+                file_data=data,
+                key=key,
+                content_type=content_type,
+                cache_control=cache_control_for(key),
+            )
+            logger.info(f"Uploaded asset: {key}")
+            return url
+        
+        except Exception as e:
+            logger.error(f"Failed to upload asset {key}: {e}")
+            raise
+    
+    def upload_asset_async(
+        self,
+        key: str,
+        data: BinaryIO,
+        content_type: str = "image/png"
+    ) -> "Future[str]":
+        """
+        Upload asset to S3 in the shared storage I/O pool.
+        
+        Args:
+            key: Storage key
+            data: File-like object
+            content_type: MIME type
+        
+        Returns:
+            Future resolving to the asset URL
+        """
+        return get_storage_executor().submit(self.upload_asset, key, data, content_type)
+    
+    @contextmanager
+    def open_asset_writer(
+        self,
+        key: str,
+        content_type: str = "image/png"
+    ) -> Iterator[AssetWriter]:
+        """
+        Stream an asset to S3 as a multipart upload.
+        
+        Args:
+            key: S3 object key
+            content_type: MIME type
+        
+        Yields:
+            Writable stream (parts upload while writing)
+        """
+        writer = get_s3_client().open_multipart_upload(key, content_type, cache_control_for(key))
+        try:
+            yield writer
+        except Exception:
+            writer.abort()
+            raise
+        writer.complete()
+    
+    def asset_exists(self, key: str) -> bool:
+        """
+        Check if asset exists in S3 (HEAD request).
+        
+        Args:
+            key: S3 object key
+        
+        Returns:
+            bool: True if object exists
+        """
+        return get_s3_client().file_exists(key)
+    
+    def get_asset_url(self, key: str) -> str:
+        """
+        Get public URL for an S3 key (CloudFront if configured).
+        
+        Args:
+            key: S3 object key
+        
+        Returns:
+            str: Public URL
+        """
+        return get_s3_client().get_public_url(key)
+    
+    def list_assets(self, prefix: str) -> List[str]:
+        """
+        List S3 object keys under a prefix.
+        
+        Args:
+            prefix: Key prefix
+        
+        Returns:
+            S3 object keys
+        """
+        return get_s3_client().list_keys(prefix)
+    
+    def delete_assets(self, keys: List[str]) -> int:
+        """
+        Delete S3 objects in DeleteObjects batches of up to 1000 keys.
+        
+        Args:
+            keys: S3 object keys
+        
+        Returns:
+            int: Number of keys deleted
+        """
+        return get_s3_client().delete_files(keys)
+    
     def delete_design_assets(self, design_id: str) -> bool:
         """
         Delete all S3 assets for a design.
@@ -103,19 +234,20 @@ class StorageRepositoryImpl(IStorageRepository):
             bool: True if all assets deleted successfully
         """
         try:
-            preview_key = f"designs/{design_id}/preview.png"
-            thumbnail_key = f"designs/{design_id}/thumbnail.png"
+            keys = [
+                f"designs/{design_id}/preview.png",
+                f"designs/{design_id}/thumbnail.png",
+            ]
             
-            preview_deleted = s3_client.delete_file(preview_key)
-            thumbnail_deleted = s3_client.delete_file(thumbnail_key)
+            # One DeleteObjects request for both keys
+            deleted = self.delete_assets(keys)
             
-            if preview_deleted and thumbnail_deleted:
+            if deleted == len(keys):
                 logger.info(f"Deleted all assets for design: {design_id}")
                 return True
             else:
                 logger.warning(
-                    f"Partial deletion for design {design_id}: "
-                    f"preview={preview_deleted}, thumbnail={thumbnail_deleted}"
+                    f"Partial deletion for design {design_id}: {deleted}/{len(keys)} deleted"
                 )
                 return False
         
@@ -1,6 +1,7 @@
 """Celery application configuration."""
 
 from celery import Celery
+from celery.signals import celeryd_init, worker_process_init, worker_process_shutdown
 from app.config import settings
 
 # Create Celery app with explicit task includes
@@ -10,6 +11,8 @@ celery_app = Celery(
     backend=settings.celery_database_url,  # PostgreSQL sync driver
     include=[
         "app.infrastructure.workers.tasks.render_design",
+        "app.infrastructure.workers.tasks.render_print",
+        "app.infrastructure.workers.tasks.cleanup_assets",
         "app.infrastructure.workers.tasks.send_email",
     ]
 )
@@ -38,6 +41,9 @@ celery_app.conf.update(
     # Task routing - USE EXACT TASK NAMES, NOT MODULE PATHS
     task_routes={
         "render_design_preview": {"queue": "high_priority"},
+        "render_design_previews_batch": {"queue": "default"},
+        "render_design_print": {"queue": "default"},
+        "collect_orphan_assets": {"queue": "default"},
         "send_email": {"queue": "default"},
         "debug_task": {"queue": "default"},
     },
@@ -63,6 +69,14 @@ celery_app.conf.update(
     task_retry_jitter=True,  # Add random jitter to prevent thundering herd
 )
 
+# Periodic tasks (run `celery beat`, or a worker with -B in development)
+celery_app.conf.beat_schedule = {
+    "collect-orphan-assets": {
+        "task": "collect_orphan_assets",
+        "schedule": settings.ASSET_GC_INTERVAL_SECONDS,
+    },
+}
+
 # Task annotations (per-task config overrides)
 celery_app.conf.task_annotations = {
     "render_design_preview": {
@@ -74,6 +88,103 @@ celery_app.conf.task_annotations = {
 }
 
 
+@worker_process_init.connect
+def warm_up_worker_process(**kwargs):
+    """
+    Pay per-process lazy costs before the first task, not during it.
+    
+    Runs in every forked child (including children recycled after
+    worker_max_tasks_per_child): opens DB connections, loads fonts,
+    registers PIL encoders and initializes the storage client. A failing
+    step is logged and skipped; the task will retry it lazily.
+    """
+    from app.infrastructure.rendering.timings import StageTimer
+    from app.infrastructure.workers.logging_config import logger
+    from app.infrastructure.workers.metrics import record_warmup_timings
+    
+    timer = StageTimer()
+    steps = [
+        ("db_pool", _warm_up_db_pool),
+        ("fonts", _warm_up_fonts),
+        ("pil_encoders", _warm_up_pil_encoders),
+        ("storage", _warm_up_storage),
+    ]
+    
+    for step, warm_up in steps:
+        try:
+            with timer.stage(step):
+                warm_up()
+        except Exception as e:
+            logger.warning(f"Worker warm-up step {step} failed: {e}")
+    
+    timings_ms = record_warmup_timings(timer)
+    logger.info(f"Worker process warmed up in {timings_ms['total']:.0f}ms", extra={
+        "timings_ms": timings_ms
+    })
+
+
+def _warm_up_db_pool():
+    """Drop connections inherited from the parent, then pre-open new ones."""
+    from sqlalchemy import text
+    from app.infrastructure.database.sync_session import sync_engine
+    
+    # Sockets inherited through fork belong to the parent process
+    sync_engine.dispose(close=False)
+    
+    connections = []
+    try:
+        for _ in range(settings.WORKER_WARMUP_DB_CONNECTIONS):
+            connection = sync_engine.connect()
+            connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    finally:
+        # Back to the pool (kept open for the first tasks)
+        for connection in connections:
+            connection.close()
+
+
+def _warm_up_fonts():
+    """Read font files and build FreeType objects for the default preview size."""
+    from app.infrastructure.rendering.font_registry import FONT_FILES, font_registry
+    
+    font_registry.preload()
+    for font_name in FONT_FILES:
+        font_registry.get_font(font_name, 48)
+
+
+def _warm_up_pil_encoders():
+    """Register PIL plugins and run each configured encoder once."""
+    from PIL import Image
+    from app.infrastructure.rendering.variants import RENDER_VARIANTS, encode_variant
+    
+    Image.init()
+    image = Image.new("RGB", (8, 8))
+    for spec in RENDER_VARIANTS:
+        encode_variant(image, spec)
+
+
+def _warm_up_storage():
+    """Create the storage client and open its connection (one HEAD request)."""
+    from app.infrastructure.storage import get_storage_repository
+    
+    get_storage_repository().asset_exists("renders/.warmup")
+
+
+@celeryd_init.connect
+def start_metrics_server(**kwargs):
+    """Expose worker Prometheus metrics from the main worker process."""
+    from app.infrastructure.workers.metrics import start_worker_metrics_server
+    start_worker_metrics_server()
+
+
+@worker_process_shutdown.connect
+def cleanup_process_metrics(pid=None, **kwargs):
+    """Release an exiting pool child's multiprocess metric files."""
+    import os
+    from app.infrastructure.workers.metrics import mark_worker_process_dead
+    mark_worker_process_dead(pid or os.getpid())
+
+
 @celery_app.task(bind=True, name="debug_task")
 def debug_task(self):
     """Debug task to test Celery is working."""
@@ -0,0 +1,124 @@
+"""
+Prometheus metrics for Celery workers.
+
+Render tasks record per-stage durations (claim, draw, encode, upload, ...)
+into histograms. Workers expose them on WORKER_METRICS_PORT (0 = disabled).
+
+With the prefork pool, tasks run in child processes: set the
+PROMETHEUS_MULTIPROC_DIR env var so children write their samples to that
+directory and the main process aggregates them when scraped. Without it,
+only metrics from the serving process are visible (fine for --pool=solo
+or --pool=threads).
+"""
+
+import os
+import shutil
+from typing import Dict
+
+from prometheus_client import CollectorRegistry, Histogram, multiprocess, start_http_server
+
+from app.config import settings
+from app.infrastructure.rendering.timings import StageTimer
+from app.infrastructure.workers.logging_config import logger
+
+# Seconds; renders are usually tens of ms, uploads/commits can take seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+RENDER_STAGE_SECONDS = Histogram(
+    "customify_render_stage_duration_seconds",
+    "Duration of one render task stage",
+    ["task", "stage"],
+    buckets=DURATION_BUCKETS,
+)
+
+RENDER_TASK_SECONDS = Histogram(
+    "customify_render_task_duration_seconds",
+    "Wall-clock duration of a render task",
+    ["task", "status"],
+    buckets=DURATION_BUCKETS,
+)
+
+WORKER_WARMUP_SECONDS = Histogram(
+    "customify_worker_warmup_duration_seconds",
+    "Duration of worker process warm-up steps",
+    ["step"],
+    buckets=DURATION_BUCKETS,
+)
+
+
+def record_render_timings(task_name: str, timer: StageTimer, status: str) -> Dict[str, float]:
+    """
+    Export a finished task's stage timings to Prometheus.
+    
+    Args:
+        task_name: Celery task name
+        timer: Stage timer started with the task
+        status: Task outcome (success, failed, already_rendered, ...)
+    
+    Returns:
+        dict stage -> milliseconds, including "total" (for the task result)
+    """
+    timer.add("total", timer.elapsed())
+    
+    for stage, seconds in timer.seconds().items():
+        if stage == "total":
+            RENDER_TASK_SECONDS.labels(task=task_name, status=status).observe(seconds)
+        else:
+            RENDER_STAGE_SECONDS.labels(task=task_name, stage=stage).observe(seconds)
+    
+    return timer.as_dict()
+
+
+def record_warmup_timings(timer: StageTimer) -> Dict[str, float]:
+    """
+    Export worker warm-up step timings to Prometheus.
+    
+    Args:
+        timer: Stage timer with one stage per warm-up step
+    
+    Returns:
+        dict step -> milliseconds, including "total"
+    """
+    timer.add("total", timer.elapsed())
+    for step, seconds in timer.seconds().items():
+        WORKER_WARMUP_SECONDS.labels(step=step).observe(seconds)
+    return timer.as_dict()
+
+
+def start_worker_metrics_server() -> None:
+    """
+    Start /metrics HTTP endpoint in the worker's main process.
+    
+    Called once from the celeryd_init signal (before pool children fork).
+    No-op when WORKER_METRICS_PORT is 0.
+    """
+    port = settings.WORKER_METRICS_PORT
+    if not port:
+        return
+    
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        # Samples from a previous worker run would be merged into new ones
+        shutil.rmtree(multiproc_dir, ignore_errors=True)
+        os.makedirs(multiproc_dir, exist_ok=True)
+        
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        start_http_server(port, registry=registry)
+    else:
+        start_http_server(port)
+    
+    logger.info(f"Worker metrics available on :{port}/metrics", extra={
+        "multiprocess": bool(multiproc_dir)
+    })
+
+
+def mark_worker_process_dead(pid: int) -> None:
+    """
+    Drop live gauges of an exited pool child (multiprocess mode only).
+    
+    Args:
+        pid: Process ID of the exiting child
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,224 @@
+"""Task: Garbage-collect assets of deleted and failed designs."""
+
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Set, Tuple, cast
+
+from redis import ConnectionPool, Redis
+
+from app.config import settings
+from app.domain.entities.design import Design
+from app.infrastructure.workers.celery_app import celery_app
+from app.infrastructure.workers.logging_config import logger
+from app.infrastructure.database.sync_session import get_sync_db_session
+from app.infrastructure.database.repositories.sync_design_repo import SyncDesignRepository
+from app.infrastructure.storage import get_storage_repository
+from app.infrastructure.storage.executor import get_storage_executor
+from app.infrastructure.rendering.fingerprint import compute_fingerprint
+
+# Redis key holding the keyset cursor of the last processed design
+GC_CURSOR_KEY = "asset_gc:cursor"
+
+# Fingerprint in a content-addressed asset URL (sharded local URLs included)
+ASSET_URL_FINGERPRINT = re.compile(r"renders/(?:[0-9a-f]{2}/[0-9a-f]{2}/)?([0-9a-f]{64})/")
+
+
+@celery_app.task(bind=True, name="collect_orphan_assets")
+def collect_orphan_assets(self, max_designs: Optional[int] = None) -> dict:
+    """
+    Delete storage assets of soft-deleted and failed designs.
+    
+    Scans candidates by keyset (updated_at, id) starting at the cursor saved
+    in Redis, so each run resumes where the previous one stopped. Per page:
+    1. Load up to ASSET_GC_PAGE_SIZE candidates (one SELECT)
+    2. Load live designs that may share their render fingerprints (one SELECT)
+    3. Lock the fingerprints no live design uses (blocks renders that would
+       link them) and re-check liveness under the lock
+    4. Delete legacy per-design keys, plus every key under renders/{fingerprint}/
+       of still-orphaned fingerprints (listed by prefix, so assets of older
+       variant configs are collected too; S3 DeleteObjects, <=1000 keys per
+       request), then commit (releases the locks)
+    5. Save cursor
+    
+    Designs updated within ASSET_GC_GRACE_SECONDS are skipped so renders
+    still being retried keep their assets.
+    
+    Args:
+        max_designs: Max candidates per run (default: ASSET_GC_MAX_DESIGNS_PER_RUN)
+    
+    Returns:
+        dict with designs scanned, keys deleted and the saved cursor
+    """
+    max_designs = max_designs or settings.ASSET_GC_MAX_DESIGNS_PER_RUN
+    updated_before = datetime.now(timezone.utc) - timedelta(seconds=settings.ASSET_GC_GRACE_SECONDS)
+    
+    # This client owns its pool: disconnect it when the run ends
+    pool = ConnectionPool.from_url(str(settings.REDIS_URL), decode_responses=True, socket_timeout=5)
+    redis = Redis(connection_pool=pool)
+    try:
+        storage = get_storage_repository()
+        cursor = load_gc_cursor(redis)
+        
+        logger.info("Starting orphan asset collection", extra={
+            "task_id": self.request.id,
+            "cursor": cursor and cursor[1]
+        })
+        
+        scanned = 0
+        deleted = 0
+        
+        while scanned < max_designs:
+            page_size = min(settings.ASSET_GC_PAGE_SIZE, max_designs - scanned)
+            
+            with get_sync_db_session() as session:
+                repo = SyncDesignRepository(session)
+                candidates = repo.list_gc_candidates(updated_before, cursor, page_size)
+                if not candidates:
+                    break
+                
+                orphans = orphan_fingerprints(candidates, live_fingerprints(repo, candidates))
+                
+                # ✅ NO RACE: renders hold these locks shared from dedupe check to
+                # publish, so no new design can link a render deleted below
+                repo.lock_fingerprints(orphans)
+                live = live_fingerprints(repo, candidates)
+                orphans = [fingerprint for fingerprint in orphans if fingerprint not in live]
+                
+                keys = legacy_asset_keys(candidates)
+                for listed in get_storage_executor().map(
+                    lambda fingerprint: storage.list_assets(f"renders/{fingerprint}/"), orphans
+                ):
+                    keys.extend(listed)
+                deleted += storage.delete_assets(keys)
+            
+            # ✅ PROGRESS: next run (or retry) resumes after this page
+            cursor = (candidates[-1].updated_at, candidates[-1].id)
+            save_gc_cursor(redis, cursor)
+            scanned += len(candidates)
+            
+            if len(candidates) < page_size:
+                break
+        
+        logger.info(f"Orphan asset collection scanned {scanned} designs, deleted {deleted} assets", extra={
+            "task_id": self.request.id,
+            "scanned": scanned,
+            "deleted": deleted
+        })
+        
+        return {
+            "status": "completed",
+            "scanned": scanned,
+            "deleted": deleted,
+            "cursor": cursor and {"updated_at": cursor[0].isoformat(), "id": cursor[1]}
+        }
+    finally:
+        pool.disconnect()
+
+
+def asset_fingerprints(design: Design) -> Set[str]:
+    """
+    Get render fingerprints whose assets a design may use.
+    
+    The fingerprint of its current data, plus the ones in its asset URLs
+    (renders made before a RENDERER_VERSION bump or font change keep
+    their old fingerprint until re-rendered).
+    
+    Args:
+        design: Design entity
+    
+    Returns:
+        Set of fingerprints
+    """
+    fingerprints = {compute_fingerprint(design.design_data, design.product_type)}
+    for url in (design.preview_url, design.thumbnail_url):
+        match = ASSET_URL_FINGERPRINT.search(url or "")
+        if match:
+            fingerprints.add(match.group(1))
+    return fingerprints
+
+
+def live_fingerprints(repo: SyncDesignRepository, candidates: List[Design]) -> Set[str]:
+    """
+    Get fingerprints used by live designs that may share the candidates' renders.
+    
+    Args:
+        repo: Sync design repository
+        candidates: Deleted/failed designs
+    
+    Returns:
+        Set of fingerprints (one SELECT)
+    """
+    live = repo.find_live_by_text(
+        (design.product_type, design.design_data.get("text", "Design"))
+        for design in candidates
+    )
+    return {fingerprint for design in live for fingerprint in asset_fingerprints(design)}
+
+
+def orphan_fingerprints(candidates: Iterable[Design], live: Set[str]) -> List[str]:
+    """
+    Get fingerprints of GC candidates that no live design uses.
+    
+    Content-addressed assets (renders/{fingerprint}/...) are shared, so
+    only these fingerprints' assets can be deleted.
+    
+    Args:
+        candidates: Deleted/failed designs
+        live: Fingerprints of live designs (see live_fingerprints)
+    
+    Returns:
+        Sorted unique fingerprints
+    """
+    return sorted({
+        fingerprint
+        for design in candidates
+        for fingerprint in asset_fingerprints(design)
+        if fingerprint not in live
+    })
+
+
+def legacy_asset_keys(candidates: Iterable[Design]) -> List[str]:
+    """
+    Get legacy per-design keys (designs/{id}/...), each owned by one design.
+    
+    Args:
+        candidates: Deleted/failed designs
+    
+    Returns:
+        Storage keys
+    """
+    return [
+        f"designs/{design.id}/{name}.png"
+        for design in candidates
+        for name in ("preview", "thumbnail")
+    ]
+
+
+def load_gc_cursor(redis: Redis) -> Optional[Tuple[datetime, str]]:
+    """
+    Load saved keyset cursor.
+    
+    Args:
+        redis: Redis client (decode_responses=True)
+    
+    Returns:
+        (updated_at, id) of the last processed design, or None to start over
+    """
+    raw = cast(Optional[str], redis.get(GC_CURSOR_KEY))
+    if not raw:
+        return None
+    
+    data = json.loads(raw)
+    return datetime.fromisoformat(data["updated_at"]), data["id"]
+
+
+def save_gc_cursor(redis: Redis, cursor: Tuple[datetime, str]) -> None:
+    """
+    Save keyset cursor.
+    
+    Args:
+        redis: Redis client
+        cursor: (updated_at, id) of the last processed design
+    """
+    redis.set(GC_CURSOR_KEY, json.dumps({"updated_at": cursor[0].isoformat(), "id": cursor[1]}))
@@ -1,13 +1,28 @@
 """Task: Render design preview."""
 
+from concurrent.futures import wait
 from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from PIL import Image, ImageDraw
+from app.config import settings
 from app.infrastructure.workers.celery_app import celery_app
 from app.infrastructure.workers.logging_config import logger
+from app.infrastructure.workers.metrics import record_render_timings
 from app.infrastructure.database.sync_session import get_sync_db_session
 from app.infrastructure.database.repositories.sync_design_repo import SyncDesignRepository
 from app.infrastructure.storage import get_storage_repository
-from app.domain.entities.design import DesignStatus
+from app.infrastructure.storage.executor import get_storage_executor
+from app.infrastructure.rendering.font_registry import font_registry
+from app.infrastructure.rendering.fingerprint import compute_fingerprint, render_asset_key
+from app.infrastructure.rendering.timings import StageTimer
+from app.infrastructure.rendering.variants import (
+    RENDER_VARIANTS,
+    derive_variants,
+    raster_size,
+)
+from app.domain.entities.design import Design, DesignStatus
+from app.domain.repositories.storage_repository import IStorageRepository
 
 
 @celery_app.task(bind=True, name="render_design_preview")
@@ -21,101 +36,92 @@ def render_design_preview(self, design_id: str) -> dict:
     - If failed, attempts re-render
     
     Flow:
-    1. Get design from database
-    2. Check if already rendered (idempotency)
-    3. Mark as RENDERING
-    4. Generate image using PIL (text on colored background)
-    5. Upload preview to S3/local storage
-    6. Generate thumbnail (resized version)
-    7. Upload thumbnail to S3/local storage
-    8. Mark as PUBLISHED with URLs
+    1. Claim design atomically (DRAFT/FAILED -> RENDERING, one UPDATE)
+    2. If not claimed, report already_rendered / in_progress (idempotency)
+    3. (Claim doubles as the RENDERING transition, no read-check-write)
+    4. Compute render fingerprint and lock it shared against asset GC (until
+       the publish commit); if assets already exist under its
+       content-addressed keys, link them and skip steps 5-6
+    5. Draw image once using PIL (text on colored background)
+    6. Derive, encode and upload each configured variant
+       (RENDER_VARIANTS: preview, thumbnail, ...) from that raster
+    7. Mark as PUBLISHED with preview/thumbnail URLs
     
     Args:
         design_id: Design ID to render
     
     Returns:
-        dict with status, preview_url, and thumbnail_url
+        dict with status, preview_url, thumbnail_url and timings_ms
+        (per-stage milliseconds, also exported as Prometheus histograms)
     """
     logger.info(f"Starting render for design {design_id}", extra={
         "design_id": design_id,
         "task_id": self.request.id
     })
+    timer = StageTimer()  # Per-stage spans, exported via record_render_timings
     
     try:
         with get_sync_db_session() as session:
             repo = SyncDesignRepository(session)
             storage = get_storage_repository()
             
-            # Get design
-            design = repo.get_by_id(design_id)
-            if design is None:
-                raise ValueError(f"Design {design_id} not found")
-            
-            logger.debug(f"Design {design_id} found, current status: {design.status.value}")
-            
-            # ✅ IDEMPOTENCY CHECK
-            if design.status == DesignStatus.PUBLISHED and design.preview_url:
-                logger.info(
-                    f"Design {design_id} already rendered, skipping",
-                    extra={
-                        "design_id": design_id,
-                        "preview_url": design.preview_url,
-                        "thumbnail_url": design.thumbnail_url
-                    }
-                )
-                return {
-                    "status": "already_rendered",
-                    "design_id": design_id,
-                    "preview_url": design.preview_url,
-                    "thumbnail_url": design.thumbnail_url
-                }
+            # ✅ ATOMIC CLAIM: DRAFT/FAILED -> RENDERING in one UPDATE ... RETURNING
+            with timer.stage("claim"):
+                design = repo.claim_for_render(design_id)
+            with timer.stage("commit"):
+                session.commit()
             
-            # If already rendering, return in-progress status
-            if design.status == DesignStatus.RENDERING:
-                logger.info(f"Design {design_id} already rendering, status check")
-                return {
-                    "status": "in_progress",
-                    "design_id": design_id
-                }
+            # ✅ IDEMPOTENCY CHECK (only when the claim was not won)
+            if design is None:
+                with timer.stage("fetch"):
+                    result = _unclaimed_result(repo, design_id)
+                result["timings_ms"] = record_render_timings(self.name, timer, result["status"])
+                return result
             
-            # Update status to rendering
-            design.mark_rendering()
-            repo.update(design)
-            session.commit()
             logger.info(f"Design {design_id} marked as rendering", extra={
                 "design_id": design_id,
                 "task_id": self.request.id
             })
             
-            # Render image (PIL)
-            logger.debug(f"Rendering image for design {design_id}")
-            image_buffer = _render_image(design.design_data, design.product_type)
+            # Hold off asset GC for this render until the publish commit
+            with timer.stage("lock"):
+                repo.lock_fingerprints(
+                    [compute_fingerprint(design.design_data, design.product_type)], shared=True
+                )
             
-            # Upload preview to storage (S3 or local)
-            image_buffer.seek(0)
-            preview_url = storage.upload_design_preview(design_id, image_buffer)
-            logger.info(f"Uploaded preview: {preview_url}")
+            # Render and store every variant (or link an identical render)
+            variant_urls, fingerprint, deduplicated = _render_and_store(design, storage, timer)
+            preview_url = variant_urls["preview"]
+            thumbnail_url = variant_urls.get("thumbnail")
             
-            # Generate thumbnail (resized version)
-            logger.debug(f"Generating thumbnail for design {design_id}")
-            thumbnail_buffer = _create_thumbnail(image_buffer)
+            # Mark as published (one UPDATE, only if still RENDERING)
+            with timer.stage("publish"):
+                published = repo.publish(design_id, preview_url, thumbnail_url)
+            with timer.stage("commit"):
+                session.commit()
             
-            # Upload thumbnail to storage
-            thumbnail_buffer.seek(0)
-            thumbnail_url = storage.upload_design_thumbnail(design_id, thumbnail_buffer)
-            logger.info(f"Uploaded thumbnail: {thumbnail_url}")
+            if published is None:
+                logger.warning(
+                    f"Design {design_id} left RENDERING during render, result discarded",
+                    extra={"design_id": design_id, "preview_url": preview_url}
+                )
+                return {
+                    "status": "discarded",
+                    "design_id": design_id,
+                    "preview_url": preview_url,
+                    "thumbnail_url": thumbnail_url,
+                    "timings_ms": record_render_timings(self.name, timer, "discarded")
+                }
             
-            # Mark as published
-            design.mark_published(preview_url, thumbnail_url)
-            repo.update(design)
-            session.commit()
+            timings_ms = record_render_timings(self.name, timer, "success")
             
             logger.info(
                 f"Design {design_id} rendered and published successfully",
                 extra={
                     "design_id": design_id,
                     "preview_url": preview_url,
-                    "thumbnail_url": thumbnail_url
+                    "thumbnail_url": thumbnail_url,
+                    "timings_ms": timings_ms
                 }
             )
             
@@ -123,25 +129,25 @@ def render_design_preview(self, design_id: str) -> dict:
                 "status": "success",
                 "design_id": design_id,
                 "preview_url": preview_url,
-                "thumbnail_url": thumbnail_url
+                "thumbnail_url": thumbnail_url,
+                "variant_urls": variant_urls,
+                "fingerprint": fingerprint,
+                "deduplicated": deduplicated,
+                "timings_ms": timings_ms
             }
     
     except Exception as e:
         logger.error(f"Render failed for design {design_id}: {e}", exc_info=True, extra={
             "design_id": design_id,
-            "error": str(e)
+            "error": str(e),
+            "timings_ms": record_render_timings(self.name, timer, "failed")
         })
         
-        # Mark design as failed
+        # Mark design as failed (one UPDATE, only if still RENDERING)
         try:
             with get_sync_db_session() as session:
-                repo = SyncDesignRepository(session)
-                design = repo.get_by_id(design_id)
-                if design and design.status == DesignStatus.RENDERING:
-                    logger.warning(f"Marking design {design_id} as failed: {e}")
-                    design.mark_failed(str(e))
-                    repo.update(design)
-                    session.commit()
+                if SyncDesignRepository(session).mark_failed(design_id, str(e)):
+                    logger.warning(f"Marked design {design_id} as failed: {e}")
         except Exception as mark_error:
             logger.error(f"Failed to mark design as failed: {mark_error}")
         
@@ -149,9 +155,354 @@ def render_design_preview(self, design_id: str) -> dict:
         raise
 
 
-def _render_image(design_data: dict, product_type: str) -> BytesIO:
+def _unclaimed_result(repo: SyncDesignRepository, design_id: str) -> dict:
     """
-    Render design using PIL.
+    Build task result for a design whose render claim was not won.
+    
+    Args:
+        repo: Sync design repository
+        design_id: Design ID
+    
+    Returns:
+        dict with already_rendered or in_progress status
+    
+    Raises:
+        ValueError: If design doesn't exist (or is deleted)
+    """
+    design = repo.get_by_id(design_id)
+    if design is None:
+        raise ValueError(f"Design {design_id} not found")
+    
+    if design.status == DesignStatus.PUBLISHED and design.preview_url:
+        logger.info(
+            f"Design {design_id} already rendered, skipping",
+            extra={
+                "design_id": design_id,
+                "preview_url": design.preview_url,
+                "thumbnail_url": design.thumbnail_url
+            }
+        )
+        return {
+            "status": "already_rendered",
+            "design_id": design_id,
+            "preview_url": design.preview_url,
+            "thumbnail_url": design.thumbnail_url
+        }
+    
+    # Claimed by another worker (duplicate delivery)
+    logger.info(f"Design {design_id} already rendering, status check")
+    return {
+        "status": "in_progress",
+        "design_id": design_id
+    }
+
+
+@celery_app.task(bind=True, name="render_design_previews_batch")
+def render_design_previews_batch(self, design_ids: List[str]) -> dict:
+    """
+    Render many designs in one task invocation (bulk imports).
+    
+    Same per-design idempotency rules as render_design_preview, but the
+    database work is batched:
+    1. Load all designs with one SELECT
+    2. Skip published (already_rendered) and rendering (in_progress) designs
+    3. Claim the rest (DRAFT/FAILED -> RENDERING) with one UPDATE
+    4. Render and store each claimed design (per-design errors don't
+       abort the batch)
+    5. Publish successes and fail errors with one bulk UPDATE each
+    
+    Args:
+        design_ids: Design IDs to render (see enqueue_render_batches)
+    
+    Returns:
+        dict with per-status counts and per-design results
+    """
+    design_ids = list(dict.fromkeys(design_ids))  # Dedupe, keep order
+    logger.info(f"Starting batch render for {len(design_ids)} designs", extra={
+        "task_id": self.request.id,
+        "batch_size": len(design_ids)
+    })
+    
+    results: Dict[str, dict] = {}
+    claimed_ids: List[str] = []
+    timer = StageTimer()  # Accumulated over every design in the batch
+    
+    try:
+        with get_sync_db_session() as session:
+            repo = SyncDesignRepository(session)
+            storage = get_storage_repository()
+            
+            # 1. Load all designs (one SELECT)
+            with timer.stage("fetch"):
+                designs = {design.id: design for design in repo.get_many(design_ids)}
+            
+            # 2. ✅ IDEMPOTENCY CHECK (per design)
+            for design_id in design_ids:
+                design = designs.get(design_id)
+                if design is None:
+                    results[design_id] = {"status": "not_found"}
+                elif design.status == DesignStatus.PUBLISHED and design.preview_url:
+                    results[design_id] = {
+                        "status": "already_rendered",
+                        "preview_url": design.preview_url,
+                        "thumbnail_url": design.thumbnail_url
+                    }
+                elif design.status == DesignStatus.RENDERING:
+                    results[design_id] = {"status": "in_progress"}
+            
+            # 3. Claim remaining designs (one UPDATE)
+            claimable = [design_id for design_id in design_ids if design_id not in results]
+            with timer.stage("claim"):
+                claimed = repo.claim_many_for_render(claimable)
+            with timer.stage("commit"):
+                session.commit()
+            claimed_ids = [design.id for design in claimed]
+            
+            # Designs claimed by a concurrent task between SELECT and UPDATE
+            for design_id in set(claimable) - set(claimed_ids):
+                results[design_id] = {"status": "in_progress"}
+            
+            # Hold off asset GC for these renders until the publish commit
+            # (all locks up front, in key order: no deadlock with GC)
+            with timer.stage("lock"):
+                repo.lock_fingerprints(
+                    (compute_fingerprint(design.design_data, design.product_type) for design in claimed),
+                    shared=True
+                )
+            
+            # 4. Render each claimed design
+            published: List[Tuple[str, str, Optional[str]]] = []
+            errors: Dict[str, str] = {}
+            
+            for design in claimed:
+                try:
+                    variant_urls, fingerprint, deduplicated = _render_and_store(design, storage, timer)
+                except Exception as e:
+                    logger.error(f"Render failed for design {design.id}: {e}", exc_info=True, extra={
+                        "design_id": design.id,
+                        "error": str(e)
+                    })
+                    errors[design.id] = str(e)
+                    results[design.id] = {"status": "failed", "error": str(e)}
+                    continue
+                
+                published.append((design.id, variant_urls["preview"], variant_urls.get("thumbnail")))
+                results[design.id] = {
+                    "status": "success",
+                    "preview_url": variant_urls["preview"],
+                    "thumbnail_url": variant_urls.get("thumbnail"),
+                    "fingerprint": fingerprint,
+                    "deduplicated": deduplicated
+                }
+            
+            # 5. Publish / fail (one bulk UPDATE each)
+            with timer.stage("publish"):
+                repo.publish_many(published)
+                repo.fail_many(errors)
+            with timer.stage("commit"):
+                session.commit()
+    
+    except Exception as e:
+        logger.error(f"Batch render failed: {e}", exc_info=True, extra={
+            "task_id": self.request.id,
+            "error": str(e),
+            "timings_ms": record_render_timings(self.name, timer, "failed")
+        })
+        
+        # Release claimed designs so they can be re-rendered
+        try:
+            with get_sync_db_session() as session:
+                SyncDesignRepository(session).fail_many(
+                    {design_id: str(e) for design_id in claimed_ids}
+                )
+        except Exception as mark_error:
+            logger.error(f"Failed to mark batch designs as failed: {mark_error}")
+        
+        # Re-raise for Celery retry
+        raise
+    
+    statuses = [result["status"] for result in results.values()]
+    summary = {
+        "status": "completed",
+        "total": len(design_ids),
+        "rendered": statuses.count("success"),
+        "already_rendered": statuses.count("already_rendered"),
+        "in_progress": statuses.count("in_progress"),
+        "failed": statuses.count("failed"),
+        "not_found": statuses.count("not_found"),
+        "results": results,
+        "timings_ms": record_render_timings(self.name, timer, "completed")
+    }
+    
+    logger.info(
+        f"Batch render finished: {summary['rendered']}/{len(design_ids)} rendered",
+        extra={
+            "task_id": self.request.id,
+            "failed": summary["failed"],
+            "timings_ms": summary["timings_ms"]
+        }
+    )
+    
+    return summary
+
+
+def enqueue_render_batches(
+    design_ids: List[str],
+    batch_size: int = settings.RENDER_BATCH_SIZE
+) -> List[str]:
+    """
+    Group pending design IDs into batches and queue one batch task each.
+    
+    Args:
+        design_ids: Pending design IDs (e.g. from a merchant import)
+        batch_size: Max designs per task
+    
+    Returns:
+        List of queued Celery task IDs
+    
+    Example:
+        >>> enqueue_render_batches([d.id for d in imported_designs])
+        ['5b1f...', '0c7a...']
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    
+    design_ids = list(dict.fromkeys(design_ids))
+    task_ids = []
+    
+    for start in range(0, len(design_ids), batch_size):
+        batch = design_ids[start:start + batch_size]
+        task = render_design_previews_batch.apply_async(
+            args=[batch],
+            queue='default',  # Bulk work must not starve interactive renders
+            routing_key='default'
+        )
+        task_ids.append(task.id)
+    
+    logger.info(f"Queued {len(task_ids)} render batches for {len(design_ids)} designs")
+    
+    return task_ids
+
+
+def _render_and_store(
+    design: Design,
+    storage: IStorageRepository,
+    timer: Optional[StageTimer] = None
+) -> Tuple[Dict[str, str], str, bool]:
+    """
+    Render a claimed design and store every variant (or link existing ones).
+    
+    Encoding and uploading overlap: each encoded variant is handed to the
+    shared storage I/O pool while the next one encodes, so wall-clock time
+    approaches max(render, upload) instead of their sum.
+    
+    Args:
+        design: Design entity (already claimed as RENDERING)
+        storage: Storage repository
+        timer: Optional stage timer (dedupe_check, draw, encode, upload,
+            upload_wait, render_store)
+    
+    Returns:
+        Tuple of (variant name -> URL, render fingerprint, deduplicated flag)
+    """
+    timer = timer or StageTimer()
+    
+    with timer.stage("render_store"):
+        # Content-addressed asset keys (shared by identical designs)
+        fingerprint = compute_fingerprint(design.design_data, design.product_type)
+        asset_keys = {
+            spec.name: render_asset_key(fingerprint, spec.asset_name, spec.extension)
+            for spec in RENDER_VARIANTS
+        }
+        
+        # ✅ DEDUPLICATION: link existing render with the same fingerprint
+        with timer.stage("dedupe_check"):
+            exists = dict(zip(
+                asset_keys,
+                get_storage_executor().map(storage.asset_exists, asset_keys.values())
+            ))
+        
+        # Existing keys are immutable: link them, only render the missing ones
+        variant_urls = {
+            name: storage.get_asset_url(asset_keys[name]) for name, found in exists.items() if found
+        }
+        missing = [spec for spec in RENDER_VARIANTS if not exists[spec.name]]
+        
+        if not missing:
+            logger.info(
+                f"Design {design.id} matches existing render, linking assets",
+                extra={"design_id": design.id, "fingerprint": fingerprint}
+            )
+            return variant_urls, fingerprint, True
+        
+        # Render once (PIL), then derive every variant from the raster
+        logger.debug(f"Rendering image for design {design.id}")
+        with timer.stage("draw"):
+            image = _draw_design(
+                design.design_data,
+                design.product_type,
+                size=raster_size(RENDER_VARIANTS)
+            )
+        
+        # Encode variant N+1 while variant N uploads
+        uploads = {}
+        variants = derive_variants(image, missing)
+        while True:
+            with timer.stage("encode"):
+                variant = next(variants, None)
+            if variant is None:
+                break
+            
+            name = variant.spec.name
+            uploads[name] = get_storage_executor().submit(
+                _timed_upload, storage, asset_keys[name], variant.buffer,
+                variant.spec.content_type, timer, perf_counter()
+            )
+            logger.debug(f"Queued upload of {name} {variant.dimensions}")
+        
+        # Wait for every upload before reporting (first error is raised)
+        with timer.stage("upload_wait"):
+            wait(uploads.values())
+            uploaded = {name: future.result() for name, future in uploads.items()}
+        
+        for name, url in uploaded.items():
+            logger.info(f"Uploaded {name}: {url}")
+        variant_urls.update(uploaded)
+    
+    return variant_urls, fingerprint, False
+
+
+def _timed_upload(
+    storage: IStorageRepository,
+    key: str,
+    data: BytesIO,
+    content_type: str,
+    timer: StageTimer,
+    submitted: float,
+) -> str:
+    """
+    Upload an asset in the storage I/O pool, recording submit-to-completion
+    time as stage 'upload'.
+    
+    The time is added before the future resolves, so waiting on the
+    future also waits for the timing (done callbacks may run later).
+    
+    Returns:
+        str: Asset URL
+    """
+    try:
+        return storage.upload_asset(key, data, content_type)
+    finally:
+        timer.add("upload", perf_counter() - submitted)
+
+
+# Reference canvas size: fontSize values are expressed in pixels at this size
+BASE_CANVAS_SIZE = 600
+
+
+def _draw_design(design_data: dict, product_type: str, size: int = BASE_CANVAS_SIZE) -> Image.Image:
+    """
+    Draw design into an in-memory raster using PIL.
     
     MVP version: Simple text on colored background.
     Future: Add product mockup templates, advanced typography.
@@ -159,12 +510,12 @@ def _render_image(design_data: dict, product_type: str) -> BytesIO:
     Args:
         design_data: Design configuration (text, font, color, fontSize)
         product_type: Product type (t-shirt, mug, etc.)
+        size: Canvas width/height in pixels (font size scales with it)
     
     Returns:
-        BytesIO: PNG image buffer
+        Image.Image: RGB raster (not encoded)
     """
-    # Image dimensions (600x600 for MVP)
-    width, height = 600, 600
+    width, height = size, size
     
     # Get background color
     bg_color = design_data.get('color', '#FFFFFF')
@@ -173,32 +524,10 @@ def _render_image(design_data: dict, product_type: str) -> BytesIO:
     image = Image.new('RGB', (width, height), color=bg_color)
     draw = ImageDraw.Draw(image)
     
-    # Load font
+    # Get font (preloaded per worker process, LRU-cached per size)
     font_size = design_data.get('fontSize', 48)
-    try:
-        # Try common Linux font paths
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",  # macOS
-            "C:\\Windows\\Fonts\\arial.ttf",  # Windows
-        ]
-        
-        font = None
-        for font_path in font_paths:
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-                logger.debug(f"Loaded font: {font_path}")
-                break
-            except:
-                continue
-        
-        if font is None:
-            logger.warning("Could not load TrueType font, using default")
-            font = ImageFont.load_default()
-    except Exception as e:
-        logger.warning(f"Font loading error: {e}, using default")
-        font = ImageFont.load_default()
+    scaled_font_size = max(1, round(font_size * size / BASE_CANVAS_SIZE))
+    font = font_registry.get_font(design_data.get('font'), scaled_font_size)
     
     # Get text
     text = design_data.get('text', 'Design')
@@ -216,44 +545,9 @@ def _render_image(design_data: dict, product_type: str) -> BytesIO:
     # Draw text
     draw.text((x, y), text, fill=text_color, font=font)
     
-    # Save to buffer
-    buffer = BytesIO()
-    image.save(buffer, format='PNG')
-    buffer.seek(0)
-    
     logger.debug(f"Rendered {width}x{height} image with text: '{text}'")
     
-    return buffer
-
-
-def _create_thumbnail(image_buffer: BytesIO, size: tuple = (200, 200)) -> BytesIO:
-    """
-    Create thumbnail from image.
-    
-    Args:
-        image_buffer: Original image buffer
-        size: Thumbnail dimensions (default: 200x200)
-    
-    Returns:
-        BytesIO: Thumbnail image buffer
-    """
-    # Reset buffer position
-    image_buffer.seek(0)
-    
-    # Open image
-    image = Image.open(image_buffer)
-    
-    # Create thumbnail (maintains aspect ratio)
-    image.thumbnail(size, Image.Resampling.LANCZOS)
-    
-    # Save to new buffer
-    thumbnail_buffer = BytesIO()
-    image.save(thumbnail_buffer, format='PNG')
-    thumbnail_buffer.seek(0)
-    
-    logger.debug(f"Created thumbnail: {image.size}")
-    
-    return thumbnail_buffer
+    return image
 
 
 def _is_light_color(hex_color: str) -> bool:
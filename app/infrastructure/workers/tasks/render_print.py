@@ -0,0 +1,195 @@
+"""Task: Render print-resolution design output (tiled, streamed)."""
+
+from typing import Tuple
+
+from app.config import settings
+from app.infrastructure.workers.celery_app import celery_app
+from app.infrastructure.workers.logging_config import logger
+from app.domain.repositories.storage_repository import AssetWriter
+from app.infrastructure.workers.metrics import record_render_timings
+from app.infrastructure.database.sync_session import get_sync_db_session
+from app.infrastructure.database.repositories.sync_design_repo import SyncDesignRepository
+from app.infrastructure.storage import get_storage_repository
+from app.infrastructure.rendering.font_registry import font_registry
+from app.infrastructure.rendering.fingerprint import compute_fingerprint, render_asset_key
+from app.infrastructure.rendering.png_stream import PngStreamWriter
+from app.infrastructure.rendering.tiled import iter_strips
+from app.infrastructure.rendering.timings import StageTimer
+from app.infrastructure.workers.tasks.render_design import BASE_CANVAS_SIZE, _is_light_color
+
+
+@celery_app.task(bind=True, name="render_design_print")
+def render_design_print(self, design_id: str) -> dict:
+    """
+    Render design at print resolution (PRINT_SIZES x PRINT_DPI) as PNG.
+    
+    The canvas is drawn in strips of PRINT_TILE_HEIGHT rows, each strip is
+    deflated into a streaming PNG encoder and the encoded bytes go straight
+    into a multipart upload (S3) or temp file (local). Peak memory is a few
+    strips plus one upload part, whatever the print size.
+    
+    **IDEMPOTENT**: Output is content-addressed (renders/{fingerprint}/print-{dpi}dpi.png);
+    if it already exists it is returned without rendering. Design status is
+    not changed (print output is derived from the published design data).
+    
+    Args:
+        design_id: Design ID to render
+    
+    Returns:
+        dict with status, print_url, width, height, dpi and timings_ms
+    
+    Raises:
+        ValueError: If design doesn't exist or its product type has no print size
+    """
+    logger.info(f"Starting print render for design {design_id}", extra={
+        "design_id": design_id,
+        "task_id": self.request.id
+    })
+    timer = StageTimer()
+    
+    try:
+        with get_sync_db_session() as session:
+            repo = SyncDesignRepository(session)
+            with timer.stage("fetch"):
+                design = repo.get_by_id(design_id)
+            
+            if design is None:
+                raise ValueError(f"Design {design_id} not found")
+            
+            width, height = print_dimensions(design.product_type)
+            fingerprint = compute_fingerprint(design.design_data, design.product_type)
+            key = print_asset_key(fingerprint)
+            storage = get_storage_repository()
+            
+            # Hold off asset GC for this fingerprint until the asset is stored
+            with timer.stage("lock"):
+                repo.lock_fingerprints([fingerprint], shared=True)
+            
+            # ✅ DEDUPLICATION: identical design already rendered for print
+            with timer.stage("dedupe_check"):
+                deduplicated = storage.asset_exists(key)
+            
+            if not deduplicated:
+                with timer.stage("render_store"):
+                    with storage.open_asset_writer(key, "image/png") as stream:
+                        _write_print_png(design.design_data, width, height, stream, timer)
+        
+        print_url = storage.get_asset_url(key)
+        timings_ms = record_render_timings(self.name, timer, "success")
+        
+        logger.info(f"Print render for design {design_id} stored: {print_url}", extra={
+            "design_id": design_id,
+            "dimensions": f"{width}x{height}",
+            "deduplicated": deduplicated,
+            "timings_ms": timings_ms
+        })
+        
+        return {
+            "status": "success",
+            "design_id": design_id,
+            "print_url": print_url,
+            "width": width,
+            "height": height,
+            "dpi": settings.PRINT_DPI,
+            "fingerprint": fingerprint,
+            "deduplicated": deduplicated,
+            "timings_ms": timings_ms
+        }
+    
+    except Exception as e:
+        logger.error(f"Print render failed for design {design_id}: {e}", exc_info=True, extra={
+            "design_id": design_id,
+            "error": str(e),
+            "timings_ms": record_render_timings(self.name, timer, "failed")
+        })
+        raise
+
+
+def print_asset_key(fingerprint: str) -> str:
+    """
+    Build content-addressed storage key of a print render.
+    
+    Args:
+        fingerprint: Render fingerprint
+    
+    Returns:
+        str: e.g. renders/{fingerprint}/print-300dpi.png
+    """
+    return render_asset_key(fingerprint, f"print-{settings.PRINT_DPI}dpi", "png")
+
+
+def print_dimensions(product_type: str) -> Tuple[int, int]:
+    """
+    Get print canvas size in pixels for a product type.
+    
+    Args:
+        product_type: Product type (poster, ...)
+    
+    Returns:
+        Tuple of (width, height) in pixels at PRINT_DPI
+    
+    Raises:
+        ValueError: If the product type has no configured print size
+    """
+    if product_type not in settings.PRINT_SIZES:
+        raise ValueError(
+            f"No print size configured for product type {product_type}. "
+            f"Configured: {', '.join(settings.PRINT_SIZES)}"
+        )
+    
+    width_in, height_in = settings.PRINT_SIZES[product_type]
+    return round(width_in * settings.PRINT_DPI), round(height_in * settings.PRINT_DPI)
+
+
+def _write_print_png(
+    design_data: dict,
+    width: int,
+    height: int,
+    stream: AssetWriter,
+    timer: StageTimer
+) -> None:
+    """
+    Draw design strip by strip and stream it as PNG.
+    
+    Layout matches the preview renderer: fontSize is in pixels at the
+    600px-wide preview canvas and scales with the print width.
+    
+    Args:
+        design_data: Design configuration (text, font, color, fontSize)
+        width: Canvas width in pixels
+        height: Canvas height in pixels
+        stream: Writable binary stream (see open_asset_writer)
+        timer: Stage timer (draw, encode)
+    """
+    bg_color = design_data.get('color', '#FFFFFF')
+    text_color = '#000000' if _is_light_color(bg_color) else '#FFFFFF'
+    font_size = design_data.get('fontSize', 48)
+    font = font_registry.get_font(
+        design_data.get('font'),
+        max(1, round(font_size * width / BASE_CANVAS_SIZE))
+    )
+    
+    with timer.stage("draw"):
+        strips = iter_strips(
+            width,
+            height,
+            settings.PRINT_TILE_HEIGHT,
+            bg_color,
+            design_data.get('text', 'Design'),
+            font,
+            text_color,
+        )
+    
+    writer = PngStreamWriter(stream, width, height, compress_level=settings.PRINT_COMPRESS_LEVEL)
+    while True:
+        with timer.stage("draw"):
+            strip = next(strips, None)
+        if strip is None:
+            break
+        
+        # Deflate + upload of this strip happens before the next one is drawn
+        with timer.stage("encode"):
+            writer.write_strip(strip)
+    
+    with timer.stage("encode"):
+        writer.close()
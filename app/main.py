@@ -11,7 +11,7 @@ from datetime import UTC
 from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from prometheus_client import start_http_server
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -34,8 +34,11 @@ from app.domain.exceptions.subscription_exceptions import (
 )
 from app.infrastructure.database.session import close_db, get_db_session
 from app.infrastructure.logging.structured_logger import get_logger, init_logger
+from app.infrastructure.storage.static_files import AssetStaticFiles
 from app.presentation.api.v1.router import api_router
 from app.presentation.middleware import SecurityHeadersMiddleware
+from app.presentation.middleware.rate_limiter import rate_limiter
+from app.shared.services.password_pool import PasswordPoolSaturatedError
 
 
 # ============================================================
@@ -76,6 +79,19 @@ async def lifespan(app: FastAPI):
         print(f"   Storage: S3 ({settings.S3_BUCKET_NAME})")
 
     print("   API Docs: http://localhost:8000/docs")
+
+    # Prometheus metrics (auth user cache hit/miss, ...) on their own port,
+    # so /metrics is never reachable through the public listener
+    if settings.API_METRICS_PORT:
+        try:
+            start_http_server(settings.API_METRICS_PORT)
+            print(f"   Metrics: :{settings.API_METRICS_PORT}/metrics")
+        except OSError as e:
+            # Another uvicorn worker already serves the port
+            logger.warning(
+                "API metrics port unavailable",
+                extra={"port": settings.API_METRICS_PORT, "error": str(e)},
+            )
     print("=" * 60)
 
     yield
@@ -84,6 +100,7 @@ async def lifespan(app: FastAPI):
     print("\n" + "=" * 60)
     print("🛑 Customify Core API shutting down...")
     await close_db()
+    await rate_limiter.close()
     print("=" * 60)
 
 
@@ -129,7 +146,8 @@ app.add_middleware(SecurityHeadersMiddleware)
 if settings.USE_LOCAL_STORAGE:
     # Mount static files directory for serving design previews
     # Only used when USE_LOCAL_STORAGE=true (development mode)
-    app.mount("/static", StaticFiles(directory="./storage"), name="static")
+    # Same Cache-Control as S3 objects (immutable for content-addressed renders)
+    app.mount("/static", AssetStaticFiles(directory="./storage"), name="static")
 
 # ============================================================
 # Exception Handlers
@@ -184,6 +202,16 @@ async def unauthorized_design_handler(request: Request, exc: UnauthorizedDesignA
     return JSONResponse(status_code=status.HTTP_403_FORBIDDEN, content={"detail": str(exc)})
 
 
+@app.exception_handler(PasswordPoolSaturatedError)
+async def password_pool_saturated_handler(request: Request, exc: PasswordPoolSaturatedError):
+    """Handle password pool saturation (shed load)."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
     """Handle value error."""
@@ -288,10 +316,10 @@ async def health_check(session: AsyncSession = Depends(get_db_session)):
     # S3 check (only if not using local storage)
     if not settings.USE_LOCAL_STORAGE:
         try:
-            from app.infrastructure.storage.s3_client import s3_client
+            from app.infrastructure.storage.s3_client import get_s3_client
 
             # Simple head_bucket check
-            s3_client.s3.head_bucket(Bucket=settings.S3_BUCKET_NAME)
+            get_s3_client().verify_bucket()
             health["checks"]["s3"] = {"status": "healthy"}
         except Exception as e:
             if logger:
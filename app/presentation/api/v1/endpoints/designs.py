@@ -1,5 +1,7 @@
 """Design endpoints."""
 
+from typing import Optional
+
 from fastapi import APIRouter, Depends, Query, status
 
 from app.application.use_cases.designs.create_design import CreateDesignUseCase
@@ -10,6 +12,7 @@ from app.domain.exceptions.design_exceptions import (
 )
 from app.domain.repositories.design_repository import IDesignRepository
 from app.domain.repositories.subscription_repository import ISubscriptionRepository
+from app.infrastructure.storage.signed_url_cache import sign_asset_urls
 from app.presentation.dependencies.auth import get_current_user
 from app.presentation.dependencies.repositories import (
     get_design_repository,
@@ -23,10 +26,30 @@ from app.presentation.schemas.design_schema import (
     DesignListResponse,
     DesignResponse,
 )
+from app.presentation.schemas.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/designs", tags=["Designs"])
 
 
+async def _design_responses(designs) -> list[DesignResponse]:
+    """
+    Build design responses with fetchable asset URLs.
+
+    For private buckets, preview/thumbnail URLs are replaced by cached
+    pre-signed URLs (one batch for the whole page).
+    """
+    responses = [DesignResponse.model_validate(d) for d in designs]
+    urls = await sign_asset_urls(
+        [url for r in responses for url in (r.preview_url, r.thumbnail_url)]
+    )
+
+    for response, preview_url, thumbnail_url in zip(responses, urls[0::2], urls[1::2]):
+        response.preview_url = preview_url
+        response.thumbnail_url = thumbnail_url
+
+    return responses
+
+
 @router.post(
     "",
     response_model=DesignResponse,
@@ -79,8 +102,12 @@ async def create_design(
     description="Get paginated list of user's designs.",
 )
 async def list_designs(
-    skip: int = Query(0, ge=0, description="Number of designs to skip"),
+    skip: int = Query(0, ge=0, description="Number of designs to skip (prefer cursor)"),
     limit: int = Query(20, ge=1, le=100, description="Max number of designs to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: Optional[bool] = Query(
+        None, description="Count all designs (default: first page only)"
+    ),
     current_user: User = Depends(get_current_user),
     _rate_limit: None = Depends(create_user_rate_limit_dependency(limit=100, window=60)),
     design_repo: IDesignRepository = Depends(get_design_repository),
@@ -91,7 +118,9 @@ async def list_designs(
     - Returns only user's own designs
     - Excludes deleted designs
     - Ordered by created_at DESC (newest first)
-    - Supports pagination
+    - Keyset pagination: pass next_cursor as cursor to get the next page
+      (constant cost per page); skip/limit still works for old clients
+    - total is computed on the first page or with include_total=true
 
     Requires:
         Authorization header with Bearer token
@@ -100,17 +129,35 @@ async def list_designs(
         DesignListResponse: Paginated design list
 
     Raises:
+        400: Invalid cursor
         401: Invalid/expired token
     """
-    # Get designs with total count (optimized, no N+1)
-    designs, total = await design_repo.get_by_user(user_id=current_user.id, skip=skip, limit=limit)
+    if include_total is None:
+        include_total = cursor is None
+
+    total: Optional[int]
+    if cursor is None and skip > 0:
+        # Legacy OFFSET pagination (cost grows with skip)
+        designs, total = await design_repo.get_by_user(user_id=current_user.id, skip=skip, limit=limit)
+        has_more = (skip + limit) < total
+    else:
+        after = decode_cursor(cursor) if cursor is not None else None
+        designs = await design_repo.list_by_user(
+            user_id=current_user.id, limit=limit + 1, after=after
+        )
+        has_more = len(designs) > limit
+        designs = designs[:limit]
+        total = await design_repo.count_by_user(current_user.id) if include_total else None
+
+    last = designs[-1] if has_more else None
 
     return DesignListResponse(
-        designs=[DesignResponse.model_validate(d) for d in designs],
+        designs=await _design_responses(designs),
         total=total,
         skip=skip,
         limit=limit,
-        has_more=(skip + limit) < total,
+        has_more=has_more,
+        next_cursor=encode_cursor(last.created_at, last.id) if last else None,
     )
 
 
@@ -151,4 +198,5 @@ async def get_design(
     if design.user_id != current_user.id:
         raise UnauthorizedDesignAccessError(f"Design {design_id} does not belong to you")
 
-    return DesignResponse.model_validate(design)
+    (response,) = await _design_responses([design])
+    return response
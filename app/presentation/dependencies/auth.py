@@ -4,6 +4,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.infrastructure.cache.user_cache import get_user_cache
 from app.infrastructure.database.session import get_db_session
 from app.infrastructure.database.repositories.user_repo_impl import UserRepositoryImpl
 from app.shared.services.jwt_service import decode_access_token
@@ -20,6 +21,9 @@ async def get_current_user(
     """
     Dependency: Get current authenticated user from JWT.
     
+    Users are cached for AUTH_USER_CACHE_TTL seconds (see UserCache), so
+    most requests skip the users SELECT.
+    
     Usage:
         @router.get("/protected")
         async def protected_route(current_user: User = Depends(get_current_user)):
@@ -48,9 +52,13 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from DB
-    user_repo = UserRepositoryImpl(session)
-    user = await user_repo.get_by_id(user_id)
+    # Get user from cache, falling back to DB (session connects only on a miss)
+    user_cache = get_user_cache()
+    user = await user_cache.get(user_id)
+    if user is None:
+        user = await UserRepositoryImpl(session).get_by_id(user_id)
+        if user is not None:
+            await user_cache.set(user)
     
     if user is None:
         raise HTTPException(
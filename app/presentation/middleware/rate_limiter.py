@@ -1,38 +1,125 @@
-"""Rate limiting middleware using Redis."""
-
+"""
+Rate limiting middleware using Redis.
+
+Limits are enforced with GCRA (generic cell rate algorithm): each key
+stores one "theoretical arrival time" and a Lua script checks and updates
+it atomically in a single round trip (EVALSHA on a pooled asyncio client),
+so checks never block the event loop. A limit of N per window allows
+bursts of N and then one request every window / N seconds, instead of
+fixed windows that reset (and allow 2N) at their boundary.
+
+RATE_LIMIT_MODE=hybrid takes Redis off the hot path: each process checks
+a local token bucket per key and reports consumed tokens to Redis in
+batches (every RATE_LIMIT_SYNC_INTERVAL seconds, or inline once a key has
+RATE_LIMIT_LOCAL_ERROR x limit unreported tokens), adopting the global
+count Redis returns. Across P processes a key can overshoot its limit by
+about P x RATE_LIMIT_LOCAL_ERROR x limit.
+
+Local buckets are also the fallback when Redis is disabled or failing:
+after an error, checks skip Redis for RATE_LIMIT_REDIS_RETRY_INTERVAL
+seconds instead of each waiting RATE_LIMIT_REDIS_TIMEOUT for it.
+"""
+
+import asyncio
 import logging
+import math
 import time
+from typing import Any, Callable, List, Optional, Tuple
 
 from fastapi import HTTPException, Request, status
-from redis import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import NoScriptError
 
 from app.config import settings
+from app.presentation.middleware.token_bucket import LocalBuckets, TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# KEYS[1]: bucket key; ARGV: emission interval (ms/request), burst tolerance
+# (ms = window), cost (requests), force ("1" = record the cost even over the
+# limit, for requests already admitted locally; debt is capped at one
+# window). Uses server time so every API process shares one clock.
+# Returns {allowed, retry_after_ms, remaining}.
+GCRA_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local force = ARGV[4] == '1'
+
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+    tat = now
+end
+
+local new_tat = tat + interval * cost
+local allow_at = new_tat - tolerance
+if now < allow_at then
+    if not force then
+        return {0, math.ceil(allow_at - now), 0}
+    end
+    new_tat = now + tolerance
+end
+
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.max(1, math.ceil(new_tat - now)))
+return {1, 0, math.floor((tolerance - (new_tat - now)) / interval)}
+"""
+
 
 class RateLimiter:
-    """Redis-based rate limiter."""
+    """
+    Redis-based rate limiter (GCRA, one atomic round trip per check).
 
-    def __init__(self):
-        """Initialize Redis connection."""
-        try:
-            self.redis = Redis.from_url(
-                str(settings.REDIS_URL),
-                decode_responses=True,
-                socket_timeout=5,
-                socket_connect_timeout=5,
-            )
-            # Test connection
-            self.redis.ping()
-            logger.info("Rate limiter initialized with Redis")
-        except Exception as e:
-            logger.error(f"Failed to connect to Redis for rate limiting: {e}")
-            self.redis = None
+    In hybrid mode, checks use local token buckets reconciled with Redis
+    in batches (see module docstring).
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = str(settings.REDIS_URL),
+        mode: str = settings.RATE_LIMIT_MODE,
+        sync_interval: float = settings.RATE_LIMIT_SYNC_INTERVAL,
+        local_error: float = settings.RATE_LIMIT_LOCAL_ERROR,
+        max_local_keys: int = settings.RATE_LIMIT_LOCAL_KEYS,
+        retry_interval: float = settings.RATE_LIMIT_REDIS_RETRY_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize rate limiter (connections open on first check).
+
+        Args:
+            redis_url: Redis connection string (None = local buckets only)
+            mode: "redis" (every check in Redis) or "hybrid" (local buckets
+                synced to Redis in batches)
+            sync_interval: Seconds between batch reports (hybrid)
+            local_error: Unreported tokens per key and process, as a
+                fraction of the limit, before an inline report (hybrid)
+            max_local_keys: Max local buckets per process
+            retry_interval: Seconds to skip Redis after an error
+            clock: Monotonic time source for local buckets
+        """
+        if mode not in ("redis", "hybrid"):
+            raise ValueError(f"Unknown rate limit mode: {mode}")
+
+        self.redis_url = redis_url
+        self.mode = mode
+        self.sync_interval = sync_interval
+        self.local_error = local_error
+        self.retry_interval = retry_interval
+        self.clock = clock
+        self.redis: Optional[Redis] = None
+        self.buckets = LocalBuckets(max_local_keys)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._gcra: Optional[AsyncScript] = None
+        self._last_sync = clock()
+        self._retry_redis_at = float("-inf")
+        self._sync_task: Optional[asyncio.Task] = None
 
     async def check_rate_limit(self, key: str, limit: int = 100, window: int = 60) -> None:
         """
-        Check rate limit using sliding window.
+        Check rate limit (burst of `limit`, refilled over `window`).
 
         Args:
             key: Unique identifier (user_id or IP)
@@ -42,48 +129,173 @@ class RateLimiter:
         Raises:
             HTTPException: 429 if rate limit exceeded
         """
-        # If Redis is unavailable, log but don't block
-        if not self.redis:
-            logger.warning("Rate limiter unavailable - allowing request")
+        bucket_key = f"rate_limit:{key}:{limit}:{window}"
+
+        gcra = self._connect()
+        if gcra is None:
+            self._check_local(key, bucket_key, limit, window)
+            return
+
+        if self.mode == "hybrid":
+            bucket = self._check_local(key, bucket_key, limit, window)
+            bucket.pending += 1
+            over_bound = bucket.pending >= bucket.max_unsynced(self.local_error)
+            if over_bound and self.clock() >= self._retry_redis_at:
+                await self._sync([bucket])
+            elif self.clock() - self._last_sync >= self.sync_interval:
+                self._schedule_sync()
             return
 
-        current = int(time.time())
-        window_key = f"rate_limit:{key}:{current // window}"
+        if self.clock() < self._retry_redis_at:
+            self._check_local(key, bucket_key, limit, window)  # Backing off
+            return
 
         try:
-            # Increment counter
-            count = self.redis.incr(window_key)
-
-            # Set expiry on first request
-            if count == 1:
-                self.redis.expire(window_key, window * 2)  # 2x window for safety
-
-            # Check limit
-            if count > limit:
-                retry_after = window - (current % window)
-                logger.warning(
-                    f"Rate limit exceeded for {key}: {count}/{limit}",
-                    extra={"key": key, "count": count, "limit": limit},
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail=f"Rate limit exceeded. Try again in {retry_after} seconds.",
-                    headers={"Retry-After": str(retry_after)},
-                )
-
-            # Log if approaching limit (>80%)
-            if count > limit * 0.8:
-                logger.info(
-                    f"Rate limit warning for {key}: {count}/{limit}",
-                    extra={"key": key, "count": count, "limit": limit},
-                )
-
-        except HTTPException:
-            # Re-raise rate limit exceptions
-            raise
+            allowed, retry_after_ms, remaining = await gcra(
+                keys=[bucket_key],
+                args=[window * 1000 / limit, window * 1000, 1, 0],
+            )
         except Exception as e:
-            # Log error but don't block request if Redis operation fails
-            logger.error(f"Rate limiter error: {e}", exc_info=True)
+            # Don't block on Redis failures: enforce the limit per process
+            self._retry_redis_at = self.clock() + self.retry_interval
+            logger.error(f"Rate limiter error, using local buckets: {e}", exc_info=True)
+            self._check_local(key, bucket_key, limit, window)
+            return
+
+        if not allowed:
+            self._reject(key, limit, window, retry_after_ms / 1000)
+
+        # Log if approaching limit (>80% of the burst used)
+        if remaining < limit * 0.2:
+            logger.info(
+                f"Rate limit warning for {key}: {limit - remaining}/{limit}",
+                extra={"key": key, "remaining": remaining, "limit": limit},
+            )
+
+    async def flush(self) -> None:
+        """Report every pending local consumption to Redis (hybrid mode)."""
+        if self._connect() is not None:
+            await self._sync(list(self.buckets.pending()))
+
+    async def close(self) -> None:
+        """Flush pending consumption and close pooled connections (app shutdown)."""
+        if self.redis is None:
+            return
+
+        if self._loop is asyncio.get_running_loop():
+            await self.flush()
+        await self.redis.aclose()
+        self.redis = None
+        self._loop = None
+
+    def _check_local(self, key: str, bucket_key: str, limit: int, window: int) -> TokenBucket:
+        """
+        Consume one token from the local bucket.
+
+        Returns:
+            TokenBucket the token was taken from
+
+        Raises:
+            HTTPException: 429 if the bucket is empty
+        """
+        bucket = self.buckets.get(bucket_key, limit, window, self.clock())
+        allowed, retry_after = bucket.consume(self.clock())
+        if not allowed:
+            self._reject(key, limit, window, retry_after)
+        return bucket
+
+    @staticmethod
+    def _reject(key: str, limit: int, window: int, retry_after: float) -> None:
+        """Raise 429 with Retry-After (whole seconds, at least 1)."""
+        retry_after = max(1, math.ceil(retry_after))
+        logger.warning(
+            f"Rate limit exceeded for {key}: {limit}/{window}s",
+            extra={"key": key, "limit": limit, "window": window},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded. Try again in {retry_after} seconds.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    def _schedule_sync(self) -> None:
+        """Report pending buckets in the background (one sync at a time)."""
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.ensure_future(self._sync(list(self.buckets.pending())))
+
+    async def _sync(self, buckets: List[TokenBucket]) -> None:
+        """
+        Report buckets' pending tokens to Redis in one pipeline and adopt
+        the global counts (failures keep them pending for the next sync).
+
+        Args:
+            buckets: Buckets with pending consumption
+        """
+        self._last_sync = self.clock()
+        reported = [(bucket, bucket.pending) for bucket in buckets if bucket.pending > 0]
+        redis, gcra = self.redis, self._gcra
+        if not reported or redis is None or gcra is None:  # Nothing to do, or closed
+            return
+
+        try:
+            try:
+                results = await self._report(redis, gcra, reported)
+            except NoScriptError:
+                await redis.script_load(GCRA_SCRIPT)  # New or flushed server
+                results = await self._report(redis, gcra, reported)
+        except Exception as e:
+            # Back off: while Redis is down every inline sync would wait for
+            # the timeout, so only the periodic sync retries until then
+            self._retry_redis_at = self.clock() + self.retry_interval
+            logger.error(f"Rate limiter sync failed: {e}", extra={"buckets": len(reported)})
+            return
+
+        now = self.clock()
+        for (bucket, pending), (_, _, remaining) in zip(reported, results):
+            bucket.reconcile(remaining, pending, now)
+
+    @staticmethod
+    async def _report(
+        redis: Redis, gcra: AsyncScript, reported: List[Tuple[TokenBucket, int]]
+    ) -> list:
+        """Run the GCRA script with force=1 for each (bucket, tokens) in one pipeline."""
+        async with redis.pipeline(transaction=False) as pipe:
+            for bucket, pending in reported:
+                keys_and_args: List[Any] = [
+                    bucket.key, bucket.interval * 1000, bucket.window * 1000, pending, 1,
+                ]
+                pipe.evalsha(gcra.sha, 1, *keys_and_args)
+            return await pipe.execute()
+
+    def _connect(self) -> Optional[AsyncScript]:
+        """
+        Get the GCRA script on a client bound to the running event loop.
+
+        asyncio connections can't move between loops, so the pool is
+        created per loop (once per process under uvicorn).
+
+        Returns:
+            AsyncScript, or None if Redis is disabled
+        """
+        if self.redis_url is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            pool = BlockingConnectionPool.from_url(
+                self.redis_url,
+                max_connections=settings.RATE_LIMIT_REDIS_POOL_SIZE,
+                timeout=settings.RATE_LIMIT_REDIS_TIMEOUT,  # Wait for a free connection
+                socket_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT,
+                socket_connect_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT,
+            )
+            self.redis = Redis(connection_pool=pool)
+            self._gcra = self.redis.register_script(GCRA_SCRIPT)
+            self._sync_task = None  # A task of a previous loop never completes
+            self._loop = loop
+            logger.info("Rate limiter connection pool created")
+
+        return self._gcra
 
 
 # Global instance
@@ -0,0 +1,127 @@
+"""
+Process-local token buckets for rate limiting.
+
+Used by RateLimiter in hybrid mode (checks with no network I/O, consumed
+tokens reconciled with Redis in batches) and as the fallback when Redis
+is disabled or unreachable.
+"""
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterator, Tuple
+
+
+@dataclass
+class TokenBucket:
+    """
+    Token bucket holding up to `limit` tokens, refilled over `window` seconds.
+
+    Same shape as the Redis GCRA limiter: a burst of `limit`, then one
+    request every window / limit seconds.
+    """
+
+    key: str
+    limit: int
+    window: int
+    tokens: float
+    updated_at: float
+    pending: int = 0  # Consumed locally, not yet reported to Redis
+
+    @property
+    def interval(self) -> float:
+        """Seconds to refill one token."""
+        return self.window / self.limit
+
+    def consume(self, now: float) -> Tuple[bool, float]:
+        """
+        Take one token if available.
+
+        Args:
+            now: Monotonic time in seconds
+
+        Returns:
+            (allowed, retry_after seconds; 0 if allowed)
+        """
+        self.refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True, 0.0
+        return False, (1 - self.tokens) * self.interval
+
+    def refill(self, now: float) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.limit, self.tokens + elapsed / self.interval)
+        self.updated_at = now
+
+    def reconcile(self, remaining: int, reported: int, now: float) -> None:
+        """
+        Adopt the global token count after reporting consumption to Redis.
+
+        Args:
+            remaining: Tokens left globally, after this bucket's report
+            reported: Pending tokens included in the report
+            now: Monotonic time in seconds
+        """
+        self.pending -= reported
+        self.refill(now)
+        # Tokens consumed while the report was in flight aren't in `remaining`
+        self.tokens = max(0.0, min(self.limit, remaining - self.pending))
+
+    def max_unsynced(self, error: float) -> int:
+        """
+        Tokens this process may consume before reporting them inline.
+
+        Args:
+            error: Allowed overshoot per process, as a fraction of limit
+
+        Returns:
+            int: At least 1
+        """
+        return max(1, math.floor(self.limit * error))
+
+
+class LocalBuckets:
+    """LRU of token buckets keyed by (key, limit, window)."""
+
+    def __init__(self, max_keys: int):
+        """
+        Initialize empty buckets.
+
+        Args:
+            max_keys: Max buckets kept (least recently used are dropped,
+                with any unreported consumption)
+        """
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def get(self, key: str, limit: int, window: int, now: float) -> TokenBucket:
+        """
+        Get (or create, full) the bucket for a key and limit.
+
+        Args:
+            key: Bucket key (shared with the Redis key)
+            limit: Max requests per window
+            window: Time window in seconds
+            now: Monotonic time in seconds
+
+        Returns:
+            TokenBucket
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(key, limit, window, float(limit), now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def pending(self) -> Iterator[TokenBucket]:
+        """Buckets with consumption not yet reported to Redis."""
+        return (bucket for bucket in list(self._buckets.values()) if bucket.pending > 0)
+
+    def __len__(self) -> int:
+        """Number of buckets."""
+        return len(self._buckets)
@@ -62,7 +62,8 @@ class DesignListResponse(BaseModel):
     """Paginated design list response."""
     
     designs: list[DesignResponse]
-    total: int
+    total: int | None  # None when not requested (cursor pages skip COUNT)
     skip: int
     limit: int
     has_more: bool
+    next_cursor: str | None = None
@@ -0,0 +1,43 @@
+"""Opaque keyset pagination cursors."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    """
+    Encode the (created_at, id) sort key of the last item of a page.
+    
+    Args:
+        created_at: Creation timestamp of the last item
+        item_id: ID of the last item
+        
+    Returns:
+        URL-safe opaque cursor
+    """
+    raw = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Args:
+        cursor: Opaque cursor from a previous page
+        
+    Returns:
+        (created_at, id) sort key
+        
+    Raises:
+        ValueError: If cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, item_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(item_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
@@ -1,12 +1,22 @@
 """Shared services."""
 
-from .password_service import hash_password, verify_password, needs_rehash
+from .password_service import (
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+    needs_rehash,
+)
+from .password_pool import PasswordPoolSaturatedError
 from .jwt_service import create_access_token, decode_access_token
 
 __all__ = [
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
     "needs_rehash",
+    "PasswordPoolSaturatedError",
     "create_access_token",
     "decode_access_token",
 ]
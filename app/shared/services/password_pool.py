@@ -0,0 +1,165 @@
+"""
+Bounded thread pool for password hashing and verification.
+
+A bcrypt hash or verify takes hundreds of milliseconds of CPU; run inline
+in an async handler it stalls every request on that event loop. The pool
+runs them on PASSWORD_HASH_WORKERS threads (bcrypt releases the GIL) and
+admits at most PASSWORD_HASH_QUEUE_SIZE more waiting operations. Beyond
+that, callers get PasswordPoolSaturatedError (503 + Retry-After) right
+away instead of queueing behind work that would outlive their timeouts.
+
+Threads don't survive fork, so forked children create their own pool.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable, Optional, TypeVar
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config import settings
+
+T = TypeVar("T")
+
+PASSWORD_POOL_IN_FLIGHT = Gauge(
+    "customify_password_pool_in_flight",
+    "Password operations running or queued in the pool",
+)
+
+PASSWORD_POOL_CAPACITY = Gauge(
+    "customify_password_pool_capacity",
+    "Max password operations running or queued (workers + queue size)",
+)
+
+PASSWORD_POOL_REJECTED = Counter(
+    "customify_password_pool_rejected_total",
+    "Password operations shed because the pool was saturated",
+)
+
+PASSWORD_POOL_WAIT_SECONDS = Histogram(
+    "customify_password_pool_wait_seconds",
+    "Time password operations spent queued before a worker picked them up",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+class PasswordPoolSaturatedError(Exception):
+    """Password pool is at capacity; the caller should retry later."""
+
+    def __init__(self, retry_after: int):
+        """
+        Initialize error.
+
+        Args:
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__("Too many password operations in progress, retry later")
+        self.retry_after = retry_after
+
+
+class PasswordPool:
+    """
+    Thread pool with a hard limit on running + queued operations.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.PASSWORD_HASH_WORKERS,
+        queue_size: int = settings.PASSWORD_HASH_QUEUE_SIZE,
+        retry_after: int = settings.PASSWORD_HASH_RETRY_AFTER,
+    ):
+        """
+        Initialize pool (threads start on first use).
+
+        Args:
+            workers: Threads running password operations
+            queue_size: Operations allowed to wait for a thread
+            retry_after: Retry-After seconds reported when saturated
+        """
+        self.capacity = workers + queue_size
+        self.retry_after = retry_after
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password")
+        PASSWORD_POOL_CAPACITY.set(self.capacity)
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """
+        Run a blocking function in the pool without blocking the event loop.
+
+        Args:
+            fn: Blocking callable (hash/verify)
+            *args: Arguments for fn
+
+        Returns:
+            fn's result
+
+        Raises:
+            PasswordPoolSaturatedError: If capacity is exhausted
+        """
+        if not self._slots.acquire(blocking=False):
+            PASSWORD_POOL_REJECTED.inc()
+            raise PasswordPoolSaturatedError(self.retry_after)
+
+        PASSWORD_POOL_IN_FLIGHT.inc()
+        submitted = perf_counter()
+
+        def task() -> T:
+            PASSWORD_POOL_WAIT_SECONDS.observe(perf_counter() - submitted)
+            return fn(*args)
+
+        try:
+            future = self._executor.submit(task)
+        except BaseException:
+            self._release()
+            raise
+        # Release when the thread finishes, even if the awaiting request is cancelled
+        future.add_done_callback(lambda _: self._release())
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads.
+
+        Args:
+            wait: Wait for running operations to finish
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _release(self) -> None:
+        """Free one slot."""
+        PASSWORD_POOL_IN_FLIGHT.dec()
+        self._slots.release()
+
+
+_pool: Optional[PasswordPool] = None
+_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's pool (and lock) in a forked child process."""
+    global _pool, _lock
+    _pool = None
+    _lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_password_pool() -> PasswordPool:
+    """
+    Get this process's password pool (created on first use).
+
+    Returns:
+        PasswordPool sized by PASSWORD_HASH_WORKERS / PASSWORD_HASH_QUEUE_SIZE
+    """
+    global _pool
+
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = PasswordPool()
+
+    return _pool
@@ -4,11 +4,15 @@ Password hashing and verification service.
 This service handles all password-related operations to keep
 domain entities clean and framework-independent.
 
-Uses passlib with bcrypt for secure password hashing.
+Uses passlib with bcrypt for secure password hashing. Async code must use
+the *_async variants, which run bcrypt on the bounded password pool
+instead of blocking the event loop.
 """
 
 from passlib.context import CryptContext
 
+from app.shared.services.password_pool import get_password_pool
+
 # Configure password context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -52,6 +56,39 @@ def verify_password(plain_password: str, password_hash: str) -> bool:
     return pwd_context.verify(plain_password, password_hash)
 
 
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a plain password on the password pool.
+    
+    Args:
+        password: Plain text password
+        
+    Returns:
+        Hashed password string
+        
+    Raises:
+        PasswordPoolSaturatedError: If the pool is at capacity
+    """
+    return await get_password_pool().run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, password_hash: str) -> bool:
+    """
+    Verify a plain password against a hash on the password pool.
+    
+    Args:
+        plain_password: Plain text password to verify
+        password_hash: Previously hashed password
+        
+    Returns:
+        True if password matches, False otherwise
+        
+    Raises:
+        PasswordPoolSaturatedError: If the pool is at capacity
+    """
+    return await get_password_pool().run(verify_password, plain_password, password_hash)
+
+
 def needs_rehash(password_hash: str) -> bool:
     """
     Check if a password hash needs to be rehashed.
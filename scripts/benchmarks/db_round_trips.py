@@ -0,0 +1,249 @@
+"""
+Count database round trips of the register, login and create-design flows.
+
+Runs each use case against the database in DATABASE_URL with the async
+repositories, one session (and commit) per flow execution, and counts
+the statements sent to the server plus the time spent waiting for them.
+Each flow runs twice: with the legacy repository writes (create = INSERT
++ refresh SELECT, update = SELECT + UPDATE + refresh SELECT, as before)
+and with the current single INSERT/UPDATE ... RETURNING writes.
+The render job enqueue in create-design is replaced by a no-op, so only
+database work is measured.
+
+Usage:
+    python -m scripts.benchmarks.db_round_trips [--runs 50]
+"""
+
+import argparse
+import asyncio
+import statistics
+import uuid
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy import delete, event, select, update
+
+from app.application.use_cases.auth.login_user import LoginUserUseCase
+from app.application.use_cases.auth.register_user import RegisterUserUseCase
+from app.application.use_cases.designs.create_design import CreateDesignUseCase
+from app.infrastructure.database.converters import (
+    design_converter,
+    subscription_converter,
+    user_converter,
+)
+from app.infrastructure.database.models.design_model import DesignModel
+from app.infrastructure.database.models.subscription_model import SubscriptionModel
+from app.infrastructure.database.models.user_model import UserModel
+from app.infrastructure.database.repositories.design_repo_impl import DesignRepositoryImpl
+from app.infrastructure.database.repositories.subscription_repo_impl import SubscriptionRepositoryImpl
+from app.infrastructure.database.repositories.user_repo_impl import UserRepositoryImpl
+from app.infrastructure.database.session import AsyncSessionLocal, Base, engine
+from app.infrastructure.workers.tasks.render_design import render_design_preview
+
+PASSWORD = "BenchPass123!"
+
+
+class LegacyWrites:
+    """The previous writes: flush + refresh, and a SELECT before each update."""
+
+    model: Any = None  # ORM model class
+    converter: Any = None  # Entity <-> model converter module
+
+    async def create(self, entity):
+        model = self.converter.to_model(entity)
+        self.session.add(model)
+        await self.session.flush()
+        await self.session.refresh(model)
+        return self.converter.to_entity(model)
+
+    async def update(self, entity):
+        result = await self.session.execute(select(self.model).where(self.model.id == entity.id))
+        model = self.converter.to_model(entity, result.scalar_one())
+        await self.session.flush()
+        await self.session.refresh(model)
+        return self.converter.to_entity(model)
+
+
+class LegacyUserRepository(LegacyWrites, UserRepositoryImpl):
+    model = UserModel
+    converter = user_converter
+
+
+class LegacySubscriptionRepository(LegacyWrites, SubscriptionRepositoryImpl):
+    model = SubscriptionModel
+    converter = subscription_converter
+
+
+class LegacyDesignRepository(LegacyWrites, DesignRepositoryImpl):
+    model = DesignModel
+    converter = design_converter
+
+
+REPOSITORIES = {
+    "legacy": SimpleNamespace(
+        users=LegacyUserRepository,
+        subscriptions=LegacySubscriptionRepository,
+        designs=LegacyDesignRepository,
+    ),
+    "returning": SimpleNamespace(
+        users=UserRepositoryImpl,
+        subscriptions=SubscriptionRepositoryImpl,
+        designs=DesignRepositoryImpl,
+    ),
+}
+
+
+class StatementCounter:
+    """Counts statements and server wait time on an engine."""
+
+    def __init__(self, sync_engine):
+        self.statements = 0
+        self.seconds = 0.0
+        self._started = []
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.seconds = 0.0
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        self._started.append(perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements += 1
+        self.seconds += perf_counter() - self._started.pop()
+
+
+async def register(repos: SimpleNamespace, email: str) -> None:
+    """Register flow (one session, committed)."""
+    async with AsyncSessionLocal() as session:
+        await RegisterUserUseCase(
+            repos.users(session), repos.subscriptions(session)
+        ).execute(email=email, password=PASSWORD, full_name="Bench User")
+        await session.commit()
+
+
+async def login(repos: SimpleNamespace, email: str) -> str:
+    """Login flow; returns the user ID."""
+    async with AsyncSessionLocal() as session:
+        user, _ = await LoginUserUseCase(repos.users(session)).execute(email, PASSWORD)
+        await session.commit()
+    return user.id
+
+
+async def create_design(repos: SimpleNamespace, user_id: str, i: int) -> None:
+    """Create-design flow (quota check, insert, usage increment)."""
+    async with AsyncSessionLocal() as session:
+        await CreateDesignUseCase(
+            repos.designs(session), repos.subscriptions(session)
+        ).execute(
+            user_id=user_id,
+            product_type="t-shirt",
+            design_data={"text": f"Bench {i}", "font": "Bebas-Bold", "color": "#FF5733"},
+        )
+        await session.commit()
+
+
+async def reset_usage(user_id: str) -> None:
+    """Reset the monthly usage counter so the free plan quota never runs out."""
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(SubscriptionModel)
+            .where(SubscriptionModel.user_id == user_id)
+            .values(designs_this_month=0)
+        )
+        await session.commit()
+
+
+async def measure(counter: StatementCounter, flow, runs: int, setup=None) -> dict:
+    """
+    Run a flow repeatedly and collect per-run statement counts and timings.
+
+    Args:
+        counter: Statement counter attached to the engine
+        flow: Async callable taking the run index
+        runs: Number of executions
+        setup: Optional async callable run before each execution (not counted)
+
+    Returns:
+        dict with statements/run, median db ms and median wall ms
+    """
+    statements, db_ms, wall_ms = [], [], []
+    for i in range(runs):
+        if setup is not None:
+            await setup()
+        counter.reset()
+        start = perf_counter()
+        await flow(i)
+        wall_ms.append((perf_counter() - start) * 1000)
+        statements.append(counter.statements)
+        db_ms.append(counter.seconds * 1000)
+
+    return {
+        "statements": statistics.mean(statements),
+        "db_ms": statistics.median(db_ms),
+        "wall_ms": statistics.median(wall_ms),
+    }
+
+
+async def benchmark(runs: int) -> None:
+    """
+    Print statements per flow and database wait time, legacy vs current writes.
+
+    Args:
+        runs: Executions per flow
+    """
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    # Measure database work only: don't enqueue render jobs
+    render_design_preview.apply_async = lambda *args, **kwargs: SimpleNamespace(id=str(uuid.uuid4()))
+
+    counter = StatementCounter(engine.sync_engine)
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    email = f"{prefix}-login@example.com"
+    current = REPOSITORIES["returning"]
+    await register(current, email)
+    user_id = await login(current, email)
+
+    def flows(writes: str, repos: SimpleNamespace) -> dict:
+        return {
+            "register": (lambda i: register(repos, f"{prefix}-{writes}-{i}@example.com"), None),
+            "login": (lambda i: login(repos, email), None),
+            "create-design": (
+                lambda i: create_design(repos, user_id, i), lambda: reset_usage(user_id)
+            ),
+        }
+
+    print(f"\n📊 {runs} runs per flow\n")
+    print(f"{'flow':<15}{'writes':<11}{'statements':>11}{'db ms':>9}{'wall ms':>9}")
+    try:
+        results = {
+            writes: {
+                name: await measure(counter, flow, runs, setup)
+                for name, (flow, setup) in flows(writes, repos).items()
+            }
+            for writes, repos in REPOSITORIES.items()
+        }
+        for name in results["returning"]:
+            for writes in REPOSITORIES:
+                result = results[writes][name]
+                print(
+                    f"{name:<15}{writes:<11}{result['statements']:>11.1f}"
+                    f"{result['db_ms']:>9.2f}{result['wall_ms']:>9.2f}"
+                )
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(UserModel).where(UserModel.email.like(f"{prefix}%")))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.runs))
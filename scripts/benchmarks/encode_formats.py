@@ -0,0 +1,79 @@
+"""
+Compare output size and encode time of design asset formats.
+
+Renders sample designs with the worker renderer, then encodes each one with
+every candidate variant spec (PNG compress levels, WebP, JPEG, AVIF when
+Pillow supports it).
+
+Usage:
+    python -m scripts.benchmarks.encode_formats [--size 600] [--runs 20]
+"""
+
+import argparse
+import statistics
+from time import perf_counter
+
+from app.infrastructure.rendering.variants import VariantSpec, encode_variant, format_supported
+from app.infrastructure.workers.tasks.render_design import _draw_design
+
+SAMPLE_DESIGNS = [
+    {"text": "Hello World", "font": "Bebas-Bold", "color": "#FF5733", "fontSize": 48},
+    {"text": "CUSTOMIFY", "font": "Montserrat-Bold", "color": "#1A1A1A", "fontSize": 72},
+    {"text": "Best Dad Ever", "font": "Pacifico-Regular", "color": "#FFFFFF", "fontSize": 36},
+]
+
+CANDIDATES = [
+    {"format": "png"},
+    {"format": "png", "compress_level": 1},
+    {"format": "png", "compress_level": 9},
+    {"format": "webp", "lossless": True},
+    {"format": "webp", "quality": 80},
+    {"format": "jpeg", "quality": 85},
+    {"format": "avif", "quality": 60},
+]
+
+
+def benchmark(size: int, runs: int) -> None:
+    """
+    Print a bytes / encode-time table per candidate format.
+    
+    Args:
+        size: Variant size in pixels
+        runs: Encodes per design and candidate (median is reported)
+    """
+    images = [_draw_design(design, "t-shirt", size=size) for design in SAMPLE_DESIGNS]
+    baseline = None
+    
+    print(f"\n📊 Encoding {len(images)} designs at {size}x{size}, {runs} runs each\n")
+    print(f"{'variant':<26}{'avg bytes':>12}{'vs png':>9}{'median ms':>12}")
+    
+    for options in CANDIDATES:
+        if not format_supported(options["format"]):
+            print(f"{options['format']:<26}{'(not supported by installed Pillow)':>33}")
+            continue
+        
+        spec = VariantSpec(name=options["format"], size=size, **options)
+        sizes, timings = [], []
+        
+        for image in images:
+            for _ in range(runs):
+                start = perf_counter()
+                variant = encode_variant(image, spec)
+                timings.append((perf_counter() - start) * 1000)
+            sizes.append(variant.buffer.getbuffer().nbytes)
+        
+        avg_bytes = statistics.mean(sizes)
+        baseline = baseline or avg_bytes
+        print(
+            f"{spec.asset_name:<26}{avg_bytes:>12,.0f}{avg_bytes / baseline:>8.2f}x"
+            f"{statistics.median(timings):>12.2f}"
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=600)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    
+    benchmark(args.size, args.runs)
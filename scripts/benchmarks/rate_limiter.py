@@ -0,0 +1,190 @@
+"""
+Compare event-loop latency of the legacy sync, async GCRA and hybrid rate limiters.
+
+Runs concurrent coroutines that each check the rate limit in a loop (like
+concurrent API requests) against the Redis in REDIS_URL, while a probe
+coroutine measures event-loop lag: how late a 1 ms sleep wakes up. The
+legacy limiter (sync INCR + EXPIRE, as before) blocks the loop for each
+round trip; the async limiter runs one EVALSHA on a pooled connection and
+yields while waiting; the hybrid limiter checks a local token bucket and
+reports to Redis in batches. The gap grows with Redis latency: --latency-ms
+routes both limiters through a local TCP proxy that delays every packet
+(round trip = latency), like a Redis on another host.
+
+Usage:
+    python -m scripts.benchmarks.rate_limiter [--concurrency 50] [--seconds 5] [--latency-ms 1]
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+import uuid
+from time import perf_counter
+from urllib.parse import urlsplit
+
+from redis import Redis
+
+from app.config import settings
+from app.presentation.middleware.rate_limiter import RateLimiter
+
+
+class LegacyRateLimiter:
+    """The previous implementation: sync client, fixed window, two round trips."""
+
+    def __init__(self, redis_url: str):
+        self.redis = Redis.from_url(redis_url, decode_responses=True)
+
+    async def check_rate_limit(self, key: str, limit: int = 100, window: int = 60) -> None:
+        current = int(time.time())
+        window_key = f"rate_limit:{key}:{current // window}"
+        count = self.redis.incr(window_key)
+        if count == 1:
+            self.redis.expire(window_key, window * 2)
+
+    async def close(self) -> None:
+        self.redis.close()
+
+
+def start_latency_proxy(redis_url: str, latency: float) -> str:
+    """
+    Start a TCP proxy to Redis adding latency / 2 in each direction.
+
+    Runs its own event loop in a daemon thread.
+
+    Args:
+        redis_url: Upstream Redis URL
+        latency: Added round trip in seconds
+
+    Returns:
+        Redis URL pointing at the proxy
+    """
+    upstream = urlsplit(redis_url)
+    ready = threading.Event()
+    address = {}
+
+    async def pipe(reader, writer):
+        try:
+            while data := await reader.read(65536):
+                await asyncio.sleep(latency / 2)
+                writer.write(data)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def handle(client_reader, client_writer):
+        server_reader, server_writer = await asyncio.open_connection(
+            upstream.hostname, upstream.port or 6379
+        )
+        await asyncio.gather(
+            pipe(client_reader, server_writer),
+            pipe(server_reader, client_writer),
+            return_exceptions=True,
+        )
+
+    async def serve():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        address["port"] = server.sockets[0].getsockname()[1]
+        ready.set()
+        await server.serve_forever()
+
+    threading.Thread(target=lambda: asyncio.run(serve()), daemon=True).start()
+    ready.wait()
+    return upstream._replace(netloc=f"127.0.0.1:{address['port']}").geturl()
+
+
+async def probe_loop_lag(stop: asyncio.Event, lags: list) -> None:
+    """Record how late a 1 ms sleep resumes until stopped."""
+    while not stop.is_set():
+        start = perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((perf_counter() - start - 0.001) * 1000)
+
+
+async def run(limiter, concurrency: int, seconds: float) -> dict:
+    """
+    Hammer one limiter and measure throughput and loop lag.
+
+    Args:
+        limiter: Object with async check_rate_limit(key, limit, window)
+        concurrency: Concurrent request coroutines
+        seconds: Duration
+
+    Returns:
+        dict with checks/sec, check latency and loop lag percentiles (ms)
+    """
+    prefix = f"bench:{uuid.uuid4().hex[:8]}"
+    await limiter.check_rate_limit(f"{prefix}:warmup")
+
+    stop = asyncio.Event()
+    lags, latencies = [], []
+
+    async def requests(worker: int) -> None:
+        while not stop.is_set():
+            start = perf_counter()
+            # Generous limit: measure the check, never reject
+            await limiter.check_rate_limit(f"{prefix}:{worker}", limit=10**9, window=60)
+            latencies.append((perf_counter() - start) * 1000)
+            await asyncio.sleep(0)
+
+    probe = asyncio.ensure_future(probe_loop_lag(stop, lags))
+    workers = [asyncio.ensure_future(requests(i)) for i in range(concurrency)]
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(probe, *workers)
+    await limiter.close()
+
+    lags.sort()
+    return {
+        "rps": len(latencies) / seconds,
+        "check_p50": statistics.median(latencies),
+        "lag_p50": statistics.median(lags),
+        "lag_p99": lags[int(len(lags) * 0.99)],
+        "lag_max": lags[-1],
+    }
+
+
+async def benchmark(concurrency: int, seconds: float, latency: float) -> None:
+    """
+    Print throughput and event-loop lag per limiter.
+
+    Args:
+        concurrency: Concurrent request coroutines
+        seconds: Duration per limiter
+        latency: Added Redis round trip in seconds (0 = direct)
+    """
+    redis_url = str(settings.REDIS_URL)
+    if latency > 0:
+        redis_url = start_latency_proxy(redis_url, latency)
+
+    print(
+        f"\n📊 {concurrency} concurrent checkers, {seconds:.0f}s each, "
+        f"+{latency * 1000:.1f} ms Redis round trip\n"
+    )
+    print(
+        f"{'limiter':<12}{'checks/s':>10}{'check p50 ms':>14}"
+        f"{'lag p50 ms':>12}{'lag p99 ms':>12}{'lag max ms':>12}"
+    )
+
+    limiters = (
+        ("legacy-sync", LegacyRateLimiter(redis_url)),
+        ("async-gcra", RateLimiter(redis_url)),
+        ("hybrid", RateLimiter(redis_url, mode="hybrid")),
+    )
+    for name, limiter in limiters:
+        result = await run(limiter, concurrency, seconds)
+        print(
+            f"{name:<12}{result['rps']:>10,.0f}{result['check_p50']:>14.2f}"
+            f"{result['lag_p50']:>12.2f}{result['lag_p99']:>12.2f}{result['lag_max']:>12.2f}"
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Added Redis round trip")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.concurrency, args.seconds, args.latency_ms / 1000))
@@ -0,0 +1,202 @@
+"""
+Measure render_design_preview throughput per storage backend and concurrency.
+
+Runs the full task (claim, render, encode, upload, publish against the
+database in DATABASE_URL) in a pool of forked worker processes, like Celery
+prefork children, with uploads routed to:
+
+- memory: InMemoryStorageRepository, no I/O cost (pure render pipeline)
+- memory-s3: InMemoryStorageRepository with injected S3-like latency/bandwidth
+- local: LocalStorageRepository in a temporary directory
+
+No AWS access is needed. Every design gets unique text, so fingerprint
+dedupe never skips a render.
+
+Usage:
+    python -m scripts.benchmarks.render_throughput [--designs 200] [--concurrency 1,2,4]
+        [--latency-ms 20] [--bandwidth-mbps 50]
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import uuid
+from time import perf_counter
+
+from app.domain.entities.design import Design
+from app.domain.entities.user import User
+from app.infrastructure.database.converters import design_converter, user_converter
+from app.infrastructure.database.models.design_model import DesignModel
+from app.infrastructure.database.models.user_model import UserModel
+from app.infrastructure.database.session import Base
+from app.infrastructure.database.sync_session import SyncSessionLocal, sync_engine
+from app.infrastructure.rendering.font_registry import font_registry
+from app.infrastructure.storage.local_storage import LocalStorageRepository
+from app.infrastructure.storage.memory_storage import InMemoryStorageRepository
+from app.infrastructure.workers.tasks import render_design
+
+BACKENDS = ("memory", "memory-s3", "local")
+
+
+def build_backend(name: str, latency: float, bandwidth: float, local_path: str):
+    """
+    Build a storage backend by benchmark name.
+
+    Args:
+        name: Backend name (see BACKENDS)
+        latency: Injected round trip in seconds (memory-s3)
+        bandwidth: Injected bandwidth in bytes/second (memory-s3)
+        local_path: Base directory (local)
+
+    Returns:
+        IStorageRepository instance
+    """
+    if name == "memory":
+        return InMemoryStorageRepository()
+    if name == "memory-s3":
+        return InMemoryStorageRepository(latency=latency, bandwidth=bandwidth)
+    return LocalStorageRepository(base_path=local_path)
+
+
+def init_worker(name: str, latency: float, bandwidth: float, local_path: str) -> None:
+    """Per-process setup, like warm_up_worker_process (runs in each forked child)."""
+    sync_engine.dispose(close=False)  # Don't reuse the parent's connections
+    font_registry.preload()
+    storage = build_backend(name, latency, bandwidth, local_path)
+    render_design.get_storage_repository = lambda: storage
+
+
+def render_one(design_id: str) -> dict:
+    """Run the task body synchronously in a worker process."""
+    return render_design.render_design_preview(design_id)
+
+
+def create_designs(count: int, label: str) -> tuple:
+    """
+    Persist a user with unique draft designs.
+
+    Args:
+        count: Number of designs
+        label: Text prefix (unique per run)
+
+    Returns:
+        (user_id, list of design IDs)
+    """
+    user = User.create(
+        email=f"bench-{uuid.uuid4().hex[:8]}@example.com", password_hash="hash", full_name="Bench"
+    )
+    designs = [
+        Design.create(
+            user_id=user.id,
+            product_type="t-shirt",
+            design_data={"text": f"{label} {i}", "font": "Bebas-Bold", "color": "#FF5733"},
+        )
+        for i in range(count)
+    ]
+
+    with SyncSessionLocal() as session:
+        session.add(user_converter.to_model(user))
+        session.flush()
+        session.add_all([design_converter.to_model(design) for design in designs])
+        session.commit()
+
+    return user.id, [design.id for design in designs]
+
+
+def delete_user(user_id: str) -> None:
+    """Remove a benchmark user and its designs."""
+    with SyncSessionLocal() as session:
+        session.query(DesignModel).filter(DesignModel.user_id == user_id).delete()
+        session.query(UserModel).filter(UserModel.id == user_id).delete()
+        session.commit()
+
+
+def run(backend: str, concurrency: int, designs: int, latency: float, bandwidth: float) -> dict:
+    """
+    Render a fresh set of designs with one backend and worker count.
+
+    Returns:
+        dict with renders/sec, renders/sec per core and median stage timings
+    """
+    user_id, design_ids = create_designs(designs, f"{backend} x{concurrency} {uuid.uuid4().hex[:6]}")
+    context = multiprocessing.get_context("fork")
+
+    try:
+        with tempfile.TemporaryDirectory() as local_path:
+            with context.Pool(
+                concurrency,
+                initializer=init_worker,
+                initargs=(backend, latency, bandwidth, local_path),
+            ) as pool:
+                pool.map(render_one, design_ids[:concurrency])  # Warm every child
+                start = perf_counter()
+                results = pool.map(render_one, design_ids[concurrency:], chunksize=1)
+                elapsed = perf_counter() - start
+    finally:
+        delete_user(user_id)
+
+    failed = [result for result in results if result["status"] != "success"]
+    if failed:
+        raise RuntimeError(f"{len(failed)} renders did not succeed: {failed[0]}")
+
+    rps = len(results) / elapsed
+    cores = min(concurrency, os.cpu_count() or 1)
+    stages = ("draw", "encode", "upload", "total")
+    return {
+        "rps": rps,
+        "rps_per_core": rps / cores,
+        **{
+            stage: statistics.median(result["timings_ms"].get(stage, 0.0) for result in results)
+            for stage in stages
+        },
+    }
+
+
+def benchmark(designs: int, concurrency_levels: list, latency: float, bandwidth: float) -> None:
+    """
+    Print a throughput table per backend and concurrency level.
+
+    Args:
+        designs: Designs rendered per run (after one warm-up render per worker)
+        concurrency_levels: Worker process counts
+        latency: memory-s3 round trip in seconds
+        bandwidth: memory-s3 bandwidth in bytes/second
+    """
+    Base.metadata.create_all(sync_engine)
+    sync_engine.dispose()  # Children open their own connections
+
+    print(
+        f"\n📊 {designs} renders per run, {os.cpu_count()} CPUs, "
+        f"memory-s3 = {latency * 1000:.0f} ms + {bandwidth / 1e6:.0f} MB/s\n"
+    )
+    print(
+        f"{'backend':<11}{'workers':>8}{'renders/s':>11}{'per core':>10}"
+        f"{'draw ms':>9}{'encode ms':>11}{'upload ms':>11}{'total ms':>10}"
+    )
+
+    for backend in BACKENDS:
+        for concurrency in concurrency_levels:
+            result = run(backend, concurrency, designs + concurrency, latency, bandwidth)
+            print(
+                f"{backend:<11}{concurrency:>8}{result['rps']:>11.1f}{result['rps_per_core']:>10.1f}"
+                f"{result['draw']:>9.1f}{result['encode']:>11.1f}{result['upload']:>11.1f}"
+                f"{result['total']:>10.1f}"
+            )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--designs", type=int, default=200)
+    parser.add_argument("--concurrency", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--bandwidth-mbps", type=float, default=50.0, help="Megabytes per second")
+    args = parser.parse_args()
+
+    benchmark(
+        args.designs,
+        [int(level) for level in args.concurrency.split(",")],
+        args.latency_ms / 1000,
+        args.bandwidth_mbps * 1e6,
+    )
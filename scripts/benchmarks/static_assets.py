@@ -0,0 +1,131 @@
+"""
+Compare the /static asset handler with Starlette's plain StaticFiles mount.
+
+Writes a set of thumbnail-sized files into a temporary storage root and
+simulates dashboard reloads against both mounts (in-process ASGI, so the
+numbers measure handler overhead, not the network):
+
+- full: every request downloads the file
+- reload: browser revalidates with the ETag from its first fetch
+  (If-None-Match), which AssetStaticFiles answers with 304
+
+Usage:
+    python -m scripts.benchmarks.static_assets [--files 100] [--size 20000] [--rounds 20]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI
+from starlette.staticfiles import StaticFiles
+
+from app.infrastructure.storage.static_files import AssetStaticFiles
+
+MOUNTS = {
+    "StaticFiles": StaticFiles,
+    "AssetStaticFiles": AssetStaticFiles,
+}
+
+
+def write_assets(root: str, files: int, size: int) -> list:
+    """
+    Write sample assets in the sharded render layout.
+
+    Args:
+        root: Storage root
+        files: Number of files
+        size: Bytes per file
+
+    Returns:
+        List of URL paths under /static
+    """
+    paths = []
+    for i in range(files):
+        key = f"renders/{i:04x}/{i:04x}/{i:08x}/thumbnail.png"
+        path = os.path.join(root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(os.urandom(size))
+        paths.append(f"/static/{key}")
+    return paths
+
+
+async def run_scenario(client: httpx.AsyncClient, paths: list, rounds: int, revalidate: bool) -> dict:
+    """
+    Fetch every path once per round (one page of thumbnails per round).
+
+    Args:
+        client: Client bound to the app under test
+        paths: Asset URL paths
+        rounds: Page reloads
+        revalidate: Send If-None-Match with the ETag from a first fetch
+
+    Returns:
+        dict with requests/sec, bytes transferred and status counts
+    """
+    etags = {}
+    if revalidate:
+        for path in paths:
+            etags[path] = (await client.get(path)).headers["etag"]
+
+    statuses = {}
+    transferred = 0
+    start = perf_counter()
+    for _ in range(rounds):
+        responses = await asyncio.gather(*[
+            client.get(path, headers={"If-None-Match": etags[path]} if revalidate else None)
+            for path in paths
+        ])
+        for response in responses:
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            transferred += len(response.content)
+    elapsed = perf_counter() - start
+
+    return {
+        "rps": rounds * len(paths) / elapsed,
+        "bytes": transferred,
+        "statuses": statuses,
+    }
+
+
+async def benchmark(files: int, size: int, rounds: int) -> None:
+    """
+    Print requests/sec and bytes transferred per mount and scenario.
+
+    Args:
+        files: Assets per page
+        size: Bytes per asset
+        rounds: Page loads per scenario
+    """
+    with tempfile.TemporaryDirectory() as root:
+        paths = write_assets(root, files, size)
+
+        print(f"\n📊 {files} assets x {size:,} bytes, {rounds} page loads per scenario\n")
+        print(f"{'mount':<18}{'scenario':<10}{'req/s':>10}{'bytes':>14}  statuses")
+
+        for name, mount in MOUNTS.items():
+            app = FastAPI()
+            app.mount("/static", mount(directory=root), name="static")
+            transport = httpx.ASGITransport(app=app)
+
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                for scenario, revalidate in (("full", False), ("reload", True)):
+                    result = await run_scenario(client, paths, rounds, revalidate)
+                    print(
+                        f"{name:<18}{scenario:<10}{result['rps']:>10,.0f}"
+                        f"{result['bytes']:>14,}  {result['statuses']}"
+                    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.files, args.size, args.rounds))
@@ -0,0 +1,122 @@
+"""
+Migrate a local storage tree to the sharded layout.
+
+Moves every flat directory:
+    storage/designs/{id}/...      -> storage/designs/ab/cd/{id}/...
+    storage/renders/{fp}/...      -> storage/renders/ab/cd/{fp}/...
+and optionally rewrites preview/thumbnail URLs stored in the designs table.
+
+Moves are renames on the same volume (no copies) and the tool is
+idempotent: already sharded entries are skipped, so it can be re-run
+after an interruption.
+
+Run with: python scripts/migrate_local_storage.py [--base-path ./storage] [--dry-run] [--update-db]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.infrastructure.storage.local_storage import SHARDED_PREFIXES, shard_key  # noqa: E402 (needs project root on path)
+
+# Postgres regex: /static/{prefix}/{id}/ with an unsharded id (>= 4 chars)
+UNSHARDED_URL_PATTERN = r"/static/(designs|renders)/(([^/]{2})([^/]{2})[^/]*)/"
+SHARDED_URL_REPLACEMENT = r"/static/\1/\3/\4/\2/"
+
+
+def migrate_tree(base_path: Path, dry_run: bool = False) -> int:
+    """
+    Move flat entries into shard directories.
+    
+    Args:
+        base_path: Local storage root
+        dry_run: Only print planned moves
+    
+    Returns:
+        int: Number of entries moved
+    """
+    moved = 0
+    
+    for prefix in SHARDED_PREFIXES:
+        root = base_path / prefix
+        if not root.is_dir():
+            continue
+        
+        # Snapshot first: shard directories are created while iterating
+        for entry in list(os.scandir(root)):
+            # Shard directories have 2-char names; IDs are longer
+            if not entry.is_dir() or len(entry.name) < 4:
+                continue
+            
+            target = base_path / Path(shard_key(f"{prefix}/{entry.name}/x")).parent
+            print(f"  {prefix}/{entry.name} -> {target.relative_to(base_path)}")
+            
+            if not dry_run:
+                _move_dir(Path(entry.path), target)
+            moved += 1
+    
+    return moved
+
+
+def _move_dir(source: Path, target: Path) -> None:
+    """Rename a directory into place, merging file by file if target exists."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    
+    if not target.exists():
+        os.replace(source, target)
+        return
+    
+    # Interrupted earlier run: finish moving remaining files
+    for file in source.iterdir():
+        os.replace(file, target / file.name)
+    source.rmdir()
+
+
+def rewrite_design_urls() -> int:
+    """
+    Rewrite unsharded /static/ URLs in the designs table (one UPDATE).
+    
+    Returns:
+        int: Number of designs updated
+    """
+    from sqlalchemy import func, or_, update
+    from app.infrastructure.database.sync_session import get_sync_db_session
+    from app.infrastructure.database.models.design_model import DesignModel
+    
+    def sharded(column):
+        return func.regexp_replace(column, UNSHARDED_URL_PATTERN, SHARDED_URL_REPLACEMENT)
+    
+    with get_sync_db_session() as session:
+        result = session.execute(
+            update(DesignModel)
+            .where(or_(
+                DesignModel.preview_url.op("~")(UNSHARDED_URL_PATTERN),
+                DesignModel.thumbnail_url.op("~")(UNSHARDED_URL_PATTERN)
+            ))
+            .values(
+                preview_url=sharded(DesignModel.preview_url),
+                thumbnail_url=sharded(DesignModel.thumbnail_url)
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Migrate local storage to the sharded layout")
+    parser.add_argument("--base-path", default="./storage")
+    parser.add_argument("--dry-run", action="store_true", help="Print moves without changing anything")
+    parser.add_argument("--update-db", action="store_true", help="Rewrite design URLs in the database")
+    args = parser.parse_args()
+    
+    print(f"\n📦 Migrating {args.base_path} to sharded layout{' (dry run)' if args.dry_run else ''}")
+    count = migrate_tree(Path(args.base_path), dry_run=args.dry_run)
+    print(f"✅ {count} directories {'to move' if args.dry_run else 'moved'}")
+    
+    if args.update_db and not args.dry_run:
+        print(f"✅ {rewrite_design_urls()} design URLs rewritten")
@@ -2,10 +2,15 @@
 
 import pytest
 from typing import AsyncGenerator
+from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import Session
 from httpx import AsyncClient, ASGITransport
 
 from app.main import app
+from app.domain.entities.design import Design
+from app.domain.entities.user import User
+from app.infrastructure.database.converters import design_converter, user_converter
 from app.infrastructure.database.session import Base, get_db_session
 
 # Test database URL - use customify-postgres as host when running inside Docker
@@ -93,3 +98,41 @@ async def authenticated_client(client, test_user_data) -> AsyncGenerator[tuple[A
     headers = {"Authorization": f"Bearer {token}"}
     
     yield client, headers
+
+
+SYNC_TEST_DATABASE_URL = TEST_DATABASE_URL.replace("+asyncpg", "")
+
+
+@pytest.fixture
+def sync_session():
+    """Create sync test session (same database as async tests)."""
+    engine = create_engine(SYNC_TEST_DATABASE_URL)
+    Base.metadata.create_all(engine)
+
+    with Session(engine, expire_on_commit=False) as session:
+        yield session
+        session.rollback()
+
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def draft_designs(sync_session):
+    """Persist one user with three draft designs."""
+    user = User.create(email="worker@test.com", password_hash="hash", full_name="Worker")
+    sync_session.add(user_converter.to_model(user))
+    sync_session.flush()
+
+    created = []
+    for text in ["One", "Two", "Three"]:
+        design = Design.create(
+            user_id=user.id,
+            product_type="t-shirt",
+            design_data={"text": text, "font": "Bebas-Bold", "color": "#FF0000"},
+        )
+        sync_session.add(design_converter.to_model(design))
+        created.append(design)
+
+    sync_session.commit()
+    return created
@@ -149,6 +149,20 @@ async def test_get_me_authenticated(authenticated_client):
     assert "password_hash" not in data
 
 
+@pytest.mark.integration
+async def test_get_me_after_delete(authenticated_client, db_session):
+    """Test deleting a cached user logs them out immediately."""
+    from app.infrastructure.database.repositories.user_repo_impl import UserRepositoryImpl
+    
+    client, headers = authenticated_client
+    me = await client.get("/api/v1/auth/me", headers=headers)  # Caches the user
+    
+    await UserRepositoryImpl(db_session).delete(me.json()["id"])
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    
+    assert response.status_code == 401
+
+
 @pytest.mark.integration
 async def test_get_me_unauthenticated(client: AsyncClient):
     """Test GET /auth/me without token."""
@@ -178,3 +192,32 @@ async def test_health_check(client: AsyncClient):
     assert "checks" in data
     assert "database" in data["checks"]
     assert data["checks"]["database"]["status"] == "healthy"
+
+
+@pytest.mark.integration
+async def test_login_sheds_load_when_password_pool_saturated(client: AsyncClient, monkeypatch):
+    """Test POST /auth/login answers 503 + Retry-After when bcrypt is saturated."""
+    import asyncio
+    import threading
+    from app.shared.services import password_pool
+    
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "busy@test.com", "password": "Test1234", "full_name": "Busy"}
+    )
+    pool = password_pool.PasswordPool(workers=1, queue_size=0, retry_after=2)
+    monkeypatch.setattr(password_pool, "_pool", pool)
+    gate = threading.Event()
+    blocker = asyncio.ensure_future(pool.run(gate.wait))
+    await asyncio.sleep(0.05)
+    
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "busy@test.com", "password": "Test1234"}
+    )
+    
+    gate.set()
+    await blocker
+    pool.shutdown()
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "2"
@@ -2,6 +2,7 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
 
 
 @pytest.mark.integration
@@ -32,6 +33,25 @@ async def test_create_design_success(authenticated_client):
     assert "user_id" in data
 
 
+@pytest.mark.integration
+async def test_create_design_quota_exceeded(authenticated_client):
+    """Test POST /designs returns 402 once the free plan quota is used up."""
+    client, headers = authenticated_client
+    payload = {
+        "product_type": "mug",
+        "design_data": {"text": "Quota", "font": "Bebas-Bold", "color": "#FF0000"},
+    }
+    
+    for _ in range(10):  # Free plan limit
+        response = await client.post("/api/v1/designs", headers=headers, json=payload)
+        assert response.status_code == 201
+    
+    response = await client.post("/api/v1/designs", headers=headers, json=payload)
+    
+    assert response.status_code == 402
+    assert "10/10" in response.json()["detail"]
+
+
 @pytest.mark.integration
 async def test_create_design_unauthenticated(client: AsyncClient):
     """Test POST /designs without auth."""
@@ -162,6 +182,113 @@ async def test_list_designs_pagination(authenticated_client):
     assert data["has_more"] is True
 
 
+@pytest.mark.integration
+async def test_list_designs_cursor(authenticated_client):
+    """Test GET /designs walks every page via next_cursor."""
+    client, headers = authenticated_client
+    
+    for i in range(5):
+        await client.post(
+            "/api/v1/designs",
+            headers=headers,
+            json={
+                "product_type": "t-shirt",
+                "design_data": {
+                    "text": f"Design {i}",
+                    "font": "Bebas-Bold",
+                    "color": "#FF0000"
+                }
+            }
+        )
+    
+    # First page carries the total and a cursor
+    response = await client.get("/api/v1/designs?limit=2", headers=headers)
+    data = response.json()
+    assert data["total"] == 5
+    assert data["has_more"] is True
+    ids = [d["id"] for d in data["designs"]]
+    
+    # Later pages skip the COUNT unless asked
+    while data["next_cursor"]:
+        response = await client.get(
+            "/api/v1/designs",
+            headers=headers,
+            params={"limit": 2, "cursor": data["next_cursor"]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        ids += [d["id"] for d in data["designs"]]
+    
+    assert len(ids) == len(set(ids)) == 5
+    assert data["has_more"] is False
+    
+    # Explicit total on a cursor page
+    first = await client.get("/api/v1/designs?limit=2", headers=headers)
+    response = await client.get(
+        "/api/v1/designs",
+        headers=headers,
+        params={"limit": 2, "cursor": first.json()["next_cursor"], "include_total": "true"},
+    )
+    assert response.json()["total"] == 5
+
+
+@pytest.mark.integration
+async def test_list_designs_invalid_cursor(authenticated_client):
+    """Test GET /designs rejects a malformed cursor."""
+    client, headers = authenticated_client
+    
+    response = await client.get("/api/v1/designs?cursor=not-a-cursor", headers=headers)
+    
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+async def test_list_designs_query_count(authenticated_client, db_session):
+    """Test GET /designs runs a fixed number of column-only queries."""
+    client, headers = authenticated_client
+    
+    for i in range(3):
+        await client.post(
+            "/api/v1/designs",
+            headers=headers,
+            json={
+                "product_type": "t-shirt",
+                "design_data": {
+                    "text": f"Design {i}",
+                    "font": "Bebas-Bold",
+                    "color": "#FF0000"
+                }
+            }
+        )
+    
+    statements = []
+    event.listen(
+        db_session.bind.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    
+    async def list_designs(params):
+        statements.clear()
+        response = await client.get("/api/v1/designs", headers=headers, params=params)
+        assert response.status_code == 200
+        return response.json()
+    
+    # Page + COUNT (user comes from the auth cache), no relationship loads
+    first = await list_designs({"limit": 2})
+    assert len(statements) == 2
+    assert not any("orders" in s or "subscriptions" in s or "users" in s for s in statements)
+    
+    # Cursor page: page only
+    await list_designs({"limit": 2, "cursor": first["next_cursor"]})
+    assert len(statements) == 1
+    
+    # Legacy OFFSET page: page + COUNT
+    await list_designs({"skip": 1, "limit": 2})
+    assert len(statements) == 2
+
+
 @pytest.mark.integration
 async def test_get_design_by_id(authenticated_client):
     """Test GET /designs/{id}."""
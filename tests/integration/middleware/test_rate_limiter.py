@@ -1,9 +1,14 @@
 """Integration tests for rate limiter middleware."""
 
 import asyncio
+import uuid
 
 import pytest
+from fastapi import HTTPException
 from httpx import AsyncClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.presentation.middleware.rate_limiter import RateLimiter
 
 
 @pytest.mark.integration
@@ -146,3 +151,169 @@ class TestRateLimiterMiddleware:
 
         # Should all be successful (health endpoint has higher limit or no limit)
         assert all(status in [200, 503] for status in responses)
+
+
+@pytest.mark.integration
+class TestRateLimiter:
+    """Tests for the GCRA rate limiter against Redis."""
+
+    async def test_burst_then_retry_after(self):
+        """Test a full burst is allowed, then requests wait one interval."""
+        limiter = RateLimiter()
+        key = f"test:{uuid.uuid4()}"
+
+        for _ in range(5):
+            await limiter.check_rate_limit(key, limit=5, window=60)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await limiter.check_rate_limit(key, limit=5, window=60)
+
+        assert exc_info.value.status_code == 429
+        assert 11 <= int(exc_info.value.headers["Retry-After"]) <= 12  # 60s / 5
+        await limiter.close()
+
+    async def test_single_round_trip(self):
+        """Test each check is one Redis command (EVALSHA)."""
+        limiter = RateLimiter()
+        key = f"test:{uuid.uuid4()}"
+        await limiter.check_rate_limit(key)  # Loads the script
+
+        commands = []
+        execute_command = limiter.redis.execute_command
+
+        async def record(*args, **kwargs):
+            commands.append(args[0])
+            return await execute_command(*args, **kwargs)
+
+        limiter.redis.execute_command = record
+        for _ in range(3):
+            await limiter.check_rate_limit(key)
+
+        assert commands == ["EVALSHA"] * 3
+        await limiter.close()
+
+    async def test_concurrent_checks_are_atomic(self):
+        """Test concurrent checks never admit more than the limit."""
+        limiter = RateLimiter()
+        key = f"test:{uuid.uuid4()}"
+
+        async def check():
+            try:
+                await limiter.check_rate_limit(key, limit=10, window=60)
+                return True
+            except HTTPException:
+                return False
+
+        results = await asyncio.gather(*[check() for _ in range(30)])
+
+        assert sum(results) == 10
+        await limiter.close()
+
+    async def test_local_fallback(self):
+        """Test disabled or unreachable Redis falls back to local buckets."""
+        unreachable = RateLimiter(redis_url="redis://127.0.0.1:1/0")
+
+        for limiter in (RateLimiter(redis_url=None), unreachable):
+            key = f"test:{uuid.uuid4()}"
+            for _ in range(2):
+                await limiter.check_rate_limit(key, limit=2, window=60)
+            with pytest.raises(HTTPException) as exc_info:
+                await limiter.check_rate_limit(key, limit=2, window=60)
+            assert 0 < int(exc_info.value.headers["Retry-After"]) <= 30
+        await unreachable.close()
+
+
+    async def test_redis_error_backs_off(self):
+        """Test checks skip Redis for the retry interval after an error."""
+        limiter = RateLimiter(retry_interval=3600)
+        key = f"test:{uuid.uuid4()}"
+        await limiter.check_rate_limit(key, limit=3, window=60)  # Connects
+
+        attempts = []
+
+        async def redis_down(*args, **kwargs):
+            attempts.append(args)
+            raise RedisConnectionError("Redis is down")
+
+        limiter._gcra = redis_down
+        for _ in range(3):
+            await limiter.check_rate_limit(key, limit=3, window=60)
+        with pytest.raises(HTTPException):
+            await limiter.check_rate_limit(key, limit=3, window=60)  # Local bucket decides
+
+        assert len(attempts) == 1
+        await limiter.close()
+
+@pytest.mark.integration
+class TestHybridRateLimiter:
+    """Tests for local token buckets reconciled with Redis."""
+
+    async def test_checks_skip_redis_until_error_bound(self):
+        """Test Redis is only contacted once unreported tokens reach the bound."""
+        limiter = RateLimiter(mode="hybrid", sync_interval=3600, local_error=0.1)
+        key = f"test:{uuid.uuid4()}"
+        redis_key = f"rate_limit:{key}:100:60"
+
+        for _ in range(9):
+            await limiter.check_rate_limit(key, limit=100, window=60)
+        assert await limiter.redis.exists(redis_key) == 0
+
+        await limiter.check_rate_limit(key, limit=100, window=60)  # 10% of the limit
+        assert await limiter.redis.exists(redis_key) == 1
+        await limiter.close()
+
+    async def test_processes_share_global_limit(self):
+        """Test two processes admit about one limit in total, within the error bound."""
+        processes = [
+            RateLimiter(mode="hybrid", sync_interval=3600, local_error=0.1) for _ in range(2)
+        ]
+        key = f"test:{uuid.uuid4()}"
+        admitted = 0
+        rejected_in_a_row = 0
+
+        while rejected_in_a_row < 2:
+            for limiter in processes:
+                try:
+                    await limiter.check_rate_limit(key, limit=20, window=60)
+                    admitted += 1
+                    rejected_in_a_row = 0
+                except HTTPException:
+                    rejected_in_a_row += 1
+
+        assert 20 <= admitted <= 20 + 2 * 2  # limit + processes x 10% of limit
+        for limiter in processes:
+            await limiter.close()
+
+    async def test_periodic_sync_reports_in_background(self):
+        """Test pending tokens are reported once the sync interval passes."""
+        limiter = RateLimiter(mode="hybrid", sync_interval=0.05, local_error=0.5)
+        key = f"test:{uuid.uuid4()}"
+
+        await limiter.check_rate_limit(key, limit=100, window=60)
+        await asyncio.sleep(0.06)
+        await limiter.check_rate_limit(key, limit=100, window=60)  # Schedules a sync
+        await asyncio.sleep(0.05)
+
+        assert list(limiter.buckets.pending()) == []
+        assert await limiter.redis.exists(f"rate_limit:{key}:100:60") == 1
+        await limiter.close()
+
+    async def test_failed_sync_backs_off_inline_syncs(self):
+        """Test checks stay local after a failed sync instead of retrying Redis inline."""
+        limiter = RateLimiter(mode="hybrid", sync_interval=3600, local_error=0.1)
+        key = f"test:{uuid.uuid4()}"
+        await limiter.check_rate_limit(key, limit=100, window=60)  # Connects
+
+        attempts = []
+
+        def redis_down(*args, **kwargs):
+            attempts.append(args)
+            raise RedisConnectionError("Redis is down")
+
+        limiter.redis.pipeline = redis_down
+        for _ in range(30):
+            await limiter.check_rate_limit(key, limit=100, window=60)
+
+        assert len(attempts) == 1  # Only the first inline sync at the error bound
+        assert [bucket.pending for bucket in limiter.buckets.pending()] == [31]
+        await limiter.close()
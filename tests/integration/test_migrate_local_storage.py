@@ -0,0 +1,32 @@
+"""Integration tests for the local storage migration URL rewrite."""
+
+import pytest
+from sqlalchemy import update
+
+from app.infrastructure.database.models.design_model import DesignModel
+from app.infrastructure.database.repositories.sync_design_repo import SyncDesignRepository
+from scripts.migrate_local_storage import rewrite_design_urls
+
+
+@pytest.mark.integration
+def test_rewrite_design_urls(sync_session, draft_designs):
+    """Test that flat /static/ URLs are rewritten to the sharded layout once."""
+    design = draft_designs[0]
+    sync_session.execute(
+        update(DesignModel)
+        .where(DesignModel.id == design.id)
+        .values(
+            preview_url=f"http://localhost:8000/static/designs/{design.id}/preview.png",
+            thumbnail_url="http://localhost:8000/static/renders/abcdef/thumbnail.png"
+        )
+    )
+    sync_session.commit()
+
+    assert rewrite_design_urls() == 1
+    assert rewrite_design_urls() == 0
+
+    sync_session.expire_all()
+    stored = SyncDesignRepository(sync_session).get_by_id(design.id)
+    shard = f"{design.id[:2]}/{design.id[2:4]}"
+    assert stored.preview_url == f"http://localhost:8000/static/designs/{shard}/{design.id}/preview.png"
+    assert stored.thumbnail_url == "http://localhost:8000/static/renders/ab/cd/abcdef/thumbnail.png"
@@ -1,6 +1,14 @@
+import asyncio
+
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.domain.entities.design import Design
+from app.domain.entities.subscription import Subscription
 from app.domain.entities.user import User
+from app.infrastructure.cache.user_cache import get_user_cache
+from app.infrastructure.database.repositories.design_repo_impl import DesignRepositoryImpl
+from app.infrastructure.database.repositories.subscription_repo_impl import SubscriptionRepositoryImpl
 from app.infrastructure.database.repositories.user_repo_impl import UserRepositoryImpl
 from app.shared.services.password_service import hash_password
 
@@ -90,4 +98,201 @@ async def test_user_repository_exists_email(db_session: AsyncSession):
     # Assert
     assert exists is True
     assert not_exists is False
-    print("✅ exists_email() working")
\ No newline at end of file
+    print("✅ exists_email() working")
+
+
+def count_statements(session: AsyncSession) -> list:
+    """Record every statement sent through the session's engine."""
+    statements = []
+    event.listen(
+        session.bind.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_writes_are_single_round_trip(db_session: AsyncSession):
+    """Test create/update each send one INSERT/UPDATE ... RETURNING."""
+    user_repo = UserRepositoryImpl(db_session)
+    subscription_repo = SubscriptionRepositoryImpl(db_session)
+    design_repo = DesignRepositoryImpl(db_session)
+    statements = count_statements(db_session)
+    
+    user = await user_repo.create(
+        User.create(email="round_trip@test.com", password_hash="hash", full_name="Round Trip")
+    )
+    subscription = await subscription_repo.create(Subscription.create(user_id=user.id))
+    design = await design_repo.create(
+        Design.create(
+            user_id=user.id,
+            product_type="t-shirt",
+            design_data={"text": "Hi", "font": "Bebas-Bold", "color": "#FF0000"},
+        )
+    )
+    assert len(statements) == 3
+    assert all("RETURNING" in statement for statement in statements)
+    
+    statements.clear()
+    user.mark_login()
+    subscription.increment_usage()
+    design.mark_rendering()
+    updated_user = await user_repo.update(user)
+    updated_subscription = await subscription_repo.update(subscription)
+    updated_design = await design_repo.update(design)
+    
+    assert len(statements) == 3
+    assert all(statement.lstrip().startswith("UPDATE") for statement in statements)
+    assert updated_user.last_login == user.last_login
+    assert updated_subscription.designs_this_month == 1
+    assert updated_design.status == design.status
+    assert updated_design.design_data == design.design_data
+
+
+@pytest.mark.asyncio
+async def test_update_missing_raises(db_session: AsyncSession):
+    """Test updating a row that doesn't exist raises ValueError."""
+    user = User.create(email="ghost@test.com", password_hash="hash", full_name="Ghost")
+    
+    with pytest.raises(ValueError):
+        await UserRepositoryImpl(db_session).update(user)
+
+
+@pytest.mark.asyncio
+async def test_update_visible_to_later_reads(db_session: AsyncSession):
+    """Test rows loaded earlier in the session see the UPDATE ... RETURNING values."""
+    repo = UserRepositoryImpl(db_session)
+    user = await repo.create(
+        User.create(email="reread@test.com", password_hash="hash", full_name="Before")
+    )
+    await repo.get_by_id(user.id)  # Loads the row into the session
+    
+    user.update_profile(full_name="After")
+    await repo.update(user)
+    
+    assert (await repo.get_by_id(user.id)).full_name == "After"
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_user_cache_after_commit(db_session: AsyncSession):
+    """Test an old row cached by a request racing the update is dropped on commit."""
+    repo = UserRepositoryImpl(db_session)
+    user = await repo.create(
+        User.create(email="cached@test.com", password_hash="hash", full_name="Before")
+    )
+    stale = await repo.get_by_id(user.id)
+    cache = get_user_cache()
+    
+    user.update_profile(full_name="After")
+    await repo.update(user)
+    await cache.set(stale)  # A concurrent get_current_user still reads the old row
+    await db_session.commit()
+    await asyncio.sleep(0)  # Let the post-commit invalidation run
+    
+    assert await cache.get(user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_reserve_design_quota_is_atomic(test_engine):
+    """Test concurrent reservations never overshoot the plan limit."""
+    import asyncio
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from app.domain.entities.subscription import PLAN_LIMITS, PlanType
+    
+    sessions = async_sessionmaker(test_engine, expire_on_commit=False)
+    limit = PLAN_LIMITS[PlanType.FREE]
+    
+    async with sessions() as session:
+        user = await UserRepositoryImpl(session).create(
+            User.create(email="quota@test.com", password_hash="hash", full_name="Quota")
+        )
+        subscription = Subscription.create(user_id=user.id)
+        subscription.designs_this_month = limit - 2
+        await SubscriptionRepositoryImpl(session).create(subscription)
+        await session.commit()
+    
+    async def reserve():
+        async with sessions() as session:
+            reserved = await SubscriptionRepositoryImpl(session).reserve_design_quota(user.id)
+            await session.commit()
+            return reserved
+    
+    results = await asyncio.gather(*[reserve() for _ in range(6)])
+    
+    assert sum(result is not None for result in results) == 2
+    async with sessions() as session:
+        final = await SubscriptionRepositoryImpl(session).get_by_user(user.id)
+    assert final.designs_this_month == limit
+
+
+@pytest.mark.asyncio
+async def test_reserve_design_quota_requires_active(db_session: AsyncSession):
+    """Test inactive subscriptions and unknown users reserve nothing."""
+    user = await UserRepositoryImpl(db_session).create(
+        User.create(email="canceled@test.com", password_hash="hash", full_name="Canceled")
+    )
+    subscription = Subscription.create(user_id=user.id)
+    subscription.cancel()
+    repo = SubscriptionRepositoryImpl(db_session)
+    await repo.create(subscription)
+    
+    assert await repo.reserve_design_quota(user.id) is None
+    assert await repo.reserve_design_quota("missing-user") is None
+
+
+@pytest.mark.asyncio
+async def test_list_by_user_keyset_pages(db_session: AsyncSession):
+    """Test keyset pages are disjoint and ordered, including created_at ties."""
+    from datetime import datetime, timedelta, UTC
+    
+    user = await UserRepositoryImpl(db_session).create(
+        User.create(email="keyset@test.com", password_hash="hash", full_name="Keyset")
+    )
+    repo = DesignRepositoryImpl(db_session)
+    base = datetime.now(UTC)
+    for i in range(7):
+        design = Design.create(
+            user_id=user.id,
+            product_type="t-shirt",
+            design_data={"text": f"Design {i}", "font": "Bebas-Bold", "color": "#FF0000"},
+        )
+        design.created_at = base - timedelta(seconds=i // 2)  # Pairs share created_at
+        await repo.create(design)
+    
+    pages, after = [], None
+    while True:
+        page = await repo.list_by_user(user.id, limit=3, after=after)
+        if not page:
+            break
+        pages.append(page)
+        after = (page[-1].created_at, page[-1].id)
+    
+    seen = [design for page in pages for design in page]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert len({design.id for design in seen}) == 7
+    assert seen == sorted(seen, key=lambda d: (d.created_at, d.id), reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_design_relationships_are_opt_in(db_session: AsyncSession):
+    """Test design reads load relationships only when asked."""
+    user = await UserRepositoryImpl(db_session).create(
+        User.create(email="projection@test.com", password_hash="hash", full_name="Projection")
+    )
+    repo = DesignRepositoryImpl(db_session)
+    design = await repo.create(
+        Design.create(
+            user_id=user.id,
+            product_type="t-shirt",
+            design_data={"text": "Projection", "font": "Bebas-Bold", "color": "#FF0000"},
+        )
+    )
+    statements = count_statements(db_session)
+    
+    assert (await repo.get_by_id(design.id)).id == design.id
+    assert len(statements) == 1
+    
+    statements.clear()
+    assert (await repo.get_by_id(design.id, relationships=("user",))).id == design.id
+    assert len(statements) == 2  # designs + users, nothing cascades from the user
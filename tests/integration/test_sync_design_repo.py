@@ -0,0 +1,147 @@
+"""Integration tests for the sync design repository used by Celery workers."""
+
+import pytest
+from sqlalchemy import event
+
+from app.domain.entities.design import DesignStatus
+from app.infrastructure.database.repositories.sync_design_repo import SyncDesignRepository
+
+
+@pytest.mark.integration
+class TestSyncDesignRepositoryBatch:
+    """Tests for batch claim/publish/fail statements."""
+
+    def test_get_many(self, sync_session, draft_designs):
+        """Test loading several designs with one query."""
+        repo = SyncDesignRepository(sync_session)
+
+        statements = []
+        event.listen(
+            sync_session.bind,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        found = repo.get_many([d.id for d in draft_designs] + ["missing-id"])
+
+        assert {d.id for d in found} == {d.id for d in draft_designs}
+        assert len(statements) == 1
+
+    def test_claim_many_only_claims_renderable(self, sync_session, draft_designs):
+        """Test that claim skips designs that are not DRAFT/FAILED."""
+        repo = SyncDesignRepository(sync_session)
+        ids = [d.id for d in draft_designs]
+
+        first = repo.claim_many_for_render(ids[:2])
+        second = repo.claim_many_for_render(ids)
+
+        assert {d.id for d in first} == set(ids[:2])
+        assert all(d.status == DesignStatus.RENDERING for d in first)
+        assert [d.id for d in second] == [ids[2]]
+
+    def test_claim_many_returns_updated_state_in_one_statement(self, sync_session, draft_designs):
+        """Test that claim returns fresh state for already-loaded designs, without relationship loads."""
+        repo = SyncDesignRepository(sync_session)
+        ids = [d.id for d in draft_designs]
+        repo.get_many(ids)  # Loads the rows into the session first, as the batch task does
+        statements = []
+        event.listen(
+            sync_session.bind,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+
+        claimed = repo.claim_many_for_render(ids)
+
+        assert {d.status for d in claimed} == {DesignStatus.RENDERING}
+        assert len(statements) == 1
+
+    def test_publish_and_fail_many(self, sync_session, draft_designs):
+        """Test bulk publish and bulk fail of claimed designs."""
+        repo = SyncDesignRepository(sync_session)
+        ids = [d.id for d in draft_designs]
+        repo.claim_many_for_render(ids)
+
+        published = repo.publish_many(
+            [(ids[0], "http://x/preview.png", "http://x/thumbnail.png"), (ids[1], "http://y/p.png", None)]
+        )
+        failed = repo.fail_many({ids[2]: "boom"})
+        sync_session.commit()
+
+        assert set(published) == set(ids[:2])
+        assert failed == [ids[2]]
+
+        by_id = {d.id: d for d in repo.get_many(ids)}
+        assert by_id[ids[0]].status == DesignStatus.PUBLISHED
+        assert by_id[ids[0]].thumbnail_url == "http://x/thumbnail.png"
+        assert by_id[ids[1]].thumbnail_url is None
+        assert by_id[ids[2]].status == DesignStatus.FAILED
+        assert by_id[ids[2]].design_data["error_message"] == "boom"
+        assert by_id[ids[2]].design_data["text"] == "Three"
+
+    def test_failed_design_can_be_reclaimed(self, sync_session, draft_designs):
+        """Test that FAILED designs are claimable again (retry)."""
+        repo = SyncDesignRepository(sync_session)
+        design_id = draft_designs[0].id
+        repo.claim_many_for_render([design_id])
+        repo.fail_many({design_id: "boom"})
+
+        reclaimed = repo.claim_many_for_render([design_id])
+
+        assert [d.id for d in reclaimed] == [design_id]
+
+    def test_publish_ignores_non_rendering(self, sync_session, draft_designs):
+        """Test that publish doesn't touch designs that were never claimed."""
+        repo = SyncDesignRepository(sync_session)
+
+        published = repo.publish_many([(draft_designs[0].id, "http://x/p.png", None)])
+
+        assert published == []
+
+
+@pytest.mark.integration
+class TestSyncDesignRepositoryTransitions:
+    """Tests for single-design claim/publish/fail statements."""
+
+    def test_claim_is_won_once(self, sync_session, draft_designs):
+        """Test that a duplicate claim on the same design returns None."""
+        repo = SyncDesignRepository(sync_session)
+        design_id = draft_designs[0].id
+
+        first = repo.claim_for_render(design_id)
+        second = repo.claim_for_render(design_id)
+
+        assert first.id == design_id
+        assert first.status == DesignStatus.RENDERING
+        assert second is None
+
+    def test_claim_missing_design(self, sync_session, draft_designs):
+        """Test that claiming a missing design returns None."""
+        repo = SyncDesignRepository(sync_session)
+
+        assert repo.claim_for_render("missing-id") is None
+
+    def test_publish_after_claim(self, sync_session, draft_designs):
+        """Test publishing a claimed design sets URLs and status."""
+        repo = SyncDesignRepository(sync_session)
+        design_id = draft_designs[0].id
+        repo.claim_for_render(design_id)
+
+        published = repo.publish(design_id, "http://x/preview.png", "http://x/thumbnail.png")
+
+        assert published.status == DesignStatus.PUBLISHED
+        assert published.preview_url == "http://x/preview.png"
+        assert published.thumbnail_url == "http://x/thumbnail.png"
+        assert repo.publish(design_id, "http://y/preview.png") is None
+
+    def test_mark_failed_only_rendering(self, sync_session, draft_designs):
+        """Test that mark_failed only transitions RENDERING designs."""
+        repo = SyncDesignRepository(sync_session)
+        design_id = draft_designs[0].id
+
+        assert repo.mark_failed(design_id, "boom") is False
+
+        repo.claim_for_render(design_id)
+
+        assert repo.mark_failed(design_id, "boom") is True
+        assert repo.get_by_id(design_id).status == DesignStatus.FAILED
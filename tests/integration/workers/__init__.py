@@ -0,0 +1 @@
+"""Integration tests for worker tasks."""
@@ -0,0 +1,136 @@
+"""Integration tests for the orphan asset garbage collection task."""
+
+import threading
+import time
+from io import BytesIO
+
+import pytest
+from redis import Redis
+from sqlalchemy import text, update
+
+from app.config import settings
+from app.domain.entities.design import Design
+from app.infrastructure.database.converters import design_converter
+from app.infrastructure.database.models.design_model import DesignModel
+from app.infrastructure.database.repositories.sync_design_repo import SyncDesignRepository
+from app.infrastructure.rendering.fingerprint import compute_fingerprint
+from app.infrastructure.storage.local_storage import LocalStorageRepository
+from app.infrastructure.workers.tasks import cleanup_assets, render_design
+from app.infrastructure.workers.tasks.cleanup_assets import GC_CURSOR_KEY
+
+
+@pytest.fixture
+def temp_storage(tmp_path, monkeypatch):
+    """Route renders and GC deletes to a temporary local storage."""
+    storage = LocalStorageRepository(base_path=str(tmp_path))
+    monkeypatch.setattr(render_design, "get_storage_repository", lambda: storage)
+    monkeypatch.setattr(cleanup_assets, "get_storage_repository", lambda: storage)
+    monkeypatch.setattr(settings, "ASSET_GC_GRACE_SECONDS", 0)
+    return storage
+
+
+@pytest.fixture
+def gc_cursor():
+    """Start each test without a saved cursor."""
+    redis = Redis.from_url(str(settings.REDIS_URL), decode_responses=True)
+    redis.delete(GC_CURSOR_KEY)
+    yield redis
+    redis.delete(GC_CURSOR_KEY)
+
+
+def _rendered_files(storage):
+    """Relative paths of every stored asset."""
+    return {str(path.relative_to(storage.base_path)) for path in storage.base_path.rglob("*.png")}
+
+
+@pytest.mark.integration
+class TestCollectOrphanAssets:
+    """Tests for collect_orphan_assets."""
+
+    def test_deletes_assets_of_deleted_designs_only(self, sync_session, draft_designs, temp_storage, gc_cursor):
+        """Test that only the deleted design's render disappears."""
+        render_design.render_design_previews_batch([d.id for d in draft_designs])
+        before = _rendered_files(temp_storage)
+        sync_session.execute(
+            update(DesignModel).where(DesignModel.id == draft_designs[0].id).values(is_deleted=True)
+        )
+        sync_session.commit()
+
+        result = cleanup_assets.collect_orphan_assets()
+
+        assert result["scanned"] == 1
+        assert result["deleted"] == 2
+        assert len(before - _rendered_files(temp_storage)) == 2
+        assert gc_cursor.get(GC_CURSOR_KEY) is not None
+
+    def test_keeps_render_shared_with_live_design(self, sync_session, draft_designs, temp_storage, gc_cursor):
+        """Test that a live design with the same fingerprint keeps the assets."""
+        twin = Design.create(draft_designs[0].user_id, "t-shirt", dict(draft_designs[0].design_data))
+        sync_session.add(design_converter.to_model(twin))
+        sync_session.commit()
+        render_design.render_design_previews_batch([draft_designs[0].id, twin.id])
+        sync_session.execute(
+            update(DesignModel).where(DesignModel.id == draft_designs[0].id).values(is_deleted=True)
+        )
+        sync_session.commit()
+
+        result = cleanup_assets.collect_orphan_assets()
+
+        assert result["scanned"] == 1
+        assert result["deleted"] == 0
+
+    def test_resumes_from_cursor(self, sync_session, draft_designs, temp_storage, gc_cursor):
+        """Test that a run continues after the previous run's last design."""
+        sync_session.execute(
+            update(DesignModel)
+            .where(DesignModel.id.in_([d.id for d in draft_designs]))
+            .values(is_deleted=True)
+        )
+        sync_session.commit()
+
+        first = cleanup_assets.collect_orphan_assets(max_designs=2)
+        second = cleanup_assets.collect_orphan_assets(max_designs=2)
+        third = cleanup_assets.collect_orphan_assets(max_designs=2)
+
+        assert (first["scanned"], second["scanned"], third["scanned"]) == (2, 1, 0)
+
+    def test_deletes_assets_of_older_variant_configs(self, sync_session, draft_designs, temp_storage, gc_cursor):
+        """Test that every key under an orphaned fingerprint is listed and deleted."""
+        design = draft_designs[0]
+        render_design.render_design_previews_batch([design.id])
+        fingerprint = compute_fingerprint(design.design_data, design.product_type)
+        temp_storage.upload_asset(f"renders/{fingerprint}/preview-s500.png", BytesIO(b"old size"))
+        sync_session.execute(update(DesignModel).where(DesignModel.id == design.id).values(is_deleted=True))
+        sync_session.commit()
+
+        result = cleanup_assets.collect_orphan_assets()
+
+        assert result["deleted"] == 3
+        assert temp_storage.list_assets(f"renders/{fingerprint}/") == []
+
+    def test_waits_for_in_flight_render_and_rechecks(self, sync_session, draft_designs, temp_storage, gc_cursor):
+        """Test that a design created while GC runs keeps the render it links."""
+        design = draft_designs[0]
+        render_design.render_design_previews_batch([design.id])
+        before = _rendered_files(temp_storage)
+        sync_session.execute(update(DesignModel).where(DesignModel.id == design.id).values(is_deleted=True))
+        sync_session.commit()
+
+        # A render of the same fingerprint holds its shared lock until it publishes
+        render_repo = SyncDesignRepository(sync_session)
+        render_repo.lock_fingerprints([compute_fingerprint(design.design_data, design.product_type)], shared=True)
+        result = {}
+        gc = threading.Thread(target=lambda: result.update(cleanup_assets.collect_orphan_assets()))
+        gc.start()
+        while not sync_session.execute(
+            text("SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' AND NOT granted")
+        ).scalar():
+            time.sleep(0.01)
+
+        twin = Design.create(design.user_id, "t-shirt", dict(design.design_data))
+        sync_session.add(design_converter.to_model(twin))
+        sync_session.commit()  # Publishes the twin, releases the lock
+        gc.join(timeout=10)
+
+        assert result["scanned"] == 1
+        assert _rendered_files(temp_storage) == before
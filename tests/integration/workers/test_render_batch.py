@@ -0,0 +1,68 @@
+"""Integration tests for the batch render task."""
+
+import pytest
+
+from app.domain.entities.design import DesignStatus
+from app.infrastructure.database.repositories.sync_design_repo import SyncDesignRepository
+from app.infrastructure.storage.local_storage import LocalStorageRepository
+from app.infrastructure.workers.tasks import render_design
+
+
+@pytest.fixture
+def temp_storage(tmp_path, monkeypatch):
+    """Route task uploads to a temporary local storage."""
+    storage = LocalStorageRepository(base_path=str(tmp_path))
+    monkeypatch.setattr(render_design, "get_storage_repository", lambda: storage)
+    return storage
+
+
+@pytest.mark.integration
+class TestRenderDesignPreviewsBatch:
+    """Tests for render_design_previews_batch."""
+
+    def test_batch_renders_and_publishes_all(self, sync_session, draft_designs, temp_storage):
+        """Test that every draft design in the batch is published."""
+        ids = [d.id for d in draft_designs]
+
+        result = render_design.render_design_previews_batch(ids)
+
+        assert result["rendered"] == 3
+        assert result["failed"] == 0
+
+        sync_session.expire_all()
+        stored = SyncDesignRepository(sync_session).get_many(ids)
+        assert all(d.status == DesignStatus.PUBLISHED for d in stored)
+        assert all(d.preview_url and d.thumbnail_url for d in stored)
+
+    def test_batch_is_idempotent(self, sync_session, draft_designs, temp_storage):
+        """Test that re-running a batch skips published designs."""
+        ids = [d.id for d in draft_designs]
+        render_design.render_design_previews_batch(ids)
+
+        result = render_design.render_design_previews_batch(ids + ["missing-id"])
+
+        assert result["already_rendered"] == 3
+        assert result["not_found"] == 1
+        assert result["rendered"] == 0
+
+    def test_batch_isolates_failures(self, sync_session, draft_designs, temp_storage, monkeypatch):
+        """Test that one failing design doesn't abort the batch."""
+        ids = [d.id for d in draft_designs]
+        original = render_design._render_and_store
+
+        def flaky(design, storage, timer=None):
+            if design.id == ids[1]:
+                raise RuntimeError("render exploded")
+            return original(design, storage, timer)
+
+        monkeypatch.setattr(render_design, "_render_and_store", flaky)
+
+        result = render_design.render_design_previews_batch(ids)
+
+        assert result["rendered"] == 2
+        assert result["failed"] == 1
+        assert result["results"][ids[1]]["error"] == "render exploded"
+
+        sync_session.expire_all()
+        failed = SyncDesignRepository(sync_session).get_by_id(ids[1])
+        assert failed.status == DesignStatus.FAILED
@@ -0,0 +1,79 @@
+"""Integration tests for the single-design render task."""
+
+import pytest
+
+from app.domain.entities.design import DesignStatus
+from app.infrastructure.database.repositories.sync_design_repo import SyncDesignRepository
+from app.infrastructure.storage.local_storage import LocalStorageRepository
+from app.infrastructure.workers.tasks import render_design
+
+
+@pytest.fixture
+def temp_storage(tmp_path, monkeypatch):
+    """Route task uploads to a temporary local storage."""
+    storage = LocalStorageRepository(base_path=str(tmp_path))
+    monkeypatch.setattr(render_design, "get_storage_repository", lambda: storage)
+    return storage
+
+
+@pytest.mark.integration
+class TestRenderDesignPreview:
+    """Tests for render_design_preview state transitions."""
+
+    def test_renders_and_publishes(self, sync_session, draft_designs, temp_storage):
+        """Test that a draft design is claimed, rendered and published."""
+        design_id = draft_designs[0].id
+
+        result = render_design.render_design_preview(design_id)
+
+        assert result["status"] == "success"
+        assert {"claim", "draw", "encode", "upload", "publish", "commit", "total"} <= set(
+            result["timings_ms"]
+        )
+        sync_session.expire_all()
+        stored = SyncDesignRepository(sync_session).get_by_id(design_id)
+        assert stored.status == DesignStatus.PUBLISHED
+        assert stored.preview_url == result["preview_url"]
+
+    def test_duplicate_delivery_after_publish(self, sync_session, draft_designs, temp_storage):
+        """Test that a redelivered task returns the existing URLs."""
+        design_id = draft_designs[0].id
+        first = render_design.render_design_preview(design_id)
+
+        second = render_design.render_design_preview(design_id)
+
+        assert second["status"] == "already_rendered"
+        assert second["preview_url"] == first["preview_url"]
+
+    def test_duplicate_delivery_while_rendering(self, sync_session, draft_designs, temp_storage):
+        """Test that a design claimed by another worker is not rendered twice."""
+        design_id = draft_designs[0].id
+        SyncDesignRepository(sync_session).claim_for_render(design_id)
+        sync_session.commit()
+
+        result = render_design.render_design_preview(design_id)
+
+        assert result["status"] == "in_progress"
+        assert "draw" not in result["timings_ms"]
+
+    def test_missing_design_raises(self, sync_session, draft_designs, temp_storage):
+        """Test that an unknown design ID raises ValueError."""
+        with pytest.raises(ValueError):
+            render_design.render_design_preview("missing-id")
+
+    def test_failure_marks_design_failed(self, sync_session, draft_designs, temp_storage, monkeypatch):
+        """Test that a render error leaves the design FAILED (retryable)."""
+        design_id = draft_designs[0].id
+
+        def broken_render(design, storage, timer=None):
+            raise RuntimeError("encoder crashed")
+
+        monkeypatch.setattr(render_design, "_render_and_store", broken_render)
+
+        with pytest.raises(RuntimeError):
+            render_design.render_design_preview(design_id)
+
+        sync_session.expire_all()
+        stored = SyncDesignRepository(sync_session).get_by_id(design_id)
+        assert stored.status == DesignStatus.FAILED
+        assert stored.design_data["error_message"] == "encoder crashed"
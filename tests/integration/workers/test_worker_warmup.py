@@ -0,0 +1,43 @@
+"""Integration tests for the worker process warm-up hook."""
+
+import pytest
+from prometheus_client import REGISTRY
+
+import app.infrastructure.storage as storage_module
+from app.config import settings
+from app.infrastructure.database.sync_session import sync_engine
+from app.infrastructure.rendering.font_registry import font_registry
+from app.infrastructure.storage.local_storage import LocalStorageRepository
+from app.infrastructure.workers.celery_app import warm_up_worker_process
+
+
+@pytest.mark.integration
+class TestWorkerWarmUp:
+    """Tests for warm_up_worker_process."""
+
+    def test_warm_up_prepares_process(self, tmp_path, monkeypatch):
+        """Test that DB connections, fonts and metrics are ready after warm-up."""
+        storage = LocalStorageRepository(base_path=str(tmp_path))
+        monkeypatch.setattr(storage_module, "get_storage_repository", lambda: storage)
+        before = REGISTRY.get_sample_value(
+            "customify_worker_warmup_duration_seconds_count", {"step": "total"}
+        ) or 0.0
+
+        warm_up_worker_process()
+
+        assert sync_engine.pool.checkedin() >= settings.WORKER_WARMUP_DB_CONNECTIONS
+        assert font_registry.cache_info().currsize > 0
+        assert REGISTRY.get_sample_value(
+            "customify_worker_warmup_duration_seconds_count", {"step": "total"}
+        ) == before + 1
+
+    def test_failing_step_does_not_abort_warm_up(self, monkeypatch):
+        """Test that a broken step is skipped (worker still starts)."""
+        def broken_storage():
+            raise RuntimeError("S3 unreachable")
+
+        monkeypatch.setattr(storage_module, "get_storage_repository", broken_storage)
+
+        warm_up_worker_process()
+
+        assert font_registry.cache_info().currsize > 0
@@ -0,0 +1,150 @@
+"""Unit tests for the authenticated user cache."""
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.domain.entities.user import User
+from app.infrastructure.cache.user_cache import UserCache
+
+
+class FakeClock:
+    """Settable time source."""
+
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis tier."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value.encode()
+        self.ttls[key] = ex
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+
+class BrokenRedis:
+    """Redis that is always down."""
+
+    async def get(self, key):
+        raise RedisConnectionError("down")
+
+    async def set(self, key, value, ex=None):
+        raise RedisConnectionError("down")
+
+    async def delete(self, key):
+        raise RedisConnectionError("down")
+
+
+def make_user(email: str = "cache@test.com") -> User:
+    """Create a user entity."""
+    return User.create(email=email, password_hash="hash", full_name="Cache User")
+
+
+class TestUserCache:
+    """Tests for UserCache."""
+
+    async def test_hit_after_set(self):
+        """Test cached users are returned and counted as hits."""
+        cache = UserCache(ttl=30)
+        user = make_user()
+
+        assert await cache.get(user.id) is None
+        await cache.set(user)
+
+        assert await cache.get(user.id) == user
+        assert cache.stats() == {"local_hit": 1, "redis_hit": 0, "miss": 1, "hit_rate": 0.5}
+
+    async def test_returns_copies(self):
+        """Test mutating a returned user doesn't change the cache."""
+        cache = UserCache(ttl=30)
+        user = make_user()
+        await cache.set(user)
+
+        cached = await cache.get(user.id)
+        cached.is_active = False
+        user.full_name = "Changed"
+
+        again = await cache.get(user.id)
+        assert again.is_active is True
+        assert again.full_name == "Cache User"
+
+    async def test_ttl_expiry(self):
+        """Test entries expire after the TTL."""
+        clock = FakeClock()
+        cache = UserCache(ttl=30, clock=clock)
+        user = make_user()
+        await cache.set(user)
+
+        clock.now += 29
+        assert await cache.get(user.id) is not None
+        clock.now += 2
+        assert await cache.get(user.id) is None
+
+    async def test_lru_eviction(self):
+        """Test the in-process tier is bounded."""
+        cache = UserCache(ttl=30, max_entries=2)
+        users = [make_user(f"u{i}@test.com") for i in range(3)]
+        for user in users:
+            await cache.set(user)
+
+        assert await cache.get(users[0].id) is None
+        assert await cache.get(users[2].id) is not None
+
+    async def test_invalidate(self):
+        """Test invalidation drops both tiers."""
+        redis = FakeRedis()
+        cache = UserCache(ttl=30, redis=redis)
+        user = make_user()
+        await cache.set(user)
+
+        await cache.invalidate(user.id)
+
+        assert await cache.get(user.id) is None
+        assert redis.store == {}
+
+    async def test_disabled_with_zero_ttl(self):
+        """Test TTL 0 turns the cache off."""
+        cache = UserCache(ttl=0)
+        user = make_user()
+        await cache.set(user)
+
+        assert await cache.get(user.id) is None
+
+    async def test_redis_tier_shared(self):
+        """Test a user cached by one process is a Redis hit in another."""
+        redis = FakeRedis()
+        user = make_user()
+        user.mark_login()
+        await UserCache(ttl=30, redis=redis).set(user)
+
+        other = UserCache(ttl=30, redis=redis)
+        cached = await other.get(user.id)
+
+        assert cached == user
+        assert redis.ttls[f"auth_user:{user.id}"] == 30
+        assert other.stats()["redis_hit"] == 1
+        assert await other.get(user.id) == user  # Now in process
+        assert other.stats()["local_hit"] == 1
+
+    async def test_redis_errors_fall_back(self):
+        """Test a Redis outage degrades to the in-process tier."""
+        cache = UserCache(ttl=30, redis=BrokenRedis())
+        user = make_user()
+
+        assert await cache.get(user.id) is None
+        await cache.set(user)
+        assert await cache.get(user.id) == user
+        await cache.invalidate(user.id)
+        assert await cache.get(user.id) is None
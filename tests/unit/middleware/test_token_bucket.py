@@ -0,0 +1,54 @@
+"""Unit tests for local rate limit token buckets."""
+
+import pytest
+
+from app.presentation.middleware.token_bucket import LocalBuckets, TokenBucket
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_refill(self):
+        """Test a full burst, then one token per window / limit seconds."""
+        bucket = TokenBucket("k", limit=3, window=30, tokens=3.0, updated_at=0.0)
+
+        assert [bucket.consume(0.0)[0] for _ in range(4)] == [True, True, True, False]
+        assert bucket.consume(0.0) == (False, pytest.approx(10.0))
+        assert bucket.consume(10.0) == (True, 0.0)
+
+    def test_refill_capped_at_limit(self):
+        """Test idle time never accumulates more than one burst."""
+        bucket = TokenBucket("k", limit=3, window=30, tokens=0.0, updated_at=0.0)
+
+        bucket.refill(1000.0)
+
+        assert bucket.tokens == 3
+
+    def test_reconcile_adopts_global_count(self):
+        """Test reports adopt Redis' remaining tokens minus in-flight consumption."""
+        bucket = TokenBucket("k", limit=10, window=60, tokens=8.0, updated_at=0.0, pending=3)
+
+        bucket.reconcile(remaining=4, reported=2, now=0.0)
+
+        assert bucket.pending == 1
+        assert bucket.tokens == 3
+
+    def test_max_unsynced(self):
+        """Test the inline report threshold is a share of the limit, at least 1."""
+        assert TokenBucket("k", 100, 60, 100.0, 0.0).max_unsynced(0.1) == 10
+        assert TokenBucket("k", 5, 60, 5.0, 0.0).max_unsynced(0.1) == 1
+
+
+class TestLocalBuckets:
+    """Tests for LocalBuckets."""
+
+    def test_lru_bound_and_pending(self):
+        """Test buckets are bounded and pending ones listed."""
+        buckets = LocalBuckets(max_keys=2)
+        first = buckets.get("a", 10, 60, 0.0)
+        buckets.get("b", 10, 60, 0.0).pending = 2
+        buckets.get("c", 10, 60, 0.0)
+
+        assert len(buckets) == 2
+        assert buckets.get("a", 10, 60, 0.0) is not first
+        assert [bucket.key for bucket in buckets.pending()] == []  # "b" evicted by "a"
@@ -0,0 +1,85 @@
+"""Unit tests for render fingerprints."""
+
+from app.infrastructure.rendering import fingerprint as fingerprint_module
+from app.infrastructure.rendering.fingerprint import compute_fingerprint, render_asset_key
+from app.infrastructure.rendering.font_registry import FONT_FILES, FontRegistry
+
+
+BASE_DATA = {"text": "Hello", "font": "Bebas-Bold", "color": "#FF0000", "fontSize": 48}
+
+
+class TestComputeFingerprint:
+    """Tests for compute_fingerprint."""
+
+    def test_same_design_same_fingerprint(self):
+        """Test that identical render data gives identical fingerprints."""
+        assert compute_fingerprint(dict(BASE_DATA), "t-shirt") == compute_fingerprint(
+            dict(BASE_DATA), "t-shirt"
+        )
+
+    def test_key_order_does_not_matter(self):
+        """Test that fingerprint is canonical regardless of dict order."""
+        reordered = dict(reversed(list(BASE_DATA.items())))
+
+        assert compute_fingerprint(reordered, "mug") == compute_fingerprint(BASE_DATA, "mug")
+
+    def test_non_render_fields_are_ignored(self):
+        """Test that fields not affecting the image are ignored."""
+        data = {**BASE_DATA, "error_message": "previous failure"}
+
+        assert compute_fingerprint(data, "t-shirt") == compute_fingerprint(BASE_DATA, "t-shirt")
+
+    def test_defaults_are_applied(self):
+        """Test that omitted fontSize matches the renderer default."""
+        data = {k: v for k, v in BASE_DATA.items() if k != "fontSize"}
+
+        assert compute_fingerprint(data, "t-shirt") == compute_fingerprint(BASE_DATA, "t-shirt")
+
+    def test_color_case_is_normalized(self):
+        """Test that hex color case doesn't change fingerprint."""
+        data = {**BASE_DATA, "color": "#ff0000"}
+
+        assert compute_fingerprint(data, "t-shirt") == compute_fingerprint(BASE_DATA, "t-shirt")
+
+    def test_render_fields_change_fingerprint(self):
+        """Test that each render-relevant field changes the fingerprint."""
+        base = compute_fingerprint(BASE_DATA, "t-shirt")
+
+        for field, value in [
+            ("text", "Other"),
+            ("font", "Roboto-Regular"),
+            ("color", "#00FF00"),
+            ("fontSize", 24),
+        ]:
+            assert compute_fingerprint({**BASE_DATA, field: value}, "t-shirt") != base
+
+    def test_product_type_changes_fingerprint(self):
+        """Test that product type is part of the fingerprint."""
+        assert compute_fingerprint(BASE_DATA, "t-shirt") != compute_fingerprint(BASE_DATA, "mug")
+
+    def test_renderer_version_changes_fingerprint(self, monkeypatch):
+        """Test that bumping renderer version invalidates fingerprints."""
+        before = compute_fingerprint(BASE_DATA, "t-shirt")
+
+        monkeypatch.setattr(fingerprint_module, "RENDERER_VERSION", "999")
+
+        assert compute_fingerprint(BASE_DATA, "t-shirt") != before
+
+    def test_resolved_font_file_changes_fingerprint(self, tmp_path):
+        """Test that installing the real font file invalidates fallback renders."""
+        registry = FontRegistry(fonts_dir=str(tmp_path))
+        fallback = compute_fingerprint(BASE_DATA, "t-shirt", fonts=registry)
+
+        (tmp_path / FONT_FILES["Bebas-Bold"]).write_bytes(b"real font data")
+        registry.preload()
+
+        assert compute_fingerprint(BASE_DATA, "t-shirt", fonts=registry) != fallback
+
+
+class TestRenderAssetKey:
+    """Tests for render_asset_key."""
+
+    def test_key_format(self):
+        """Test content-addressed key layout."""
+        assert render_asset_key("abc123", "preview") == "renders/abc123/preview.png"
+        assert render_asset_key("abc123", "thumbnail", "webp") == "renders/abc123/thumbnail.webp"
@@ -0,0 +1,94 @@
+"""Unit tests for the render worker font registry."""
+
+from pathlib import Path
+
+import pytest
+from PIL import ImageFont
+
+from app.infrastructure.rendering.font_registry import (
+    FALLBACK_FONT_PATHS,
+    FONT_FILES,
+    FontRegistry,
+)
+
+
+def _system_font() -> Path | None:
+    """Return first installed system fallback font (if any)."""
+    for font_path in FALLBACK_FONT_PATHS:
+        if Path(font_path).exists():
+            return Path(font_path)
+    return None
+
+
+class TestFontRegistry:
+    """Tests for FontRegistry."""
+
+    def test_font_files_cover_whitelist(self):
+        """Test that every whitelisted font maps to a file."""
+        assert set(FONT_FILES) == {
+            "Bebas-Bold",
+            "Montserrat-Regular",
+            "Montserrat-Bold",
+            "Pacifico-Regular",
+            "Roboto-Regular",
+        }
+
+    def test_same_font_and_size_is_cached(self, tmp_path):
+        """Test that repeated lookups reuse the same font object."""
+        registry = FontRegistry(fonts_dir=str(tmp_path), cache_size=8)
+
+        first = registry.get_font("Bebas-Bold", 48)
+        second = registry.get_font("Bebas-Bold", 48)
+
+        assert first is second
+        assert registry.cache_info().hits == 1
+        assert registry.cache_info().misses == 1
+
+    def test_cache_is_bounded(self, tmp_path):
+        """Test that LRU never grows past its max size."""
+        registry = FontRegistry(fonts_dir=str(tmp_path), cache_size=4)
+
+        for size in range(12, 30):
+            registry.get_font("Roboto-Regular", size)
+
+        assert registry.cache_info().currsize == 4
+
+    def test_loads_whitelisted_font_file(self, tmp_path):
+        """Test that a font file in FONTS_DIR is used for its font name."""
+        system_font = _system_font()
+        if system_font is None:
+            pytest.skip("No system TrueType font available")
+
+        (tmp_path / FONT_FILES["Pacifico-Regular"]).write_bytes(system_font.read_bytes())
+        registry = FontRegistry(fonts_dir=str(tmp_path))
+        registry.preload()
+
+        font = registry.get_font("Pacifico-Regular", 36)
+
+        assert isinstance(font, ImageFont.FreeTypeFont)
+        assert font.size == 36
+
+    def test_unknown_font_uses_fallback(self, tmp_path):
+        """Test that unknown font names don't raise."""
+        registry = FontRegistry(fonts_dir=str(tmp_path))
+
+        font = registry.get_font("Comic-Sans", 24)
+
+        assert font is not None
+
+    def test_preload_is_lazy(self, tmp_path):
+        """Test that registry does no I/O until first use."""
+        registry = FontRegistry(fonts_dir=str(tmp_path / "missing"))
+
+        assert registry.cache_info().currsize == 0
+        registry.get_font("Bebas-Bold", 20)
+        assert registry.cache_info().currsize == 1
+
+    def test_font_id_identifies_resolved_file(self, tmp_path):
+        """Test that font_id names the installed file, or the fallback for missing ones."""
+        (tmp_path / FONT_FILES["Roboto-Regular"]).write_bytes(b"roboto")
+        registry = FontRegistry(fonts_dir=str(tmp_path))
+
+        assert registry.font_id("Roboto-Regular").startswith("Roboto-Regular.ttf:")
+        assert registry.font_id("Bebas-Bold") == registry.font_id(None)
+        assert registry.font_id("Comic-Sans") == registry.font_id(None)
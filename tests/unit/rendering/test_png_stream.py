@@ -0,0 +1,67 @@
+"""Unit tests for the streaming PNG encoder."""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from app.infrastructure.rendering import png_stream
+from app.infrastructure.rendering.png_stream import PngStreamWriter
+
+
+class CountingSink(BytesIO):
+    """BytesIO that records how many bytes were written before close."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+class TestPngStreamWriter:
+    """Tests for PngStreamWriter."""
+
+    def test_roundtrip_matches_source_pixels(self):
+        """Test that strips written one by one decode to the source image."""
+        source = Image.effect_noise((64, 50), 64).convert("RGB")
+        sink = BytesIO()
+
+        writer = PngStreamWriter(sink, 64, 50)
+        for top in range(0, 50, 16):
+            writer.write_strip(source.crop((0, top, 64, min(top + 16, 50))))
+        writer.close()
+
+        sink.seek(0)
+        with Image.open(sink) as decoded:
+            assert decoded.format == "PNG"
+            assert decoded.size == (64, 50)
+            assert decoded.convert("RGB").tobytes() == source.tobytes()
+
+    def test_emits_idat_chunks_before_close(self, monkeypatch):
+        """Test that compressed data is flushed while strips are written."""
+        monkeypatch.setattr(png_stream, "IDAT_CHUNK_SIZE", 1024)
+        sink = CountingSink()
+        writer = PngStreamWriter(sink, 256, 256, compress_level=0)
+        header_writes = sink.writes
+
+        writer.write_strip(Image.effect_noise((256, 128), 64).convert("RGB"))
+
+        assert sink.writes > header_writes
+
+    def test_rejects_wrong_width(self):
+        """Test that strips must match the declared width."""
+        writer = PngStreamWriter(BytesIO(), 10, 10)
+
+        with pytest.raises(ValueError):
+            writer.write_strip(Image.new("RGB", (9, 5)))
+
+    def test_close_requires_all_rows(self):
+        """Test that closing early is an error (truncated image)."""
+        writer = PngStreamWriter(BytesIO(), 10, 10)
+        writer.write_strip(Image.new("RGB", (10, 5)))
+
+        with pytest.raises(ValueError):
+            writer.close()
@@ -0,0 +1,54 @@
+"""Unit tests for tiled (strip) rendering."""
+
+from PIL import Image, ImageDraw
+
+from app.infrastructure.rendering.font_registry import font_registry
+from app.infrastructure.rendering.tiled import iter_strips
+
+
+def _assemble(strips, width, height):
+    """Stack strips into one image (test helper only)."""
+    canvas = Image.new("RGB", (width, height))
+    top = 0
+    for strip in strips:
+        canvas.paste(strip, (0, top))
+        top += strip.height
+    return canvas
+
+
+class TestIterStrips:
+    """Tests for iter_strips."""
+
+    def test_strip_heights_cover_canvas(self):
+        """Test that strips are tile_height rows except the last one."""
+        font = font_registry.get_font("Bebas-Bold", 40)
+
+        strips = list(iter_strips(300, 250, 64, "#FF0000", "Hi", font, "#FFFFFF"))
+
+        assert [strip.height for strip in strips] == [64, 64, 64, 58]
+        assert all(strip.width == 300 for strip in strips)
+
+    def test_matches_single_canvas_layout(self):
+        """Test that text split over strips lands where a full-canvas draw puts it."""
+        font = font_registry.get_font("Bebas-Bold", 80)
+        expected = Image.new("RGB", (400, 400), color="#FF0000")
+        draw = ImageDraw.Draw(expected)
+        left, top, right, bottom = draw.textbbox((0, 0), "HELLO", font=font)
+        draw.text(((400 - (right - left)) / 2, (400 - (bottom - top)) / 2), "HELLO", fill="#FFFFFF", font=font)
+
+        canvas = _assemble(iter_strips(400, 400, 16, "#FF0000", "HELLO", font, "#FFFFFF"), 400, 400)
+
+        assert canvas.getpixel((2, 2)) == (255, 0, 0)
+        text_bbox = canvas.convert("L").point(lambda value: 255 if value > 200 else 0).getbbox()
+        expected_bbox = expected.convert("L").point(lambda value: 255 if value > 200 else 0).getbbox()
+        assert all(abs(a - b) <= 1 for a, b in zip(text_bbox, expected_bbox))
+
+    def test_text_wider_than_canvas_is_clipped(self):
+        """Test that long text only rasterizes its visible characters."""
+        font = font_registry.get_font("Bebas-Bold", 60)
+
+        strips = list(iter_strips(200, 120, 40, "#000000", "W" * 200, font, "#FFFFFF"))
+
+        assert len(strips) == 3
+        middle = strips[1].convert("L")
+        assert middle.getextrema()[1] == 255
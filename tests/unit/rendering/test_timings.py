@@ -0,0 +1,39 @@
+"""Unit tests for render stage timings."""
+
+from app.infrastructure.rendering.timings import StageTimer
+
+
+class TestStageTimer:
+    """Tests for StageTimer."""
+
+    def test_stage_records_elapsed_time(self):
+        """Test that a timed block is recorded under its stage name."""
+        timer = StageTimer()
+
+        with timer.stage("draw"):
+            pass
+
+        assert set(timer.seconds()) == {"draw"}
+        assert timer.seconds()["draw"] >= 0
+
+    def test_repeated_stages_accumulate(self):
+        """Test that adding to the same stage sums durations."""
+        timer = StageTimer()
+
+        timer.add("upload", 0.25)
+        timer.add("upload", 0.5)
+
+        assert timer.seconds() == {"upload": 0.75}
+        assert timer.as_dict() == {"upload": 750.0}
+
+    def test_stage_recorded_on_error(self):
+        """Test that a failing block is still timed."""
+        timer = StageTimer()
+
+        try:
+            with timer.stage("encode"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert "encode" in timer.seconds()
@@ -0,0 +1,160 @@
+"""Unit tests for the multi-variant output pipeline."""
+
+import pytest
+from PIL import Image
+
+from app.infrastructure.rendering import variants
+from app.infrastructure.rendering.fingerprint import render_asset_key
+from app.infrastructure.rendering.variants import (
+    VariantSpec,
+    derive_variants,
+    encode_variant,
+    load_variant_specs,
+    raster_size,
+)
+
+
+@pytest.fixture
+def source_image():
+    """Source raster (600x600 red)."""
+    return Image.new("RGB", (600, 600), color="red")
+
+
+class TestLoadVariantSpecs:
+    """Tests for load_variant_specs."""
+
+    def test_parses_and_sorts_largest_first(self):
+        """Test that specs are parsed and sorted by size."""
+        specs = load_variant_specs(
+            [
+                {"name": "thumbnail", "size": 200},
+                {"name": "retina", "size": 1200, "format": "WEBP"},
+                {"name": "preview", "size": 600, "format": "png"},
+            ]
+        )
+
+        assert [spec.name for spec in specs] == ["retina", "preview", "thumbnail"]
+        assert specs[0].format == "webp"
+        assert specs[0].content_type == "image/webp"
+        assert specs[2].format == "png"
+
+    def test_requires_preview(self):
+        """Test that a preview variant is mandatory."""
+        with pytest.raises(ValueError, match="preview"):
+            load_variant_specs([{"name": "thumbnail", "size": 200}])
+
+    def test_rejects_unknown_format(self):
+        """Test that unsupported formats are rejected."""
+        with pytest.raises(ValueError, match="Invalid format"):
+            load_variant_specs([{"name": "preview", "size": 600, "format": "bmp"}])
+
+    def test_rejects_duplicate_names(self):
+        """Test that variant names must be unique."""
+        with pytest.raises(ValueError, match="Duplicate"):
+            load_variant_specs(
+                [{"name": "preview", "size": 600}, {"name": "preview", "size": 300}]
+            )
+
+    def test_parses_encoder_options(self):
+        """Test that per-format encoder options are parsed into the spec."""
+        specs = load_variant_specs(
+            [
+                {"name": "preview", "size": 600, "format": "webp", "lossless": True},
+                {"name": "thumbnail", "size": 200, "format": "png", "compress_level": 9},
+            ]
+        )
+
+        assert specs[0].save_options == {"lossless": True}
+        assert specs[1].save_options == {"compress_level": 9}
+
+    def test_rejects_option_for_other_format(self):
+        """Test that options not accepted by the format are rejected."""
+        with pytest.raises(ValueError, match="Invalid options"):
+            load_variant_specs([{"name": "preview", "size": 600, "format": "png", "quality": 80}])
+
+    def test_rejects_out_of_range_option(self):
+        """Test that encoder option ranges are validated."""
+        with pytest.raises(ValueError, match="compress_level"):
+            load_variant_specs([{"name": "preview", "size": 600, "compress_level": 12}])
+
+    def test_rejects_format_unsupported_by_pillow(self, monkeypatch):
+        """Test that formats without an installed encoder (e.g. AVIF) fail at load."""
+        monkeypatch.setattr(variants, "format_supported", lambda output_format: False)
+
+        with pytest.raises(ValueError, match="not supported"):
+            load_variant_specs([{"name": "preview", "size": 600, "format": "avif"}])
+
+    def test_raster_size_is_largest_variant(self):
+        """Test that raster is big enough for every variant."""
+        specs = load_variant_specs(
+            [{"name": "preview", "size": 600}, {"name": "retina", "size": 1200}]
+        )
+
+        assert raster_size(specs) == 1200
+
+
+class TestDeriveVariants:
+    """Tests for encode_variant / derive_variants."""
+
+    def test_each_variant_encoded_once_at_its_size(self, source_image):
+        """Test that every spec yields one encoded buffer at its size."""
+        specs = [
+            VariantSpec(name="preview", size=600),
+            VariantSpec(name="thumbnail", size=200),
+        ]
+
+        variants = list(derive_variants(source_image, specs))
+
+        assert [v.spec.name for v in variants] == ["preview", "thumbnail"]
+        assert variants[0].dimensions == (600, 600)
+        assert variants[1].dimensions == (200, 200)
+
+        with Image.open(variants[1].buffer) as thumbnail:
+            assert thumbnail.format == "PNG"
+            assert thumbnail.size == (200, 200)
+
+    def test_source_raster_is_not_modified(self, source_image):
+        """Test that deriving a small variant doesn't shrink the source."""
+        encode_variant(source_image, VariantSpec(name="thumbnail", size=100))
+
+        assert source_image.size == (600, 600)
+
+    def test_variant_format(self, source_image):
+        """Test encoding a variant as JPEG."""
+        variant = encode_variant(source_image, VariantSpec(name="preview", size=300, format="jpeg"))
+
+        with Image.open(variant.buffer) as image:
+            assert image.format == "JPEG"
+        assert variant.spec.extension == "jpg"
+
+    def test_lossless_webp_roundtrips_pixels(self, source_image):
+        """Test that lossless WebP keeps flat-color pixels exact."""
+        variant = encode_variant(source_image, VariantSpec(name="preview", size=600, format="webp", lossless=True))
+
+        with Image.open(variant.buffer) as image:
+            assert image.format == "WEBP"
+            assert image.convert("RGB").getpixel((10, 10)) == (255, 0, 0)
+
+    def test_asset_name_includes_encoder_options(self):
+        """Test that encoder options are part of the storage key name."""
+        assert VariantSpec(name="preview", size=600).asset_name == "preview-s600"
+        assert VariantSpec(name="preview", size=600, format="webp", quality=80).asset_name == "preview-s600-q80"
+        assert VariantSpec(name="preview", size=600, format="webp", lossless=True).asset_name == "preview-s600-ll"
+        assert VariantSpec(name="thumbnail", size=200, compress_level=9).asset_name == "thumbnail-s200-z9"
+
+    def test_size_changes_asset_key(self):
+        """Test that resizing a variant never reuses renders of the old size."""
+        small = VariantSpec(name="thumbnail", size=200)
+        large = VariantSpec(name="thumbnail", size=300)
+
+        assert render_asset_key("abc", small.asset_name, small.extension) != render_asset_key(
+            "abc", large.asset_name, large.extension
+        )
+
+    def test_no_upscaling(self):
+        """Test that variants larger than the source keep source size."""
+        small = Image.new("RGB", (100, 50), color="blue")
+
+        variant = encode_variant(small, VariantSpec(name="preview", size=600))
+
+        assert variant.dimensions == (100, 50)
@@ -0,0 +1,66 @@
+"""Unit tests for the bounded password pool."""
+
+import asyncio
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.shared.services.password_pool import PasswordPool, PasswordPoolSaturatedError
+from app.shared.services.password_service import hash_password_async, verify_password_async
+
+
+def sample(name: str) -> float:
+    """Current value of a password pool metric."""
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+class TestPasswordPool:
+    """Tests for PasswordPool."""
+
+    async def test_run_returns_result(self):
+        """Test results (and exceptions) come back to the caller."""
+        pool = PasswordPool(workers=1, queue_size=0)
+
+        assert await pool.run(lambda a, b: a + b, 2, 3) == 5
+        with pytest.raises(ZeroDivisionError):
+            await pool.run(lambda: 1 / 0)
+        pool.shutdown()
+
+    async def test_sheds_load_when_saturated(self):
+        """Test operations beyond workers + queue fail fast, then recover."""
+        pool = PasswordPool(workers=1, queue_size=1, retry_after=3)
+        gate = threading.Event()
+        rejected = sample("customify_password_pool_rejected_total")
+
+        running = [asyncio.ensure_future(pool.run(gate.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert sample("customify_password_pool_in_flight") == 2
+
+        with pytest.raises(PasswordPoolSaturatedError) as exc_info:
+            await pool.run(lambda: None)
+        assert exc_info.value.retry_after == 3
+        assert sample("customify_password_pool_rejected_total") == rejected + 1
+
+        gate.set()
+        await asyncio.gather(*running)
+        assert sample("customify_password_pool_in_flight") == 0
+        assert await pool.run(lambda: "ok") == "ok"
+        pool.shutdown()
+
+    async def test_event_loop_stays_responsive(self):
+        """Test bcrypt runs without blocking other coroutines."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        password_hash = await hash_password_async("Test1234")
+        assert await verify_password_async("Test1234", password_hash)
+        task.cancel()
+
+        assert ticks >= 5  # Two bcrypt rounds take well over 50 ms
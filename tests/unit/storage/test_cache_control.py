@@ -0,0 +1,128 @@
+"""Unit tests for asset Cache-Control headers (S3 uploads and /static)."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.infrastructure.storage import s3_client as s3_module
+from app.infrastructure.storage.cache_control import (
+    IMMUTABLE_CACHE_CONTROL,
+    MUTABLE_CACHE_CONTROL,
+    cache_control_for,
+)
+from app.infrastructure.storage.local_storage import shard_key
+from app.infrastructure.storage.static_files import AssetStaticFiles
+from app.infrastructure.storage.storage_repo_impl import StorageRepositoryImpl
+
+
+class RecordingS3:
+    """Records the boto3 calls made by S3Client."""
+
+    def __init__(self):
+        self.uploads = []
+        self.multipart = []
+
+    def upload_fileobj(self, file_data, bucket, key, ExtraArgs=None):
+        self.uploads.append((key, ExtraArgs))
+
+    def create_multipart_upload(self, Bucket, Key, **kwargs):
+        self.multipart.append((Key, kwargs))
+        return {"UploadId": "upload-1"}
+
+
+@pytest.fixture
+def recording_s3(monkeypatch):
+    """S3 client whose boto3 client records calls instead of sending them."""
+    monkeypatch.setattr(settings, "AWS_ACCESS_KEY_ID", "test-key")
+    monkeypatch.setattr(settings, "AWS_SECRET_ACCESS_KEY", "test-secret")
+    s3_module._reset_after_fork()
+    recorder = RecordingS3()
+    s3_module.get_s3_client().s3 = recorder
+    yield recorder
+    s3_module._reset_after_fork()
+
+
+class TestCacheControlFor:
+    """Tests for cache_control_for."""
+
+    def test_content_addressed_keys_immutable(self):
+        """Test render keys (flat and sharded) are immutable."""
+        key = "renders/abcdef/preview.png"
+
+        assert cache_control_for(key) == IMMUTABLE_CACHE_CONTROL
+        assert cache_control_for(shard_key(key)) == IMMUTABLE_CACHE_CONTROL
+
+    def test_legacy_design_keys_revalidated(self):
+        """Test per-design keys (overwritten on re-render) must be revalidated."""
+        assert cache_control_for("designs/123/preview.png") == MUTABLE_CACHE_CONTROL
+
+
+class TestS3CacheControl:
+    """Tests for Cache-Control on S3 uploads."""
+
+    def test_render_asset_uploaded_immutable(self, recording_s3):
+        """Test content-addressed uploads carry the immutable header."""
+        StorageRepositoryImpl().upload_asset("renders/abc/preview.png", b"png")
+
+        (_, extra_args), = recording_s3.uploads
+        assert extra_args["CacheControl"] == IMMUTABLE_CACHE_CONTROL
+        assert extra_args["ContentType"] == "image/png"
+
+    def test_legacy_preview_not_immutable(self, recording_s3):
+        """Test legacy per-design previews are stored with no-cache."""
+        StorageRepositoryImpl().upload_design_preview("123", b"png")
+
+        (key, extra_args), = recording_s3.uploads
+        assert key == "designs/123/preview.png"
+        assert extra_args["CacheControl"] == MUTABLE_CACHE_CONTROL
+
+    def test_multipart_upload_immutable(self, recording_s3):
+        """Test streamed uploads set Cache-Control when the upload is created."""
+        s3_module.get_s3_client().open_multipart_upload(
+            "renders/abc/print-300dpi.png", cache_control=IMMUTABLE_CACHE_CONTROL
+        )
+
+        (_, kwargs), = recording_s3.multipart
+        assert kwargs["CacheControl"] == IMMUTABLE_CACHE_CONTROL
+
+
+class TestAssetStaticFiles:
+    """Tests for the /static mount used with local storage."""
+
+    @pytest.fixture
+    def client(self, tmp_path):
+        """App serving tmp_path like ./storage."""
+        for key in ("renders/ab/cd/abcdef/preview.png", "designs/12/34/1234/preview.png"):
+            path = tmp_path / key
+            path.parent.mkdir(parents=True)
+            path.write_bytes(b"\x89PNG")
+
+        app = FastAPI()
+        app.mount("/static", AssetStaticFiles(directory=tmp_path), name="static")
+        return TestClient(app)
+
+    def test_render_asset_immutable_with_etag(self, client):
+        """Test content-addressed files are served immutable with a strong ETag."""
+        response = client.get("/static/renders/ab/cd/abcdef/preview.png")
+
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+        assert not response.headers["etag"].startswith("W/")
+
+    def test_not_modified_keeps_cache_control(self, client):
+        """Test revalidation returns 304 with the same headers."""
+        etag = client.get("/static/renders/ab/cd/abcdef/preview.png").headers["etag"]
+
+        response = client.get(
+            "/static/renders/ab/cd/abcdef/preview.png", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+    def test_legacy_file_revalidated(self, client):
+        """Test per-design files are served with no-cache."""
+        response = client.get("/static/designs/12/34/1234/preview.png")
+
+        assert response.headers["cache-control"] == MUTABLE_CACHE_CONTROL
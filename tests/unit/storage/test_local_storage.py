@@ -44,7 +44,7 @@ class TestLocalStorageRepository:
         assert url.startswith("http://localhost:8000/static/")
 
         # Check file exists
-        file_path = Path(temp_storage.base_path) / "designs" / "test-design-id" / "preview.png"
+        file_path = temp_storage.path_for("designs/test-design-id/preview.png")
         assert file_path.exists()
         assert file_path.is_file()
 
@@ -58,7 +58,7 @@ class TestLocalStorageRepository:
         temp_storage.upload_design_preview("new-design-id", buffer)
 
         # Check directory structure
-        design_dir = Path(temp_storage.base_path) / "designs" / "new-design-id"
+        design_dir = Path(temp_storage.base_path) / "designs" / "ne" / "w-" / "new-design-id"
         assert design_dir.exists()
         assert design_dir.is_dir()
 
@@ -73,7 +73,7 @@ class TestLocalStorageRepository:
 
         assert "thumbnail.png" in url
 
-        file_path = Path(temp_storage.base_path) / "designs" / "test-thumb-id" / "thumbnail.png"
+        file_path = temp_storage.path_for("designs/test-thumb-id/thumbnail.png")
         assert file_path.exists()
 
     def test_upload_multiple_files_same_design(self, temp_storage):
@@ -97,7 +97,7 @@ class TestLocalStorageRepository:
         thumb_url = temp_storage.upload_design_thumbnail(design_id, thumb_buffer)
 
         # Both should exist
-        design_dir = Path(temp_storage.base_path) / "designs" / design_id
+        design_dir = temp_storage.path_for(f"designs/{design_id}/preview.png").parent
         assert (design_dir / "preview.png").exists()
         assert (design_dir / "thumbnail.png").exists()
 
@@ -119,7 +119,7 @@ class TestLocalStorageRepository:
         temp_storage.upload_design_thumbnail(design_id, buffer)
 
         # Verify files exist
-        design_dir = Path(temp_storage.base_path) / "designs" / design_id
+        design_dir = temp_storage.path_for(f"designs/{design_id}/preview.png").parent
         assert design_dir.exists()
         assert (design_dir / "preview.png").exists()
         assert (design_dir / "thumbnail.png").exists()
@@ -159,7 +159,7 @@ class TestLocalStorageRepository:
         temp_storage.upload_design_preview(design_id, buffer2)
 
         # Verify file was overwritten (should be blue now)
-        file_path = Path(temp_storage.base_path) / "designs" / design_id / "preview.png"
+        file_path = temp_storage.path_for(f"designs/{design_id}/preview.png")
         assert file_path.exists()
 
         # Open and check color
@@ -197,3 +197,158 @@ class TestLocalStorageRepository:
         # Both should contain design_id
         assert design_id in preview_url
         assert design_id in thumbnail_url
+
+    def test_upload_asset_uses_sharded_key_path(self, temp_storage):
+        """Test uploading asset under explicit content-addressed key."""
+        buffer = BytesIO(b"png-bytes")
+
+        url = temp_storage.upload_asset("renders/abc123/preview.png", buffer)
+
+        assert url == "http://localhost:8000/static/renders/ab/c1/abc123/preview.png"
+        file_path = Path(temp_storage.base_path) / "renders" / "ab" / "c1" / "abc123" / "preview.png"
+        assert file_path.read_bytes() == b"png-bytes"
+
+    def test_asset_exists(self, temp_storage):
+        """Test asset existence check."""
+        key = "renders/exists-test/thumbnail.png"
+
+        assert temp_storage.asset_exists(key) is False
+
+        temp_storage.upload_asset(key, BytesIO(b"data"))
+
+        assert temp_storage.asset_exists(key) is True
+        assert temp_storage.get_asset_url(key).endswith("renders/ex/is/exists-test/thumbnail.png")
+
+
+class TestUploadAssetAsync:
+    """Tests for background uploads through the shared storage pool."""
+
+    def test_upload_asset_async_returns_url(self, temp_storage):
+        """Test that the future resolves to the asset URL once written."""
+        future = temp_storage.upload_asset_async("renders/abc/preview.png", BytesIO(b"png-bytes"))
+
+        assert future.result(timeout=5) == "http://localhost:8000/static/renders/abc/preview.png"
+        assert temp_storage.asset_exists("renders/abc/preview.png")
+
+    def test_shared_executor_is_reused(self):
+        """Test that every repository shares one pool per process."""
+        from app.infrastructure.storage.executor import get_storage_executor
+
+        assert get_storage_executor() is get_storage_executor()
+
+
+class TestOpenAssetWriter:
+    """Tests for streamed asset writes."""
+
+    def test_asset_visible_after_success(self, temp_storage):
+        """Test that streamed chunks end up in the final file."""
+        with temp_storage.open_asset_writer("renders/abc/print-300dpi.png") as stream:
+            stream.write(b"chunk-1")
+            assert not temp_storage.asset_exists("renders/abc/print-300dpi.png")
+            stream.write(b"chunk-2")
+
+        assert (temp_storage.base_path / "renders/abc/print-300dpi.png").read_bytes() == b"chunk-1chunk-2"
+
+    def test_partial_asset_discarded_on_error(self, temp_storage):
+        """Test that a failed write leaves no file (or temp file) behind."""
+        with pytest.raises(RuntimeError):
+            with temp_storage.open_asset_writer("renders/abc/print-300dpi.png") as stream:
+                stream.write(b"partial")
+                raise RuntimeError("render failed")
+
+        assert not temp_storage.asset_exists("renders/abc/print-300dpi.png")
+        assert list((temp_storage.base_path / "renders/abc").iterdir()) == []
+
+
+class TestGetStorageRepository:
+    """Tests for the storage repository factory."""
+
+    def test_instance_is_cached(self):
+        """Test that the factory returns one instance per process."""
+        from app.infrastructure.storage import get_storage_repository
+
+        assert get_storage_repository() is get_storage_repository()
+
+
+class TestDeleteAssets:
+    """Tests for batched local deletes."""
+
+    def test_deletes_files_and_empty_directories(self, temp_storage):
+        """Test that keys are unlinked and emptied directories removed."""
+        temp_storage.upload_asset("renders/abc/preview.png", BytesIO(b"p"))
+        temp_storage.upload_asset("renders/abc/thumbnail.png", BytesIO(b"t"))
+
+        deleted = temp_storage.delete_assets(
+            ["renders/abc/preview.png", "renders/abc/thumbnail.png", "renders/abc/missing.png"]
+        )
+
+        assert deleted == 2
+        assert not (temp_storage.base_path / "renders" / "abc").exists()
+
+    def test_list_assets_by_prefix(self, temp_storage):
+        """Test that listing maps sharded files back to their keys."""
+        temp_storage.upload_asset("renders/abcdef/preview-s600.png", BytesIO(b"p"))
+        temp_storage.upload_asset("renders/abcdef/print-300dpi.png", BytesIO(b"x"))
+        temp_storage.upload_asset("renders/abcdeg/preview-s600.png", BytesIO(b"o"))
+
+        assert temp_storage.list_assets("renders/abcdef/") == [
+            "renders/abcdef/preview-s600.png",
+            "renders/abcdef/print-300dpi.png",
+        ]
+        assert temp_storage.list_assets("renders/missing/") == []
+
+
+class TestShardedLayout:
+    """Tests for the sharded, atomic local layout."""
+
+    def test_shard_key(self):
+        """Test that ID-keyed prefixes get two shard levels."""
+        from app.infrastructure.storage.local_storage import shard_key
+
+        assert shard_key("designs/abcdef/preview.png") == "designs/ab/cd/abcdef/preview.png"
+        assert shard_key("renders/0f1e2d/print/x.png") == "renders/0f/1e/0f1e2d/print/x.png"
+        assert shard_key("renders/abc/preview.png") == "renders/abc/preview.png"
+        assert shard_key("other/abcdef/file.png") == "other/abcdef/file.png"
+
+    def test_written_files_are_readable_by_other_users(self, temp_storage):
+        """Test that atomic writes keep the mode open() would give (not the temp file's 0600)."""
+        from app.infrastructure.storage.local_storage import ASSET_FILE_MODE
+
+        temp_storage.upload_asset("renders/abcdef/preview.png", BytesIO(b"data"))
+
+        mode = temp_storage.path_for("renders/abcdef/preview.png").stat().st_mode & 0o777
+        assert mode == ASSET_FILE_MODE
+        assert mode & 0o044 == 0o044  # Group/other readable under the usual 022/002 umasks
+
+    def test_write_leaves_no_temp_files(self, temp_storage):
+        """Test that atomic writes rename their temp file into place."""
+        temp_storage.upload_asset("renders/abcdef/preview.png", BytesIO(b"data"))
+
+        files = [path.name for path in temp_storage.path_for("renders/abcdef/preview.png").parent.iterdir()]
+        assert files == ["preview.png"]
+
+    def test_writes_from_current_buffer_position(self, temp_storage):
+        """Test that BytesIO uploads (zero-copy) respect the read position."""
+        buffer = BytesIO(b"skip-data")
+        buffer.seek(5)
+
+        temp_storage.upload_asset("renders/abcdef/preview.png", buffer)
+
+        assert temp_storage.path_for("renders/abcdef/preview.png").read_bytes() == b"data"
+
+
+class TestMigrateLocalStorage:
+    """Tests for scripts/migrate_local_storage.py."""
+
+    def test_moves_flat_tree_into_shards(self, temp_storage):
+        """Test that flat design/render directories are moved and re-runs are no-ops."""
+        from scripts.migrate_local_storage import migrate_tree
+
+        flat = temp_storage.base_path / "designs" / "abcdef" / "preview.png"
+        flat.parent.mkdir(parents=True)
+        flat.write_bytes(b"old")
+
+        assert migrate_tree(temp_storage.base_path) == 1
+        assert migrate_tree(temp_storage.base_path) == 0
+        assert temp_storage.path_for("designs/abcdef/preview.png").read_bytes() == b"old"
+        assert not flat.parent.exists()
@@ -0,0 +1,83 @@
+"""Unit tests for the in-memory storage backend."""
+
+from io import BytesIO
+from time import perf_counter
+
+import pytest
+
+from app.infrastructure.storage import InMemoryStorageRepository
+
+
+class TestInMemoryStorageRepository:
+    """Tests for InMemoryStorageRepository."""
+
+    def test_upload_and_exists(self):
+        """Test uploads are stored and reported by asset_exists."""
+        storage = InMemoryStorageRepository()
+
+        url = storage.upload_asset("renders/abc/preview.png", BytesIO(b"png"))
+
+        assert url == "memory://assets/renders/abc/preview.png"
+        assert storage.asset_exists("renders/abc/preview.png")
+        assert storage.get_asset("renders/abc/preview.png") == b"png"
+        assert not storage.asset_exists("renders/abc/thumbnail.png")
+
+    def test_upload_async(self):
+        """Test background uploads resolve to the asset URL."""
+        storage = InMemoryStorageRepository()
+
+        future = storage.upload_asset_async("renders/abc/preview.png", BytesIO(b"png"))
+
+        assert future.result(timeout=5) == storage.get_asset_url("renders/abc/preview.png")
+        assert len(storage) == 1
+
+    def test_open_asset_writer(self):
+        """Test streamed assets are stored on success only."""
+        storage = InMemoryStorageRepository()
+
+        with storage.open_asset_writer("renders/abc/print.png") as stream:
+            stream.write(b"part1")
+            stream.write(b"part2")
+
+        with pytest.raises(RuntimeError):
+            with storage.open_asset_writer("renders/abc/broken.png") as stream:
+                stream.write(b"partial")
+                raise RuntimeError("render failed")
+
+        assert storage.get_asset("renders/abc/print.png") == b"part1part2"
+        assert not storage.asset_exists("renders/abc/broken.png")
+
+    def test_delete(self):
+        """Test batch and per-design deletion."""
+        storage = InMemoryStorageRepository()
+        storage.upload_design_preview("d1", BytesIO(b"p"))
+        storage.upload_design_thumbnail("d1", BytesIO(b"t"))
+        storage.upload_asset("renders/abc/preview.png", BytesIO(b"r"))
+
+        assert storage.list_assets("renders/abc/") == ["renders/abc/preview.png"]
+        assert storage.delete_assets(["renders/abc/preview.png", "missing"]) == 1
+        assert storage.delete_design_assets("d1") is True
+        assert storage.delete_design_assets("d1") is False
+        assert len(storage) == 0
+
+    def test_injected_latency_and_bandwidth(self):
+        """Test each upload costs latency plus size / bandwidth."""
+        storage = InMemoryStorageRepository(latency=0.02, bandwidth=100_000)
+
+        start = perf_counter()
+        storage.upload_asset("big.bin", BytesIO(b"x" * 2_000))  # 20 ms + 20 ms
+        elapsed = perf_counter() - start
+
+        assert elapsed >= 0.04
+
+    def test_concurrent_uploads_overlap(self):
+        """Test simulated latency doesn't serialize uploads in the I/O pool."""
+        storage = InMemoryStorageRepository(latency=0.1)
+
+        start = perf_counter()
+        futures = [storage.upload_asset_async(f"k{i}", BytesIO(b"x")) for i in range(4)]
+        for future in futures:
+            future.result(timeout=5)
+        elapsed = perf_counter() - start
+
+        assert elapsed < 0.35
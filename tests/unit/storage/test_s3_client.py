@@ -0,0 +1,47 @@
+"""Unit tests for the lazy per-process S3 client."""
+
+import pytest
+
+from app.config import settings
+from app.infrastructure.storage import s3_client as s3_module
+
+
+@pytest.fixture
+def aws_settings(monkeypatch):
+    """Fake credentials (client creation does no network I/O) and a fresh client slot."""
+    monkeypatch.setattr(settings, "AWS_ACCESS_KEY_ID", "test-key")
+    monkeypatch.setattr(settings, "AWS_SECRET_ACCESS_KEY", "test-secret")
+    s3_module._reset_after_fork()
+    yield
+    s3_module._reset_after_fork()
+
+
+class TestGetS3Client:
+    """Tests for get_s3_client."""
+
+    def test_not_created_at_import(self):
+        """Test that importing the module doesn't build a client."""
+        s3_module._reset_after_fork()
+
+        assert s3_module._s3_client is None
+
+    def test_created_once_per_process(self, aws_settings):
+        """Test that repeated calls reuse the same client."""
+        assert s3_module.get_s3_client() is s3_module.get_s3_client()
+
+    def test_recreated_after_fork(self, aws_settings):
+        """Test that a forked child builds its own client."""
+        parent_client = s3_module.get_s3_client()
+
+        s3_module._reset_after_fork()  # What os.register_at_fork runs in the child
+
+        assert s3_module.get_s3_client() is not parent_client
+
+    def test_botocore_config(self, aws_settings):
+        """Test pool size, keep-alive and retries come from settings."""
+        config = s3_module.get_s3_client().s3.meta.config
+
+        assert config.max_pool_connections == settings.S3_MAX_POOL_CONNECTIONS
+        assert config.tcp_keepalive is True
+        assert config.retries["mode"] == "standard"
+        assert config.retries["total_max_attempts"] == settings.S3_MAX_ATTEMPTS + 1
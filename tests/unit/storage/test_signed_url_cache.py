@@ -0,0 +1,217 @@
+"""Unit tests for the pre-signed URL cache."""
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.config import settings
+from app.infrastructure.storage import signed_url_cache as cache_module
+from app.infrastructure.storage.signed_url_cache import (
+    SignedUrlCache,
+    asset_key_from_url,
+    sign_asset_urls,
+)
+
+
+class FakeClock:
+    """Settable time source."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingSigner:
+    """Signer returning a distinct URL per call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, key: str, expiration: int) -> str:
+        self.calls.append((key, expiration))
+        return f"https://signed/{key}?sig={len(self.calls)}"
+
+
+class FakePipeline:
+    """Minimal async Redis pipeline (SET only)."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value, ex))
+
+    async def execute(self):
+        for key, value, ex in self.commands:
+            self.redis.store[key] = value.encode()
+            self.redis.ttls[key] = ex
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis tier."""
+
+    def __init__(self, fail: bool = False):
+        self.store = {}
+        self.ttls = {}
+        self.fail = fail
+        self.mget_calls = 0
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        if self.fail:
+            raise RedisConnectionError("down")
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        if self.fail:
+            raise RedisConnectionError("down")
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def signer():
+    return CountingSigner()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestSignedUrlCache:
+    """Tests for SignedUrlCache."""
+
+    async def test_reuses_signature_within_window(self, signer, clock):
+        """Test that repeated lookups in one window sign once and return the same URL."""
+        cache = SignedUrlCache(signer, expiration=3600, safety_margin=300, clock=clock)
+
+        first = await cache.get("renders/abc/preview.png")
+        clock.now += 60
+        second = await cache.get("renders/abc/preview.png")
+
+        assert first == second
+        assert signer.calls == [("renders/abc/preview.png", 3600)]
+
+    async def test_resigns_in_next_window(self, signer, clock):
+        """Test that a new expiry bucket gets a fresh signature."""
+        cache = SignedUrlCache(signer, expiration=3600, safety_margin=300, clock=clock)
+
+        first = await cache.get("renders/abc/preview.png")
+        clock.now += cache.window
+        second = await cache.get("renders/abc/preview.png")
+
+        assert first != second
+        assert len(signer.calls) == 2
+
+    async def test_cached_url_keeps_safety_margin(self, signer):
+        """Test that no URL is handed out with less than the margin left."""
+        clock = FakeClock(now=0.0)
+        cache = SignedUrlCache(signer, expiration=100, safety_margin=30, clock=clock)
+        signed_at = {}
+
+        for now in range(0, 500, 7):
+            clock.now = float(now)
+            url = await cache.get("k")
+            signed_at.setdefault(url, now)
+            assert signed_at[url] + 100 - now >= 30
+
+    async def test_get_many_signs_only_misses(self, signer, clock):
+        """Test batch lookup with a mix of hits, misses and duplicate keys."""
+        cache = SignedUrlCache(signer, expiration=3600, safety_margin=300, clock=clock)
+        await cache.get("a")
+
+        urls = await cache.get_many(["a", "b", "b", "c"])
+
+        assert set(urls) == {"a", "b", "c"}
+        assert [key for key, _ in signer.calls] == ["a", "b", "c"]
+
+    async def test_lru_bound(self, signer, clock):
+        """Test that the in-process tier never exceeds max_entries."""
+        cache = SignedUrlCache(signer, expiration=3600, safety_margin=300, max_entries=2, clock=clock)
+
+        await cache.get_many(["a", "b", "c"])
+        await cache.get("a")
+
+        assert len(cache._entries) == 2
+        assert len(signer.calls) == 4  # "a" was evicted and re-signed
+
+    def test_margin_must_be_below_expiration(self, signer):
+        """Test invalid configuration is rejected."""
+        with pytest.raises(ValueError):
+            SignedUrlCache(signer, expiration=300, safety_margin=300)
+
+    async def test_redis_tier_shared_between_processes(self, signer, clock):
+        """Test that a second process reuses the URL signed by the first."""
+        redis = FakeRedis()
+        first = SignedUrlCache(signer, expiration=3600, safety_margin=300, redis=redis, clock=clock)
+        second = SignedUrlCache(signer, expiration=3600, safety_margin=300, redis=redis, clock=clock)
+
+        url = await first.get("a")
+
+        assert await second.get("a") == url
+        assert len(signer.calls) == 1
+        # Shared entry expires when its bucket ends
+        (ttl,) = redis.ttls.values()
+        assert 0 < ttl <= first.window
+
+    async def test_redis_failure_falls_back_to_signing(self, signer, clock):
+        """Test that Redis errors don't fail the request."""
+        cache = SignedUrlCache(
+            signer, expiration=3600, safety_margin=300, redis=FakeRedis(fail=True), clock=clock
+        )
+
+        url = await cache.get("a")
+
+        assert url.startswith("https://signed/a")
+
+    async def test_in_process_hit_skips_redis(self, signer, clock):
+        """Test that in-process hits don't make a Redis round trip."""
+        redis = FakeRedis()
+        cache = SignedUrlCache(signer, expiration=3600, safety_margin=300, redis=redis, clock=clock)
+
+        await cache.get("a")
+        await cache.get("a")
+
+        assert redis.mget_calls == 1
+
+
+class TestSignAssetUrls:
+    """Tests for sign_asset_urls."""
+
+    def test_asset_key_from_url(self):
+        """Test stored bucket URLs map back to object keys."""
+        url = f"{settings.s3_base_url}/renders/abc/preview.png"
+
+        assert asset_key_from_url(url) == "renders/abc/preview.png"
+        assert asset_key_from_url("https://elsewhere.example/x.png") is None
+
+    async def test_public_bucket_unchanged(self, monkeypatch):
+        """Test that public buckets return stored URLs as-is."""
+        monkeypatch.setattr(settings, "USE_LOCAL_STORAGE", False)
+        monkeypatch.setattr(settings, "S3_PUBLIC_BUCKET", True)
+        urls = [f"{settings.s3_base_url}/a.png", None]
+
+        assert await sign_asset_urls(urls) == urls
+
+    async def test_private_bucket_signed(self, monkeypatch, signer):
+        """Test that private bucket URLs are replaced by signed URLs."""
+        monkeypatch.setattr(settings, "USE_LOCAL_STORAGE", False)
+        monkeypatch.setattr(settings, "S3_PUBLIC_BUCKET", False)
+        cache = SignedUrlCache(signer, expiration=3600, safety_margin=300)
+        monkeypatch.setattr(cache_module, "get_signed_url_cache", lambda: cache)
+        base = settings.s3_base_url
+
+        urls = await sign_asset_urls([f"{base}/a.png", None, "https://other/b.png", f"{base}/a.png"])
+
+        assert urls[0].startswith("https://signed/a.png")
+        assert urls[1:3] == [None, "https://other/b.png"]
+        assert urls[3] == urls[0]
+        assert len(signer.calls) == 1
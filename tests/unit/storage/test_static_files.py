@@ -0,0 +1,203 @@
+"""Unit tests for the /static asset handler (ETag, conditional GET, ranges)."""
+
+import hashlib
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.storage.static_files import AssetStaticFiles, parse_range
+
+KEY = "renders/ab/cd/abcdef/preview.png"
+CONTENT = bytes(range(256)) * 1000  # 256,000 bytes (several chunks)
+
+
+@pytest.fixture
+def asset_path(tmp_path):
+    """Asset file inside a temporary storage root."""
+    path = tmp_path / KEY
+    path.parent.mkdir(parents=True)
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.fixture
+def client(tmp_path, asset_path):
+    """App serving tmp_path like ./storage."""
+    app = FastAPI()
+    app.mount("/static", AssetStaticFiles(directory=tmp_path), name="static")
+    return TestClient(app)
+
+
+class TestParseRange:
+    """Tests for parse_range."""
+
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=100-", (100, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=-5000", (0, 999)),
+            ("bytes=900-5000", (900, 999)),
+            ("bytes=0-1,5-9", None),  # Multiple ranges: serve full file
+            ("items=0-9", None),
+            ("bytes=9-0", None),
+        ],
+    )
+    def test_parse(self, header, expected):
+        """Test single ranges are parsed and clamped to the file size."""
+        assert parse_range(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+    def test_unsatisfiable(self, header):
+        """Test ranges outside the file raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_range(header, 1000)
+
+
+class TestAssetStaticFiles:
+    """Tests for AssetStaticFiles responses."""
+
+    def test_full_response(self, client):
+        """Test 200 with content-hash ETag and range support advertised."""
+        response = client.get(f"/static/{KEY}")
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+        assert response.headers["etag"] == f'"{hashlib.sha256(CONTENT).hexdigest()[:32]}"'
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-type"] == "image/png"
+        assert int(response.headers["content-length"]) == len(CONTENT)
+
+    def test_etag_stable_across_touch(self, client, asset_path):
+        """Test the ETag depends on content, not mtime."""
+        etag = client.get(f"/static/{KEY}").headers["etag"]
+        os.utime(asset_path, (1, 1))
+
+        assert client.get(f"/static/{KEY}").headers["etag"] == etag
+
+    def test_etag_changes_with_content(self, client, asset_path):
+        """Test rewriting the file changes the ETag."""
+        etag = client.get(f"/static/{KEY}").headers["etag"]
+        asset_path.write_bytes(b"new content")
+
+        assert client.get(f"/static/{KEY}").headers["etag"] != etag
+
+    def test_if_none_match(self, client):
+        """Test matching (and weak-prefixed) ETags get 304 without a body."""
+        etag = client.get(f"/static/{KEY}").headers["etag"]
+
+        for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            response = client.get(f"/static/{KEY}", headers={"If-None-Match": header})
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+
+    def test_if_none_match_mismatch(self, client):
+        """Test a stale ETag gets the full file."""
+        response = client.get(f"/static/{KEY}", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+
+    def test_if_modified_since(self, client):
+        """Test If-Modified-Since at Last-Modified gets 304."""
+        last_modified = client.get(f"/static/{KEY}").headers["last-modified"]
+
+        response = client.get(f"/static/{KEY}", headers={"If-Modified-Since": last_modified})
+
+        assert response.status_code == 304
+
+    def test_if_modified_since_older(self, client):
+        """Test an older If-Modified-Since gets the full file."""
+        response = client.get(
+            f"/static/{KEY}", headers={"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}
+        )
+
+        assert response.status_code == 200
+
+    def test_range(self, client):
+        """Test a byte range gets 206 with Content-Range."""
+        response = client.get(f"/static/{KEY}", headers={"Range": "bytes=100-70099"})
+
+        assert response.status_code == 206
+        assert response.content == CONTENT[100:70100]
+        assert response.headers["content-range"] == f"bytes 100-70099/{len(CONTENT)}"
+        assert response.headers["content-length"] == "70000"
+
+    def test_suffix_range(self, client):
+        """Test a suffix range returns the file tail."""
+        response = client.get(f"/static/{KEY}", headers={"Range": "bytes=-10"})
+
+        assert response.status_code == 206
+        assert response.content == CONTENT[-10:]
+
+    def test_unsatisfiable_range(self, client):
+        """Test a range past the end gets 416."""
+        response = client.get(f"/static/{KEY}", headers={"Range": f"bytes={len(CONTENT)}-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(CONTENT)}"
+
+    def test_if_range_mismatch_serves_full(self, client):
+        """Test a stale If-Range ignores Range and sends the full file."""
+        response = client.get(
+            f"/static/{KEY}", headers={"Range": "bytes=0-9", "If-Range": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.content == CONTENT
+
+    def test_if_range_match(self, client):
+        """Test a current If-Range honours Range."""
+        etag = client.get(f"/static/{KEY}").headers["etag"]
+
+        response = client.get(f"/static/{KEY}", headers={"Range": "bytes=0-9", "If-Range": etag})
+
+        assert response.status_code == 206
+        assert response.content == CONTENT[:10]
+
+    def test_head(self, client):
+        """Test HEAD sends headers only."""
+        response = client.head(f"/static/{KEY}")
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert int(response.headers["content-length"]) == len(CONTENT)
+
+    def test_missing_file(self, client):
+        """Test unknown paths still 404."""
+        assert client.get("/static/renders/missing.png").status_code == 404
+
+
+class TestZeroCopySend:
+    """Tests for the sendfile path (ASGI zero-copy send extension)."""
+
+    async def test_uses_zerocopysend(self, tmp_path, asset_path):
+        """Test the file descriptor, offset and count are handed to the server."""
+        static = AssetStaticFiles(directory=tmp_path)
+        messages = []
+        sent = {}
+
+        async def receive():
+            return {"type": "http.request"}
+
+        async def send(message):
+            messages.append(message)
+            if message["type"] == "http.response.zerocopysend":
+                sent["data"] = os.pread(message["file"], message["count"], message["offset"])
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": f"/{KEY}",
+            "root_path": "",
+            "headers": [(b"range", b"bytes=10-19")],
+            "extensions": {"http.response.zerocopysend": {}},
+        }
+        await static(scope, receive, send)
+
+        assert messages[0]["status"] == 206
+        assert messages[1]["type"] == "http.response.zerocopysend"
+        assert sent["data"] == CONTENT[10:20]
@@ -0,0 +1,63 @@
+"""Unit tests for orphan asset selection."""
+
+from app.domain.entities.design import Design
+from app.infrastructure.rendering.fingerprint import compute_fingerprint
+from app.infrastructure.workers.tasks.cleanup_assets import (
+    asset_fingerprints,
+    legacy_asset_keys,
+    orphan_fingerprints,
+)
+
+OLD_FINGERPRINT = "ab" * 32
+
+
+def _design(text: str, product_type: str = "t-shirt") -> Design:
+    """Build a design entity (not persisted)."""
+    return Design.create("user-1", product_type, {"text": text, "font": "Bebas-Bold", "color": "#FF0000"})
+
+
+class TestAssetFingerprints:
+    """Tests for asset_fingerprints."""
+
+    def test_current_and_referenced_fingerprints(self):
+        """Test that fingerprints of renders made by an older renderer are included."""
+        design = _design("Old")
+        design.preview_url = f"http://localhost:8000/static/renders/ab/ab/{OLD_FINGERPRINT}/preview.png"
+        design.thumbnail_url = f"https://cdn.example.com/renders/{OLD_FINGERPRINT}/thumbnail.png"
+
+        assert asset_fingerprints(design) == {
+            compute_fingerprint(design.design_data, design.product_type),
+            OLD_FINGERPRINT,
+        }
+
+
+class TestOrphanFingerprints:
+    """Tests for orphan_fingerprints."""
+
+    def test_unshared_render_is_orphaned(self):
+        """Test that a fingerprint no live design uses is returned once."""
+        design = _design("Gone")
+
+        assert orphan_fingerprints([design, _design("Gone")], live=set()) == [
+            compute_fingerprint(design.design_data, design.product_type)
+        ]
+
+    def test_shared_render_is_kept(self):
+        """Test that fingerprints used by a live design are kept."""
+        design = _design("Shared")
+        fingerprint = compute_fingerprint(design.design_data, design.product_type)
+
+        assert orphan_fingerprints([design], live={fingerprint}) == []
+
+
+class TestLegacyAssetKeys:
+    """Tests for legacy_asset_keys."""
+
+    def test_per_design_keys(self):
+        """Test that each design owns its legacy preview and thumbnail."""
+        design = _design("Legacy")
+
+        assert legacy_asset_keys([design]) == [
+            f"designs/{design.id}/preview.png",
+            f"designs/{design.id}/thumbnail.png",
+        ]
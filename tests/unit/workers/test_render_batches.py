@@ -0,0 +1,51 @@
+"""Unit tests for render batch enqueueing."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.infrastructure.workers.tasks import render_design
+
+
+class TestEnqueueRenderBatches:
+    """Tests for enqueue_render_batches."""
+
+    @pytest.fixture
+    def queued(self, monkeypatch):
+        """Capture batches instead of sending them to the broker."""
+        batches = []
+
+        def fake_apply_async(args, **kwargs):
+            batches.append((args[0], kwargs))
+            return SimpleNamespace(id=f"task-{len(batches)}")
+
+        monkeypatch.setattr(
+            render_design.render_design_previews_batch, "apply_async", fake_apply_async
+        )
+        return batches
+
+    def test_groups_ids_into_batches(self, queued):
+        """Test that IDs are split into batch_size groups."""
+        ids = [f"design-{i}" for i in range(7)]
+
+        task_ids = render_design.enqueue_render_batches(ids, batch_size=3)
+
+        assert task_ids == ["task-1", "task-2", "task-3"]
+        assert [batch for batch, _ in queued] == [ids[0:3], ids[3:6], ids[6:7]]
+        assert all(kwargs["queue"] == "default" for _, kwargs in queued)
+
+    def test_deduplicates_ids(self, queued):
+        """Test that duplicate IDs are queued once."""
+        render_design.enqueue_render_batches(["a", "b", "a"], batch_size=10)
+
+        assert queued[0][0] == ["a", "b"]
+
+    def test_empty_input_queues_nothing(self, queued):
+        """Test that no task is queued for an empty list."""
+        assert render_design.enqueue_render_batches([]) == []
+        assert queued == []
+
+    def test_invalid_batch_size(self):
+        """Test that batch_size must be positive."""
+        with pytest.raises(ValueError):
+            render_design.enqueue_render_batches(["a"], batch_size=0)
@@ -1,30 +1,36 @@
 """Unit tests for render design worker tasks."""
 
-from io import BytesIO
-
 import pytest
 from PIL import Image
 
+from app.domain.entities.design import Design
+from app.infrastructure.rendering.timings import StageTimer
+from app.infrastructure.rendering.variants import VariantSpec, derive_variants, encode_variant
+from app.infrastructure.storage.local_storage import LocalStorageRepository
 from app.infrastructure.workers.tasks.render_design import (
-    _create_thumbnail,
+    _draw_design,
     _is_light_color,
-    _render_image,
+    _render_and_store,
 )
 
+PREVIEW = VariantSpec(name="preview", size=600)
+THUMBNAIL = VariantSpec(name="thumbnail", size=200)
+
 
 class TestRenderImage:
-    """Tests for _render_image function."""
+    """Tests for drawing a design and encoding its preview variant."""
+
+    @staticmethod
+    def _render_preview(design_data: dict, product_type: str) -> Image.Image:
+        """Draw the design and decode its 600px PNG preview."""
+        image = _draw_design(design_data, product_type)
+        return Image.open(encode_variant(image, PREVIEW).buffer)
 
     def test_render_image_creates_valid_png(self):
-        """Test that _render_image creates a valid PNG image."""
+        """Test that the encoded preview is a valid PNG image."""
         design_data = {"text": "Test Design", "font": "Bebas-Bold", "color": "#FF0000"}
 
-        buffer = _render_image(design_data, "t-shirt")
-
-        # Verify it's a valid image
-        assert buffer is not None
-        buffer.seek(0)
-        image = Image.open(buffer)
+        image = self._render_preview(design_data, "t-shirt")
 
         assert image.format == "PNG"
         assert image.size == (600, 600)
@@ -33,9 +39,7 @@ class TestRenderImage:
         """Test rendering with red color."""
         design_data = {"text": "Red Text", "font": "Bebas-Bold", "color": "#FF0000"}
 
-        buffer = _render_image(design_data, "mug")
-        buffer.seek(0)
-        image = Image.open(buffer)
+        image = self._render_preview(design_data, "mug")
 
         # Check that background is red
         pixel = image.getpixel((10, 10))
@@ -47,9 +51,7 @@ class TestRenderImage:
         """Test rendering with blue color."""
         design_data = {"text": "Blue Background", "font": "Montserrat-Bold", "color": "#0000FF"}
 
-        buffer = _render_image(design_data, "poster")
-        buffer.seek(0)
-        image = Image.open(buffer)
+        image = self._render_preview(design_data, "poster")
 
         pixel = image.getpixel((10, 10))
         assert pixel[2] == 255  # Blue channel maxed
@@ -61,11 +63,7 @@ class TestRenderImage:
         for font in fonts:
             design_data = {"text": f"Font {font}", "font": font, "color": "#00FF00"}
 
-            buffer = _render_image(design_data, "hoodie")
-            assert buffer is not None
-
-            buffer.seek(0)
-            image = Image.open(buffer)
+            image = self._render_preview(design_data, "hoodie")
             assert image.format == "PNG"
 
     def test_render_image_with_long_text(self):
@@ -76,74 +74,121 @@ class TestRenderImage:
             "color": "#FFFF00",
         }
 
-        buffer = _render_image(design_data, "tote-bag")
+        image = self._render_preview(design_data, "tote-bag")
 
-        buffer.seek(0)
-        image = Image.open(buffer)
-        assert image is not None
         assert image.size == (600, 600)
 
     def test_render_image_with_special_characters(self):
         """Test rendering with special characters."""
         design_data = {"text": "Hello! @#$% & World", "font": "Bebas-Bold", "color": "#FF00FF"}
 
-        buffer = _render_image(design_data, "t-shirt")
+        image = self._render_preview(design_data, "t-shirt")
+
+        assert image.format == "PNG"
+
+
+class TestDrawDesign:
+    """Tests for _draw_design function."""
+
+    def test_returns_unencoded_raster(self):
+        """Test that drawing returns an in-memory RGB image."""
+        design_data = {"text": "Raster", "font": "Bebas-Bold", "color": "#FF0000"}
+
+        image = _draw_design(design_data, "t-shirt")
+
+        assert isinstance(image, Image.Image)
+        assert image.mode == "RGB"
+        assert image.size == (600, 600)
+
+    def test_custom_raster_size(self):
+        """Test drawing at retina size."""
+        design_data = {"text": "Retina", "font": "Roboto-Regular", "color": "#0000FF"}
+
+        image = _draw_design(design_data, "poster", size=1200)
 
-        buffer.seek(0)
-        image = Image.open(buffer)
-        assert image is not None
+        assert image.size == (1200, 1200)
+        assert image.getpixel((10, 10)) == (0, 0, 255)
+
+
+class TestRenderAndStore:
+    """Tests for the overlapped encode-and-upload stage."""
+
+    def test_uploads_every_variant_and_records_timings(self, tmp_path):
+        """Test that all variants are stored and each stage is timed."""
+        storage = LocalStorageRepository(base_path=str(tmp_path))
+        design = Design.create("user-1", "t-shirt", {"text": "Hi", "font": "Bebas-Bold", "color": "#FF0000"})
+        timer = StageTimer()
+
+        variant_urls, fingerprint, deduplicated = _render_and_store(design, storage, timer)
+
+        assert deduplicated is False
+        assert set(variant_urls) == {"preview", "thumbnail"}
+        assert storage.path_for(f"renders/{fingerprint}/thumbnail-s200.png").is_file()
+        assert {"dedupe_check", "draw", "encode", "upload", "upload_wait", "render_store"} <= set(
+            timer.seconds()
+        )
+
+    def test_partial_render_keeps_existing_assets(self, tmp_path, monkeypatch):
+        """Test that only missing variants are uploaded; existing keys are never rewritten."""
+        storage = LocalStorageRepository(base_path=str(tmp_path))
+        design = Design.create("user-1", "t-shirt", {"text": "Hi", "font": "Bebas-Bold", "color": "#FF0000"})
+        _, fingerprint, _ = _render_and_store(design, storage)
+        storage.path_for(f"renders/{fingerprint}/thumbnail-s200.png").unlink()
+        uploaded = []
+        upload_asset = storage.upload_asset
+        monkeypatch.setattr(
+            storage, "upload_asset", lambda key, *args: uploaded.append(key) or upload_asset(key, *args)
+        )
+
+        variant_urls, _, deduplicated = _render_and_store(design, storage)
+
+        assert deduplicated is False
+        assert set(variant_urls) == {"preview", "thumbnail"}
+        assert uploaded == [f"renders/{fingerprint}/thumbnail-s200.png"]
+
+    def test_upload_error_is_raised(self, tmp_path, monkeypatch):
+        """Test that a failed background upload fails the render."""
+        storage = LocalStorageRepository(base_path=str(tmp_path))
+        design = Design.create("user-1", "t-shirt", {"text": "Hi", "font": "Bebas-Bold", "color": "#FF0000"})
+
+        def broken_upload(key, data, content_type="image/png"):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(storage, "upload_asset", broken_upload)
+
+        with pytest.raises(OSError):
+            _render_and_store(design, storage)
 
 
 class TestCreateThumbnail:
-    """Tests for _create_thumbnail function."""
+    """Tests for deriving the thumbnail variant from the raster."""
 
     def test_create_thumbnail_reduces_size(self):
         """Test that thumbnail is smaller than original."""
-        # Create test image (600x600)
         original = Image.new("RGB", (600, 600), color="red")
-        original_buffer = BytesIO()
-        original.save(original_buffer, format="PNG")
-        original_buffer.seek(0)
 
-        # Create thumbnail (200x200)
-        thumbnail_buffer = _create_thumbnail(original_buffer, size=(200, 200))
+        thumbnail = encode_variant(original, THUMBNAIL)
 
-        # Verify size
-        thumbnail_buffer.seek(0)
-        thumbnail = Image.open(thumbnail_buffer)
-
-        assert thumbnail.size[0] <= 200
-        assert thumbnail.size[1] <= 200
+        assert thumbnail.dimensions[0] <= 200
+        assert thumbnail.dimensions[1] <= 200
 
     def test_create_thumbnail_maintains_aspect_ratio(self):
         """Test that thumbnail maintains aspect ratio."""
-        # Create rectangular image
         original = Image.new("RGB", (800, 400), color="blue")
-        original_buffer = BytesIO()
-        original.save(original_buffer, format="PNG")
-        original_buffer.seek(0)
-
-        thumbnail_buffer = _create_thumbnail(original_buffer, size=(200, 200))
 
-        thumbnail_buffer.seek(0)
-        thumbnail = Image.open(thumbnail_buffer)
+        thumbnail = encode_variant(original, THUMBNAIL)
 
         # Aspect ratio should be maintained (2:1)
-        assert thumbnail.size[0] / thumbnail.size[1] == pytest.approx(2.0, rel=0.1)
+        assert thumbnail.dimensions[0] / thumbnail.dimensions[1] == pytest.approx(2.0, rel=0.1)
 
     def test_create_thumbnail_is_valid_png(self):
-        """Test that thumbnail is a valid PNG."""
+        """Test that every variant derived from one raster is a valid PNG."""
         original = Image.new("RGB", (600, 600), color="green")
-        original_buffer = BytesIO()
-        original.save(original_buffer, format="PNG")
-        original_buffer.seek(0)
-
-        thumbnail_buffer = _create_thumbnail(original_buffer)
 
-        thumbnail_buffer.seek(0)
-        thumbnail = Image.open(thumbnail_buffer)
+        variants = list(derive_variants(original, [PREVIEW, THUMBNAIL]))
 
-        assert thumbnail.format == "PNG"
+        assert [Image.open(v.buffer).format for v in variants] == ["PNG", "PNG"]
+        assert [v.dimensions for v in variants] == [(600, 600), (200, 200)]
 
 
 class TestIsLightColor:
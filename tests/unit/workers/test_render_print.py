@@ -0,0 +1,51 @@
+"""Unit tests for print-resolution rendering."""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from app.config import settings
+from app.infrastructure.rendering.timings import StageTimer
+from app.infrastructure.workers.tasks.render_print import _write_print_png, print_dimensions
+
+
+class TestPrintDimensions:
+    """Tests for print_dimensions."""
+
+    def test_poster_at_configured_dpi(self, monkeypatch):
+        """Test that inches are converted to pixels at PRINT_DPI."""
+        monkeypatch.setattr(settings, "PRINT_DPI", 300)
+
+        assert print_dimensions("poster") == (5400, 7200)
+
+    def test_unknown_product_type(self):
+        """Test that products without a print size are rejected."""
+        with pytest.raises(ValueError, match="No print size"):
+            print_dimensions("mug")
+
+
+class TestWritePrintPng:
+    """Tests for _write_print_png."""
+
+    def test_streams_valid_png(self, monkeypatch):
+        """Test that a tiled print render decodes as the expected image."""
+        monkeypatch.setattr(settings, "PRINT_TILE_HEIGHT", 64)
+        stream = BytesIO()
+        timer = StageTimer()
+
+        _write_print_png(
+            {"text": "POSTER", "font": "Bebas-Bold", "color": "#0000FF", "fontSize": 48},
+            1200,
+            1600,
+            stream,
+            timer,
+        )
+
+        stream.seek(0)
+        with Image.open(stream) as image:
+            image.load()
+            assert image.size == (1200, 1600)
+            assert image.getpixel((0, 0)) == (0, 0, 255)
+            assert image.getpixel((0, 1599)) == (0, 0, 255)
+        assert {"draw", "encode"} <= set(timer.seconds())
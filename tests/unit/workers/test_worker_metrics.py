@@ -0,0 +1,42 @@
+"""Unit tests for worker Prometheus metrics."""
+
+from prometheus_client import REGISTRY
+
+from app.infrastructure.rendering.timings import StageTimer
+from app.infrastructure.workers.metrics import record_render_timings
+
+
+def _sample(name: str, labels: dict) -> float:
+    """Read a metric sample from the default registry (0 if not observed yet)."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestRecordRenderTimings:
+    """Tests for record_render_timings."""
+
+    def test_observes_stage_and_task_histograms(self):
+        """Test that every stage and the task total are exported."""
+        labels = {"task": "test_task", "stage": "draw"}
+        before = _sample("customify_render_stage_duration_seconds_count", labels)
+        before_total = _sample(
+            "customify_render_task_duration_seconds_count", {"task": "test_task", "status": "success"}
+        )
+        timer = StageTimer()
+        timer.add("draw", 0.02)
+
+        record_render_timings("test_task", timer, "success")
+
+        assert _sample("customify_render_stage_duration_seconds_count", labels) == before + 1
+        assert _sample(
+            "customify_render_task_duration_seconds_count", {"task": "test_task", "status": "success"}
+        ) == before_total + 1
+
+    def test_returns_milliseconds_with_total(self):
+        """Test that the result-friendly dict includes the task total."""
+        timer = StageTimer()
+        timer.add("encode", 0.005)
+
+        timings = record_render_timings("test_task", timer, "success")
+
+        assert timings["encode"] == 5.0
+        assert timings["total"] >= 0